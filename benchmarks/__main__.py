@@ -0,0 +1,94 @@
+"""
+Run the benchmark suite against the test settings.
+
+Usage:
+    python -m benchmarks [-k PATTERN] [--save FILE] [--compare FILE]
+
+Timings are the best per-call time over several repeats. Baselines saved with
+``--save`` can be compared against later runs with ``--compare``.
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+
+def setup():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
+
+    import django
+    from django.db import connection
+
+    django.setup()
+    connection.creation.create_test_db(verbosity=0)
+
+
+def run_case(func, number, db, repeat):
+    from django.db import transaction
+
+    if not db:
+        return min(timeit.repeat(func(), number=number, repeat=repeat)) / number
+
+    timings = []
+    with transaction.atomic():
+        call = func()
+        for _ in range(repeat):
+            timing = 0
+            for _ in range(number):
+                sid = transaction.savepoint()
+                timing += timeit.timeit(call, number=1)
+                transaction.savepoint_rollback(sid)
+            timings.append(timing)
+        transaction.set_rollback(True)
+    return min(timings) / number
+
+
+def report(results, baseline=None, threshold=0.1):
+    regressions = 0
+    for name, timing in results.items():
+        line = f'{name:<40} {timing * 1e3:10.4f} ms'
+        if baseline and name in baseline:
+            ratio = timing / baseline[name]
+            flag = ''
+            if ratio > 1 + threshold:
+                flag, regressions = '  (slower)', regressions + 1
+            elif ratio < 1 - threshold:
+                flag = '  (faster)'
+            line += f' {baseline[name] * 1e3:10.4f} ms {ratio:6.2f}x{flag}'
+        print(line)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the jsonfield benchmark suite.')
+    parser.add_argument('-k', dest='pattern', help='Only run cases containing this substring.')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of repeats per case (default: 5).')
+    parser.add_argument('--save', metavar='FILE', help='Save the results as a baseline.')
+    parser.add_argument('--compare', metavar='FILE', help='Compare the results against a baseline.')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Relative change to report (default: 0.1).')
+    args = parser.parse_args(argv)
+
+    setup()
+    from .cases import CASES
+
+    results = {}
+    for name, (func, number, db) in CASES.items():
+        if args.pattern is None or args.pattern in name:
+            results[name] = run_case(func, number, db, args.repeat)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    regressions = report(results, baseline, args.threshold)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2)
+            f.write('\n')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+import json
+
+from django import forms
+from django.db import connection
+
+from jsonfield.encoder import JSONEncoder
+from jsonfield.json import load_paths
+from tests.models import FrozenJSONModel, JSONModel, JSONModelCustomEncoders, JSONNotRequiredModel
+
+from .documents import DOCUMENTS, TYPED_DOCUMENTS
+
+
+CASES = {}
+
+
+def case(name, number=100, db=False):
+    """
+    Register a benchmark case.
+
+    The decorated function performs any setup, and returns the callable to be
+    timed. If ``db`` is set, each call is rolled back after being timed.
+    """
+    def decorator(func):
+        CASES[name] = (func, number, db)
+        return func
+    return decorator
+
+
+class JSONForm(forms.ModelForm):
+    class Meta:
+        model = JSONNotRequiredModel
+        fields = '__all__'
+
+
+for doc_name, make_document in TYPED_DOCUMENTS.items():
+    @case(f'encoder.default[{doc_name}]')
+    def encoder_default(make_document=make_document):
+        document = make_document()
+        return lambda: json.dumps(document, cls=JSONEncoder)
+
+
+for doc_name, make_document in DOCUMENTS.items():
+    @case(f'field.get_prep_value[{doc_name}]', number=1000 if doc_name == 'small' else 100)
+    def get_prep_value(make_document=make_document):
+        field, document = JSONModel._meta.get_field('json'), make_document()
+        return lambda: field.get_prep_value(document)
+
+    @case(f'field.from_db_value[{doc_name}]', number=1000 if doc_name == 'small' else 100)
+    def from_db_value(make_document=make_document):
+        field = JSONModel._meta.get_field('json')
+        value = field.get_prep_value(make_document())
+        return lambda: field.from_db_value(value, None, connection)
+
+    @case(f'form.round_trip[{doc_name}]')
+    def form_round_trip(make_document=make_document):
+        data = {'json': json.dumps(make_document())}
+
+        def run():
+            form = JSONForm(data=data)
+            form['json'].value()
+            form.is_valid()
+            form.has_changed()
+        return run
+
+
+for doc_name in ['small', 'deep']:
+    @case(f'field.from_db_value[{doc_name}, frozen cache]', number=1000)
+    def from_db_value_cached(make_document=DOCUMENTS[doc_name]):
+        # Compare to `field.from_db_value`, as cache hits share the frozen value.
+        field = FrozenJSONModel._meta.get_field('json')
+        value = field.get_prep_value(make_document())
+        field.from_db_value(value, None, connection)
+        return lambda: field.from_db_value(value, None, connection)
+
+
+for position, key in [('first', 'key0'), ('last', 'key999'), ('missing', 'missing')]:
+    @case(f'json.load_paths[wide, {position}]')
+    def load_paths_wide(key=key):
+        value = json.dumps({f'key{i}': {'id': i, 'name': f'item {i}', 'tags': ['a', 'b']} for i in range(1000)})
+        return lambda: load_paths(value, [key])
+
+
+@case('field.custom_encoders', number=1000)
+def custom_encoders():
+    field, value = JSONModelCustomEncoders._meta.get_field('json'), [1 + 2j, 3 - 4j] * 10
+
+    def run():
+        field.from_db_value(field.get_prep_value(value), None, connection)
+    return run
+
+
+@case('queryset.bulk_create[large]', number=10, db=True)
+def bulk_create():
+    document = DOCUMENTS['large']()
+    return lambda: JSONModel.objects.bulk_create(JSONModel(json=document) for _ in range(100))
+
+
+@case('queryset.iterate[large]', number=10, db=True)
+def iterate():
+    document = DOCUMENTS['large']()
+    JSONModel.objects.bulk_create(JSONModel(json=document) for _ in range(100))
+    return lambda: list(JSONModel.objects.all())
+
+
+@case('form.render[large]', number=10)
+def form_render():
+    instance = JSONNotRequiredModel(json=DOCUMENTS['large']())
+    return lambda: str(JSONForm(instance=instance))
@@ -0,0 +1,51 @@
+import datetime
+import decimal
+import uuid
+
+
+NOW = datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+
+
+def small():
+    return {'id': 1, 'name': 'example', 'tags': ['a', 'b'], 'active': True}
+
+
+def large():
+    return {
+        'items': [
+            {'id': i, 'name': f'item {i}', 'price': i * 1.5, 'tags': ['a', 'b', 'c'], 'meta': {'x': i, 'y': None}}
+            for i in range(1000)
+        ],
+    }
+
+
+def deep(depth=50):
+    value = {'leaf': [1, 2, 3]}
+    for i in range(depth):
+        value = {'level': i, 'child': value}
+    return value
+
+
+def datetimes():
+    return [{'created': NOW, 'day': NOW.date(), 'elapsed': datetime.timedelta(seconds=i)} for i in range(1000)]
+
+
+def decimals():
+    return [{'price': decimal.Decimal(i) / 100, 'tax': decimal.Decimal('0.2')} for i in range(1000)]
+
+
+def uuids():
+    return [uuid.UUID(int=i) for i in range(1000)]
+
+
+DOCUMENTS = {
+    'small': small,
+    'large': large,
+    'deep': deep,
+}
+
+TYPED_DOCUMENTS = {
+    'datetimes': datetimes,
+    'decimals': decimals,
+    'uuids': uuids,
+}
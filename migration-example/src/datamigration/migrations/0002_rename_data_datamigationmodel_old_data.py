@@ -3,21 +3,6 @@
 from django.db import migrations, models
 
 
-def forward_data(apps, schema_editor):
-    DataMigrationModel = apps.get_model('datamigration', 'DataMigrationModel')
-    for obj in DataMigrationModel.objects.all():
-        obj.data = obj.old_data
-        obj.save()
-
-
-
-def backward_data(apps, schema_editor):
-    DataMigrationModel = apps.get_model('datamigration', 'DataMigrationModel')
-    for obj in DataMigrationModel.objects.all():
-        obj.old_data = obj.data
-        obj.save()
-
-
 class Migration(migrations.Migration):
 
     dependencies = [
@@ -35,14 +20,4 @@ class Migration(migrations.Migration):
             name='data',
             field=models.JSONField(null=True),
         ),
-        migrations.RunPython(forward_data, backward_data),
-        migrations.RemoveField(
-            model_name='DataMigrationModel',
-            name='old_data',
-        ),
-        migrations.AlterField(
-            model_name='DataMigrationModel',
-            name='data',
-            field=models.JSONField(),
-        ),
     ]
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+from jsonfield.operations import CopyJSONData
+
+
+class Migration(migrations.Migration):
+    # Copied chunks are committed, so that an interrupted copy may be resumed. The
+    # schema changes are kept in separate (atomic) migrations, so that re-running
+    # the migration only resumes the copy.
+    atomic = False
+
+    dependencies = [
+        ('datamigration', '0002_rename_data_datamigationmodel_old_data'),
+    ]
+
+    operations = [
+        CopyJSONData('DataMigrationModel', 'old_data', 'data'),
+    ]
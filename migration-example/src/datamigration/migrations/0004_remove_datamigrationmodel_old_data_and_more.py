@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('datamigration', '0003_copy_data'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='DataMigrationModel',
+            name='old_data',
+        ),
+        migrations.AlterField(
+            model_name='DataMigrationModel',
+            name='data',
+            field=models.JSONField(),
+        ),
+    ]
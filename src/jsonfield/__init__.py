@@ -1,4 +1,4 @@
-from .fields import JSONCharField, JSONField
+from .fields import JSONBinaryField, JSONCharField, JSONField, save_changed_json
 
 
-__all__ = ['JSONCharField', 'JSONField']
+__all__ = ['JSONBinaryField', 'JSONCharField', 'JSONField', 'save_changed_json']
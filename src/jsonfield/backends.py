@@ -0,0 +1,269 @@
+import functools
+import json
+import math
+import re
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+from .encoder import JSONEncoder
+from .json import checked_loads
+
+
+# Integer literals that may exceed the 64-bit range of faster JSON libraries.
+WIDE_INTEGER = re.compile(r'\d{19}')
+
+
+def has_nonfinite(value):
+    """Return whether a value contains NaN or infinite floats (in lists, tuples, or dict values)."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(map(has_nonfinite, value.values()))
+    if isinstance(value, (list, tuple)):
+        return any(map(has_nonfinite, value))
+    return False
+
+
+class JSONBackend:
+    """
+    Encodes and decodes JSON using the standard library.
+
+    Backends accept the same ``dump_kwargs`` and ``load_kwargs`` as the
+    ``json`` module. Alternative backends should fall back to this
+    implementation for any arguments they cannot faithfully support.
+    """
+    name = 'json'
+
+    def __init__(self):
+        self._encoders = {}
+        self._decoders = {}
+
+    def __deepcopy__(self, memo):
+        # Backends are stateless and shared between fields.
+        return self
+
+    def __reduce__(self):
+        # Allow backends to be sent to worker processes.
+        return (self.__class__, ())
+
+    def dumps(self, value, **kwargs):
+        return self.get_encoder(**kwargs)(value)
+
+    def loads(self, value, **kwargs):
+        return self.get_decoder(**kwargs)(value)
+
+    def get_encoder(self, **kwargs):
+        """
+        Return a function that encodes values with the given kwargs.
+
+        Encoders are built once per configuration, and are shared between callers.
+        """
+        return self._get_cached(self._encoders, self.build_encoder, kwargs)
+
+    def get_decoder(self, **kwargs):
+        """
+        Return a function that decodes values with the given kwargs.
+
+        Decoders are built once per configuration, and are shared between callers.
+        """
+        return self._get_cached(self._decoders, self.build_decoder, kwargs)
+
+    def build_encoder(self, cls=json.JSONEncoder, **kwargs):
+        return cls(**kwargs).encode
+
+    def build_decoder(self, cls=json.JSONDecoder, **kwargs):
+        return cls(**kwargs).decode
+
+    def _get_cached(self, cache, build, kwargs):
+        try:
+            key = tuple(sorted(kwargs.items()))
+            return cache[key]
+        except TypeError:
+            # Unhashable kwargs (e.g., a list) can't be shared.
+            return build(**kwargs)
+        except KeyError:
+            return cache.setdefault(key, build(**kwargs))
+
+    def dumps_many(self, values, **kwargs):
+        encode = self.get_encoder(**kwargs)
+        return [encode(value) for value in values]
+
+    def loads_many(self, values, **kwargs):
+        """
+        Decode a list of values, as per ``checked_loads``.
+
+        Errors are returned in place of invalid values, instead of being raised.
+        """
+        decode = self.get_decoder(**kwargs)
+        results = []
+        for value in values:
+            try:
+                results.append(checked_loads(value, decode))
+            except json.JSONDecodeError as e:
+                results.append(e)
+        return results
+
+
+class ORJSONBackend(JSONBackend):
+    """
+    Encodes and decodes JSON using ``orjson``.
+
+    Date/time types are passed through to ``JSONEncoder.default``, so encoded
+    values follow the same type rules as the standard library backend. Output
+    is compact.
+
+    Values that ``orjson`` can't represent faithfully fall back to the standard
+    library: integers outside of the 64-bit range, NaN/Infinity (which ``orjson``
+    encodes as null), and non-ASCII output when ``ensure_ascii`` is set.
+    """
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+
+        super().__init__()
+        self.orjson = orjson
+        self.default = self.checked_default
+        self.option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    @staticmethod
+    def checked_default(obj, default=JSONEncoder().default):
+        value = default(obj)
+        if has_nonfinite(value):
+            raise TypeError('Non-finite floats are encoded by the standard library.')
+        return value
+
+    def get_option(self, cls=JSONEncoder, indent=None, sort_keys=False, ensure_ascii=True):
+        """Return the ``orjson`` option flags, or ``None`` if the kwargs are unsupported."""
+        if cls is not JSONEncoder or indent not in (None, 2):
+            return None
+
+        option = self.option
+        if indent:
+            option |= self.orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= self.orjson.OPT_SORT_KEYS
+        return option
+
+    def build_encoder(self, **kwargs):
+        fallback = super().build_encoder(**kwargs)
+        try:
+            option = self.get_option(**kwargs)
+        except TypeError:
+            option = None
+        if option is None:
+            return fallback
+
+        dumps, default = self.orjson.dumps, self.default
+        ensure_ascii = kwargs.get('ensure_ascii', True)
+
+        def encode(value):
+            try:
+                text = dumps(value, default=default, option=option).decode()
+            except TypeError:
+                # e.g., integers exceeding 64 bits. Genuinely unserializable
+                # values will raise again from the standard library.
+                return fallback(value)
+            # NaN/Infinity would have been encoded as null.
+            if ensure_ascii and not text.isascii() or 'null' in text and has_nonfinite(value):
+                return fallback(value)
+            return text
+        return encode
+
+    def build_decoder(self, **kwargs):
+        fallback = super().build_decoder(**kwargs)
+        if kwargs:
+            return fallback
+
+        loads, error = self.orjson.loads, self.orjson.JSONDecodeError
+
+        def decode(value):
+            # Wider integers would be decoded as floats.
+            if WIDE_INTEGER.search(value):
+                return fallback(value)
+            try:
+                return loads(value)
+            except error:
+                # Let the standard library raise a consistent error.
+                return fallback(value)
+        return decode
+
+
+class UJSONBackend(JSONBackend):
+    """
+    Encodes and decodes JSON using ``ujson``.
+
+    Follows the same type rules as the standard library backend via the
+    ``default`` hook. Output is compact.
+    """
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+
+        super().__init__()
+        self.ujson = ujson
+        self.default = JSONEncoder().default
+
+    def build_encoder(self, cls=JSONEncoder, **kwargs):
+        fallback = super().build_encoder(cls=cls, **kwargs)
+        if cls is not JSONEncoder or not set(kwargs) <= {'indent', 'sort_keys', 'ensure_ascii'}:
+            return fallback
+
+        dumps = functools.partial(self.ujson.dumps, default=self.default, escape_forward_slashes=False, **kwargs)
+
+        def encode(value):
+            try:
+                return dumps(value)
+            except (TypeError, OverflowError):
+                return fallback(value)
+        return encode
+
+    def build_decoder(self, **kwargs):
+        fallback = super().build_decoder(**kwargs)
+        if kwargs:
+            return fallback
+
+        loads = self.ujson.loads
+
+        def decode(value):
+            try:
+                return loads(value)
+            except ValueError:
+                return fallback(value)
+        return decode
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in [JSONBackend, ORJSONBackend, UJSONBackend]
+}
+
+_instances = {}
+
+
+def get_backend(backend=None):
+    """
+    Return a backend instance by name or dotted import path.
+
+    If no backend is provided, the ``JSONFIELD_BACKEND`` setting is used,
+    defaulting to the standard library.
+    """
+    if isinstance(backend, JSONBackend):
+        return backend
+    if backend is None:
+        backend = getattr(settings, 'JSONFIELD_BACKEND', JSONBackend.name)
+
+    try:
+        return _instances[backend]
+    except KeyError:
+        pass
+
+    try:
+        backend_cls = BACKENDS[backend] if backend in BACKENDS else import_string(backend)
+        instance = _instances[backend] = backend_cls()
+    except ImportError as e:
+        raise ImproperlyConfigured(f"JSON backend '{backend}' could not be loaded: {e}") from e
+    return instance
@@ -0,0 +1,43 @@
+import functools
+
+from django.core.exceptions import ImproperlyConfigured
+
+from .encoder import JSONEncoder
+
+
+class MsgPackFormat:
+    """
+    Encodes and decodes values as MessagePack, using ``msgpack``.
+
+    Unsupported types are passed to ``JSONEncoder.default``, and bytes are
+    packed as strings, so that decoded values follow the same type rules as
+    JSON text. Unlike JSON, non-string keys are not converted to strings, and
+    integers must fit within 64 bits.
+    """
+    name = 'msgpack'
+
+    def __init__(self):
+        import msgpack
+
+        self.dumps = functools.partial(msgpack.packb, default=JSONEncoder().default, use_bin_type=False)
+        self.loads = functools.partial(msgpack.unpackb, raw=False, strict_map_key=False)
+
+
+FORMATS = {fmt.name: fmt for fmt in [MsgPackFormat]}
+
+_instances = {}
+
+
+def get_format(name):
+    try:
+        return _instances[name]
+    except KeyError:
+        pass
+
+    if name not in FORMATS:
+        raise ImproperlyConfigured(f"Unknown binary format '{name}'. Choices are: {', '.join(FORMATS)}.")
+    try:
+        fmt = _instances[name] = FORMATS[name]()
+    except ImportError as e:
+        raise ImproperlyConfigured(f"Binary format '{name}' is not available: {e}") from e
+    return fmt
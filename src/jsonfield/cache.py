@@ -0,0 +1,71 @@
+import copy
+import threading
+from collections import OrderedDict, namedtuple
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'bypassed', 'maxsize', 'currsize'])
+
+# Copying a decoded value in Python is slower than decoding its text in C,
+# except for tiny texts, so longer mutable values aren't worth caching.
+COPY_MAX_LENGTH = 32
+
+
+def copy_json(value):
+    """Deep copy a decoded JSON value, sharing its immutable leaves."""
+    if type(value) is dict:
+        return {key: copy_json(item) for key, item in value.items()}
+    if type(value) is list:
+        return [copy_json(item) for item in value]
+    if isinstance(value, (str, int, float, type(None))):
+        return value
+    return copy.deepcopy(value)
+
+
+class LoadCache:
+    """
+    A bounded LRU cache of decoded values, keyed by their JSON text.
+
+    Texts longer than ``max_length`` bypass the cache. As decoded values are
+    mutable, callers receive a copy of the cached value.
+    """
+
+    def __init__(self, maxsize=128, max_length=4096, copy=copy_json):
+        self.maxsize = maxsize
+        self.max_length = max_length
+        self.copy = copy
+        self.hits = self.misses = self.bypassed = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def load(self, value, loads):
+        """Return the decoded ``value``, using ``loads`` on a cache miss."""
+        if len(value) > self.max_length:
+            self.bypassed += 1
+            return loads(value)
+
+        with self._lock:
+            try:
+                result = self._cache[value]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._cache.move_to_end(value)
+                self.hits += 1
+                return self.copy(result)
+
+        # Errors propagate, so invalid JSON is never cached.
+        result = loads(value)
+        with self._lock:
+            self._cache[value] = result
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return self.copy(result)
+
+    def cache_info(self):
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.bypassed, self.maxsize, len(self._cache))
+
+    def cache_clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = self.bypassed = 0
@@ -0,0 +1,132 @@
+import base64
+import json
+import threading
+from collections import namedtuple
+
+from django.core.exceptions import ImproperlyConfigured
+
+
+CompressionStats = namedtuple('CompressionStats', ['compressed', 'incompressible', 'bytes_in', 'bytes_out'])
+
+
+class ZlibCodec:
+    name = 'zlib'
+
+    def __init__(self):
+        import zlib
+
+        self.compress = zlib.compress
+        self.decompress = zlib.decompress
+        self.error = zlib.error
+
+
+class ZstdCodec:
+    name = 'zstd'
+
+    def __init__(self):
+        try:
+            # Python 3.14+
+            from compression import zstd
+        except ImportError:
+            import zstandard
+
+            self.compress = zstandard.ZstdCompressor().compress
+            self.decompress = zstandard.ZstdDecompressor().decompress
+            self.error = zstandard.ZstdError
+        else:
+            self.compress = zstd.compress
+            self.decompress = zstd.decompress
+            self.error = zstd.ZstdError
+
+
+CODECS = {codec.name: codec for codec in [ZlibCodec, ZstdCodec]}
+
+_instances = {}
+
+
+def get_codec(name):
+    try:
+        return _instances[name]
+    except KeyError:
+        pass
+
+    if name not in CODECS:
+        raise ImproperlyConfigured(f"Unknown compression '{name}'. Choices are: {', '.join(CODECS)}.")
+    try:
+        codec = _instances[name] = CODECS[name]()
+    except ImportError as e:
+        raise ImproperlyConfigured(f"Compression '{name}' is not available: {e}") from e
+    return codec
+
+
+def prefix(name):
+    # Compressed text is prefixed with the codec name, which cannot be
+    # confused with the start of a JSON document.
+    return f'{name}:'
+
+
+def is_compressed(text):
+    return text.startswith(tuple(prefix(name) for name in CODECS))
+
+
+def decompress(text):
+    """
+    Return the JSON text of a (possibly) compressed database value.
+
+    Corrupt or truncated data raises a ``json.JSONDecodeError``, so that it's
+    handled in the same way as invalid JSON text.
+    """
+    if not is_compressed(text):
+        return text
+
+    name, _, data = text.partition(':')
+    codec = get_codec(name)
+    try:
+        return codec.decompress(base64.b64decode(data, validate=True)).decode()
+    except (ValueError, codec.error) as e:
+        # Includes `binascii.Error` and `UnicodeDecodeError`.
+        raise json.JSONDecodeError(f'Invalid {name} data ({e})', text, len(prefix(name))) from e
+
+
+class Compressor:
+    """
+    Compresses JSON text of at least ``threshold`` characters.
+
+    The compressed data is base64 encoded, so that it can be stored in text
+    columns. Text is stored uncompressed if compression would not reduce its
+    size.
+    """
+
+    def __init__(self, name, threshold=1024):
+        self.codec = get_codec(name)
+        self.prefix = prefix(name)
+        self.threshold = threshold
+        self.compressed = self.incompressible = self.bytes_in = self.bytes_out = 0
+        self._lock = threading.Lock()
+
+    def compress(self, text):
+        if len(text) < self.threshold:
+            return text
+
+        data = text.encode()
+        compressed = self.prefix + base64.b64encode(self.codec.compress(data)).decode('ascii')
+        if len(compressed) >= len(text):
+            with self._lock:
+                self.incompressible += 1
+            return text
+
+        with self._lock:
+            self.compressed += 1
+            self.bytes_in += len(data)
+            self.bytes_out += len(compressed)
+        return compressed
+
+    def stats(self):
+        with self._lock:
+            return CompressionStats(self.compressed, self.incompressible, self.bytes_in, self.bytes_out)
+
+    @property
+    def ratio(self):
+        """The ratio of compressed to original size, for compressed values."""
+        stats = self.stats()
+        return stats.bytes_out / stats.bytes_in if stats.bytes_in else None
@@ -0,0 +1,51 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+
+_executor = None
+_lock = threading.Lock()
+
+
+def get_executor():
+    """
+    Return the executor shared by async field operations.
+
+    The ``JSONFIELD_EXECUTOR`` setting may provide a dotted path to a callable
+    that returns a ``concurrent.futures`` executor, defaulting to a thread pool.
+    """
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            factory = getattr(settings, 'JSONFIELD_EXECUTOR', None)
+            _executor = import_string(factory)() if factory else ThreadPoolExecutor(thread_name_prefix='jsonfield')
+        return _executor
+
+
+def reset_executor():
+    """Shut down the shared executor, which is recreated on next use (e.g., after a settings change)."""
+    global _executor
+
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+async def run_in_executor(func, *args):
+    """Run ``func(*args)`` in the shared executor, without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args))
+
+
+@receiver(setting_changed)
+def executor_setting_changed(*, setting, **kwargs):
+    if setting == 'JSONFIELD_EXECUTOR':
+        reset_executor()
@@ -8,52 +8,137 @@ from django.utils import timezone
 from django.utils.encoding import force_str
 from django.utils.functional import Promise
 
+from . import metrics
+
+
+def encode_datetime(obj):
+    # For Date Time string spec, see ECMA 262
+    # https://ecma-international.org/ecma-262/5.1/#sec-15.9.1.15
+    representation = obj.isoformat()
+    if representation.endswith('+00:00'):
+        representation = representation[:-6] + 'Z'
+    return representation
+
+
+def encode_time(obj):
+    if timezone.is_aware(obj):
+        raise ValueError("JSON can't represent timezone-aware times.")
+    return obj.isoformat()
+
+
+def encode_timedelta(obj):
+    return str(obj.total_seconds())
+
+
+def encode_mapping(obj):
+    try:
+        return dict(obj)
+    except Exception:
+        return unsupported(obj)
+
+
+def canonicalize(obj):
+    """
+    Normalize numbers and keys, so that equal values have a single encoding.
+
+    Integral floats are converted to integers (e.g., ``1.0`` and ``-0.0``), and
+    non-string keys are converted to their JSON string representation.
+    """
+    if isinstance(obj, float):
+        return int(obj) if obj.is_integer() and abs(obj) <= MAX_SAFE_INTEGER else obj
+    if isinstance(obj, dict):
+        return {canonical_key(key): canonicalize(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [canonicalize(value) for value in obj]
+    return obj
+
+
+def canonical_key(key):
+    if isinstance(key, str) or not isinstance(key, (int, float, type(None))):
+        return key
+    return json.dumps(canonicalize(key))
+
+
+def unsupported(obj):
+    raise TypeError(f'Object of type {obj.__class__.__name__} is not JSON serializable')
+
+
+# Integers that can be exactly represented as a float.
+MAX_SAFE_INTEGER = 2 ** 53
+
+# Handlers for types that JSON doesn't natively support, keyed by type.
+_encoders = {
+    Promise: force_str,
+    datetime.datetime: encode_datetime,
+    datetime.date: datetime.date.isoformat,
+    datetime.time: encode_time,
+    datetime.timedelta: encode_timedelta,
+    # Serializers will coerce decimals to strings by default.
+    decimal.Decimal: float,
+    uuid.UUID: str,
+    QuerySet: tuple,
+    # Best-effort for binary blobs. See #4187.
+    bytes: bytes.decode,
+}
+
+# Resolved handlers, keyed by the exact type of the encoded object.
+_handlers = {}
+
+
+def register_encoder(cls, encoder):
+    """
+    Register an ``encoder`` function for instances of ``cls`` (and its subclasses).
+
+    The function should return a JSON-serializable representation of the
+    object, or raise a ``TypeError`` if it cannot be encoded. Note that encoders
+    are not used for types natively supported by JSON (e.g., ``dict``).
+    """
+    _encoders[cls] = encoder
+    _handlers.clear()
+
+
+def resolve_encoder(cls):
+    """Return the encoder function for a type."""
+    for base in cls.__mro__:
+        if base in _encoders:
+            return _encoders[base]
+
+    if hasattr(cls, 'tolist'):
+        # Numpy arrays and array scalars.
+        return cls.tolist
+    elif hasattr(cls, '__getitem__'):
+        return encode_mapping
+    elif hasattr(cls, '__iter__'):
+        return tuple
+    return unsupported
+
 
 class JSONEncoder(json.JSONEncoder):
     """
     JSONEncoder subclass that knows how to encode date/time/timedelta,
     decimal types, generators and other basic python objects.
 
-    Taken from https://github.com/tomchristie/django-rest-framework/blob/3.11.0/rest_framework/utils/encoders.py
-    """
-    def default(self, obj):  # noqa: C901
-        # For Date Time string spec, see ECMA 262
-        # https://ecma-international.org/ecma-262/5.1/#sec-15.9.1.15
-        if isinstance(obj, Promise):
-            return force_str(obj)
-        elif isinstance(obj, datetime.datetime):
-            representation = obj.isoformat()
-            if representation.endswith('+00:00'):
-                representation = representation[:-6] + 'Z'
-            return representation
-        elif isinstance(obj, datetime.date):
-            return obj.isoformat()
-        elif isinstance(obj, datetime.time):
-            if timezone and timezone.is_aware(obj):
-                raise ValueError("JSON can't represent timezone-aware times.")
-            representation = obj.isoformat()
-            return representation
-        elif isinstance(obj, datetime.timedelta):
-            return str(obj.total_seconds())
-        elif isinstance(obj, decimal.Decimal):
-            # Serializers will coerce decimals to strings by default.
-            return float(obj)
-        elif isinstance(obj, uuid.UUID):
-            return str(obj)
-        elif isinstance(obj, QuerySet):
-            return tuple(obj)
-        elif isinstance(obj, bytes):
-            # Best-effort for binary blobs. See #4187.
-            return obj.decode()
-        elif hasattr(obj, 'tolist'):
-            # Numpy arrays and array scalars.
-            return obj.tolist()
-        elif hasattr(obj, '__getitem__'):
-            cls = (list if isinstance(obj, (list, tuple)) else dict)
-            try:
-                return cls(obj)
-            except Exception:
-                pass
-        elif hasattr(obj, '__iter__'):
-            return tuple(item for item in obj)
-        return super().default(obj)
+    Encoders are resolved from the object's type (see ``register_encoder``),
+    and cached for subsequent objects of the same type.
+
+    Adapted from https://github.com/tomchristie/django-rest-framework/blob/3.11.0/rest_framework/utils/encoders.py
+    """
+    def default(self, obj):
+        encoder = _handlers.get(type(obj))
+        if encoder is None:
+            encoder = _handlers[type(obj)] = metrics.measure_default(resolve_encoder(type(obj)))
+        return encoder(obj)
+
+
+class CanonicalJSONEncoder(JSONEncoder):
+    """
+    JSONEncoder subclass that normalizes values before encoding (see ``canonicalize``).
+
+    Combined with sorted keys and fixed separators, equal values produce
+    identical text regardless of dict ordering or number representation.
+    """
+    def iterencode(self, o, _one_shot=False):
+        return super().iterencode(canonicalize(o), _one_shot)
+
+    def default(self, obj):
+        return canonicalize(super().default(obj))
@@ -1,14 +1,28 @@
 import copy
+import functools
+import hashlib
 import json
+import threading
 import warnings
+import weakref
 
 from django.db import models
+from django.db.models.query_utils import DeferredAttribute
 from django.forms import ValidationError
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
-from . import forms
-from .encoder import JSONEncoder
-from .json import JSONString, checked_loads
+from . import forms, metrics
+from .backends import get_backend
+from .binary import get_format
+from .cache import COPY_MAX_LENGTH, LoadCache, copy_json
+from .compression import Compressor, decompress
+from .concurrency import run_in_executor
+from .encoder import CanonicalJSONEncoder, JSONEncoder
+from .json import JSONString, PartialJSON, RawJSON, checked_loads, exceeds_size, freeze, iterload, load_paths
+from .keys import JSONKeyMixin, KeyColumn
+from .schema import compile_schema, validate_schema
+from .typed import get_converter
 
 
 DEFAULT_DUMP_KWARGS = {
@@ -17,62 +31,482 @@ DEFAULT_DUMP_KWARGS = {
 
 DEFAULT_LOAD_KWARGS = {}
 
+CANONICAL_DUMP_KWARGS = {
+    'cls': CanonicalJSONEncoder,
+    'sort_keys': True,
+    'separators': (',', ':'),
+    'ensure_ascii': False,
+}
+
+# Field options, which are omitted from `deconstruct()` if unchanged.
+OPTION_DEFAULTS = {
+    'lazy': False,
+    'cache_size': 0,
+    'cache_max_length': 4096,
+    'frozen': False,
+    'compress': None,
+    'compress_threshold': 1024,
+    'async_threshold': 65536,
+    'schema': None,
+    'schema_class': None,
+}
+
+# Instance attribute that holds the database text of decoded lazy values.
+LOADED_JSON_ATTR = '_jsonfield_loaded'
+
 INVALID_JSON_WARNING = (
     '{0!s} failed to load invalid json ({1}) from the database. The value has '
     'been returned as a string instead.'
 )
 
 
+INVALID_OBJECT_WARNING = (
+    '{0!s} failed to load {1} from the database ({2!r}). The value has been '
+    'returned as a dict instead.'
+)
+
+
+def warn_invalid_json(field, value):
+    warnings.warn(INVALID_JSON_WARNING.format(field, value), RuntimeWarning)
+    metrics.report_invalid(field, value)
+
+
+def decompress_or_keep(value):
+    # Values that can't be decompressed are kept, as their prefix fails to
+    # decode as JSON, and they are then handled as any other invalid value.
+    try:
+        return decompress(value)
+    except json.JSONDecodeError:
+        return value
+
+
+class LazyJSONDescriptor(DeferredAttribute):
+    """
+    Decodes the raw database text of a lazy field on first access.
+
+    The decoded value replaces the raw text in the instance's ``__dict__``, so
+    subsequent accesses are a plain lookup. This is a data descriptor, as the
+    instance ``__dict__`` would otherwise shadow ``__get__`` once populated.
+
+    The raw text is retained, so that changes to the value can be detected. This
+    includes values copied from another instance of the same row, as done by
+    ``refresh_from_db()`` and deferred loads.
+    """
+
+    def __init__(self, field):
+        super().__init__(field)
+        # The instance whose value was last decoded, by thread.
+        self.local = threading.local()
+
+    def __get__(self, instance, cls=None):
+        value = super().__get__(instance, cls)
+        if isinstance(value, RawJSON):
+            value = instance.__dict__[self.field.attname] = self.field.load_db_value(value)
+            self.local.decoded = weakref.ref(instance)
+        return value
+
+    def __set__(self, instance, value):
+        text = value if isinstance(value, RawJSON) else self.copied_text(instance, value)
+        if text is not None:
+            instance.__dict__.setdefault(LOADED_JSON_ATTR, {})[self.field.attname] = text
+        instance.__dict__[self.field.attname] = value
+
+    def copied_text(self, instance, value):
+        # Return the loaded text of a value that was just decoded for the same row.
+        ref = getattr(self.local, 'decoded', None)
+        source = ref() if ref is not None else None
+        if (
+            value is None or source is None or type(source) is not type(instance) or source.pk != instance.pk
+            or source.__dict__.get(self.field.attname) is not value
+        ):
+            return None
+        return source.__dict__.get(LOADED_JSON_ATTR, {}).get(self.field.attname)
+
+
 class JSONFieldMixin(models.Field):
     form_class = forms.JSONField
 
-    def __init__(self, *args, dump_kwargs=None, load_kwargs=None, **kwargs):
+    def __init__(self, *args, dump_kwargs=None, load_kwargs=None, lazy=False, backend=None,
+                 cache_size=0, cache_max_length=4096, frozen=False, compress=None, compress_threshold=1024,
+                 canonical=False, async_threshold=65536, schema=None, schema_class=None, **kwargs):
+        if canonical and dump_kwargs is not None:
+            raise ValueError("'canonical' and 'dump_kwargs' are mutually exclusive.")
+        if frozen and schema_class is not None:
+            raise ValueError("'frozen' and 'schema_class' are mutually exclusive.")
+        self.canonical = canonical
         self.dump_kwargs = DEFAULT_DUMP_KWARGS if dump_kwargs is None else dump_kwargs
+        if canonical:
+            self.dump_kwargs = CANONICAL_DUMP_KWARGS
         self.load_kwargs = DEFAULT_LOAD_KWARGS if load_kwargs is None else load_kwargs
+        self.lazy = lazy
+        self.backend_name = backend
+        self.backend = get_backend(backend)
+        self.cache_size = cache_size
+        self.cache_max_length = cache_max_length
+        self.frozen = frozen
+        self.load_cache = None
+        if cache_size:
+            # Frozen values may be shared, instead of copied.
+            if frozen:
+                self.load_cache = LoadCache(cache_size, cache_max_length, copy=freeze)
+            else:
+                self.load_cache = LoadCache(cache_size, min(cache_max_length, COPY_MAX_LENGTH), copy=copy_json)
+        self.compress = compress
+        self.compress_threshold = compress_threshold
+        self.compressor = Compressor(compress, compress_threshold) if compress else None
+        self.async_threshold = async_threshold
+        self.schema = schema
+        self.schema_validator = compile_schema(schema) if schema is not None else None
+        self.schema_class = schema_class
+
+        if lazy:
+            self.descriptor_class = LazyJSONDescriptor
 
         super().__init__(*args, **kwargs)
 
     def deconstruct(self):
         name, path, args, kwargs = super().deconstruct()
 
-        if self.dump_kwargs != DEFAULT_DUMP_KWARGS:
+        if self.canonical:
+            kwargs['canonical'] = True
+        elif self.dump_kwargs != DEFAULT_DUMP_KWARGS:
             kwargs['dump_kwargs'] = self.dump_kwargs
         if self.load_kwargs != DEFAULT_LOAD_KWARGS:
             kwargs['load_kwargs'] = self.load_kwargs
+        if self.backend_name is not None:
+            kwargs['backend'] = self.backend_name
+
+        for option, default in OPTION_DEFAULTS.items():
+            if getattr(self, option) != default:
+                kwargs[option] = getattr(self, option)
 
         return name, path, args, kwargs
 
+    @cached_property
+    def _encode(self):
+        encode = self.backend.get_encoder(**self.dump_kwargs)
+        return metrics.measure_encode(self, encode) if metrics.enabled() else encode
+
+    @cached_property
+    def _decode(self):
+        return self.backend.get_decoder(**self.load_kwargs)
+
+    @cached_property
+    def converter(self):
+        # Resolved on first use, as type hints may refer to classes defined later.
+        return get_converter(self.schema_class) if self.schema_class is not None else None
+
+    @cached_property
+    def _encode_canonical(self):
+        return self.backend.get_encoder(**CANONICAL_DUMP_KWARGS)
+
+    @cached_property
+    def _decode_plain(self):
+        # Compressed values are detected regardless of the `compress` option,
+        # so that values remain readable if compression is disabled.
+        def decode(value, decode=self._decode):
+            return decode(decompress(value))
+
+        if self.frozen:
+            def decode(value, decode=decode):
+                return freeze(decode(value))
+
+        if self.load_cache is not None:
+            decode = functools.partial(self.load_cache.load, loads=decode)
+        return decode
+
+    @cached_property
+    def _decode_db(self):
+        decode = self._decode_plain
+
+        # Typed objects are built from the (copied) cached values, instead of being cached.
+        if self.converter is not None:
+            def decode(value, decode=decode, load=self.load_object):
+                value = decode(value)
+                return load(value) if isinstance(value, dict) else value
+        return metrics.measure_decode(self, decode) if metrics.enabled() else decode
+
+    @cached_property
+    def _decode_fragment(self):
+        # Fragments of a document aren't converted to `schema_class` instances.
+        decode = self._decode_plain
+        return metrics.measure_decode(self, decode) if metrics.enabled() else decode
+
+    @cached_property
+    def _frozen_default(self):
+        return freeze(self.default)
+
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super().contribute_to_class(cls, name, *args, **kwargs)
+
+        if self.lazy and f'{self.name}_changed' not in cls.__dict__:
+            setattr(cls, f'{self.name}_changed', property(self.value_changed))
+
+    def get_transform(self, name):
+        # Lookups on key fields use their column, instead of the JSON text.
+        fields = self.model._meta.concrete_fields if hasattr(self, 'model') else []
+        for field in fields:
+            if isinstance(field, JSONKeyMixin) and field.source == self.name and field.name == name:
+                return KeyColumn(field)
+        return super().get_transform(name)
+
+    def value_changed(self, model_instance):
+        """
+        Return whether the value differs from what was loaded from the database.
+
+        Only lazy fields retain their database text. Values that were never
+        accessed (or only partially loaded) are unchanged, while values of other fields are assumed to be
+        changed, as their original text isn't known.
+        """
+        value = model_instance.__dict__.get(self.attname, RawJSON())
+        if isinstance(value, (RawJSON, PartialJSON)):
+            return False
+
+        loaded = model_instance.__dict__.get(LOADED_JSON_ATTR, {})
+        if self.attname not in loaded:
+            return True
+        return self.get_prep_value(value) != loaded[self.attname]
+
+    def content_hash(self, value):
+        """
+        Return the SHA-256 hex digest of the canonical encoding of a value.
+
+        Equal values have the same hash, regardless of dict ordering, number
+        representation, or the field's ``dump_kwargs``.
+        """
+        if isinstance(value, RawJSON):
+            value = self.load_db_value(value)
+        value = self.to_primitive(value)
+        return hashlib.sha256(self._encode_canonical(value).encode()).hexdigest()
+
+    def to_primitive(self, value):
+        """Return the JSON object of a ``schema_class`` instance, or the value as-is."""
+        if self.converter is not None and isinstance(value, self.schema_class):
+            return self.converter.dump(value)
+        return value
+
     def to_python(self, value):
+        if self.converter is not None and isinstance(value, self.schema_class):
+            return value
         try:
-            return checked_loads(value, **self.load_kwargs)
+            value = checked_loads(value, self._decode)
         except ValueError:
             raise ValidationError(_("Enter valid JSON."))
+        if self.converter is None or not isinstance(value, dict):
+            return value
+        try:
+            return self.converter.load(value)
+        except (KeyError, TypeError, ValueError) as e:
+            raise ValidationError(
+                _("Enter a valid %(cls)s value."), params={'cls': self.schema_class.__name__},
+            ) from e
+
+    def validate(self, value, model_instance):
+        super().validate(value, model_instance)
+        if self.schema_validator is not None and not (value is None and self.null):
+            validate_schema(self.schema_validator, self.to_primitive(value))
 
     def from_db_value(self, value, expression, connection):
         if value is None:
             return None
+        if self.lazy:
+            return RawJSON(value)
+        return self.load_db_value(value)
 
+    def load_db_value(self, value):
+        """Decode a raw database value, falling back to a string if invalid."""
+        return self._load(value, self._decode_db)
+
+    def load_fragment(self, value):
+        """
+        Decode the JSON text of a value extracted from a database value, as per ``load_db_value``.
+
+        Fragments are decoded as plain JSON, as only entire documents are
+        converted to ``schema_class`` instances.
+        """
+        return self._load(value, self._decode_fragment)
+
+    def _load(self, value, decode):
         try:
-            return checked_loads(value, **self.load_kwargs)
+            return checked_loads(value, decode)
         except json.JSONDecodeError:
-            warnings.warn(INVALID_JSON_WARNING.format(self, value), RuntimeWarning)
+            warn_invalid_json(self, value)
             return JSONString(value)
 
+    def load_paths(self, value, paths):
+        """
+        Decode the values at the given paths of a raw database value, as a ``PartialJSON``.
+
+        Only as much of the document is decoded as needed (see ``json.load_paths``).
+        """
+        if value is None:
+            return PartialJSON()
+        try:
+            value = load_paths(decompress(value), paths, **self.load_kwargs)
+        except json.JSONDecodeError:
+            warn_invalid_json(self, value)
+            return PartialJSON()
+        return PartialJSON((path, freeze(item)) for path, item in value.items()) if self.frozen else value
+
+    async def aload(self, value):
+        """
+        Decode a raw database value from async code, as per ``load_db_value``.
+
+        Values of at least ``async_threshold`` characters are decoded in the
+        shared executor (see ``concurrency.get_executor``), so that they don't
+        block the event loop.
+        """
+        if value is None:
+            return None
+        if self.async_threshold is None or len(value) < self.async_threshold:
+            return self.load_db_value(value)
+        return await run_in_executor(self.load_db_value, value)
+
+    async def adump(self, value):
+        """
+        Encode a value from async code, as per ``get_prep_value``.
+
+        Values estimated to encode to at least ``async_threshold`` characters
+        are encoded in the shared executor.
+        """
+        if self.async_threshold is None or not exceeds_size(value, self.async_threshold):
+            return self.get_prep_value(value)
+        return await run_in_executor(self.get_prep_value, value)
+
+    async def aget(self, model_instance):
+        """
+        Return the instance's value from async code.
+
+        Unaccessed values of lazy fields are decoded via ``aload``, instead of
+        on first attribute access.
+        """
+        value = model_instance.__dict__.get(self.attname)
+        if isinstance(value, RawJSON):
+            model_instance.__dict__[self.attname] = await self.aload(value)
+        return getattr(model_instance, self.attname)
+
+    def iterload(self, model_instance):
+        """
+        Incrementally decode the top-level items of the instance's value.
+
+        Yields array items, or key/value pairs for objects (see ``json.iterload``).
+        Unaccessed values of lazy fields are decoded from their database text,
+        which avoids decoding the entire document at once.
+        """
+        value = model_instance.__dict__.get(self.attname)
+        if isinstance(value, RawJSON):
+            value = decompress(value)
+        else:
+            value = getattr(model_instance, self.attname)
+
+        for item in iterload(value, **self.load_kwargs):
+            yield freeze(item) if self.frozen else item
+
+    def pre_save(self, model_instance, add):
+        if not self.lazy:
+            return super().pre_save(model_instance, add)
+
+        # Avoid the lazy descriptor, so that unread values aren't decoded.
+        value = model_instance.__dict__.get(self.attname)
+        if isinstance(value, RawJSON):
+            return value
+
+        # Encode here to track the saved text.
+        value = self.get_prep_value(super().pre_save(model_instance, add))
+        if value is None:
+            return None
+        model_instance.__dict__.setdefault(LOADED_JSON_ATTR, {})[self.attname] = value
+        return RawJSON(value)
+
     def get_prep_value(self, value):
         """Convert JSON object to a string"""
         if self.null and value is None:
             return None
-        return json.dumps(value, **self.dump_kwargs)
+        if isinstance(value, RawJSON):
+            # Never accessed, so the original text can be saved as-is.
+            return str(value)
+        if isinstance(value, PartialJSON):
+            raise ValueError(f"{self} is only partially loaded, and can't be saved.")
+        value = self.to_primitive(value)
+        if self.compressor is not None:
+            return self.compressor.compress(self._encode(value))
+        return self._encode(value)
+
+    def prep_many(self, values, executor=None, chunk_size=1000):
+        """
+        Convert a list of JSON objects to strings, as per ``get_prep_value``.
+
+        A single encoder is used for the batch. If a ``concurrent.futures``
+        executor is provided, chunks of values are encoded in parallel.
+        """
+        values = list(values)
+        indexes = [
+            i for i, value in enumerate(values)
+            if not (self.null and value is None) and not isinstance(value, RawJSON)
+        ]
+        encoded = self._map_chunks(
+            self.backend.dumps_many, [self.to_primitive(values[i]) for i in indexes], executor, chunk_size,
+            **self.dump_kwargs,
+        )
+        if self.compressor is not None:
+            encoded = map(self.compressor.compress, encoded)
+
+        results = [str(value) if isinstance(value, RawJSON) else value for value in values]
+        for i, value in zip(indexes, encoded):
+            results[i] = value
+        return results
+
+    def load_many(self, values, executor=None, chunk_size=1000):
+        """
+        Convert a list of database values to JSON objects, as per ``from_db_value``.
+
+        Lazy fields are also decoded. If a ``concurrent.futures`` executor is
+        provided, chunks of values are decoded in parallel.
+        """
+        values = list(values)
+        texts = [
+            decompress_or_keep(value) if isinstance(value, str) and not isinstance(value, JSONString) else value
+            for value in values
+        ]
+        results = self._map_chunks(self.backend.loads_many, texts, executor, chunk_size, **self.load_kwargs)
+        for i, result in enumerate(results):
+            if isinstance(result, json.JSONDecodeError):
+                warn_invalid_json(self, values[i])
+                results[i] = JSONString(values[i])
+            elif self.frozen:
+                results[i] = freeze(result)
+            elif self.converter is not None and isinstance(result, dict):
+                results[i] = self.load_object(result)
+        return results
+
+    def load_object(self, value):
+        """Convert a decoded database object to a ``schema_class`` instance, falling back to the dict if invalid."""
+        try:
+            return self.converter.load(value)
+        except (KeyError, TypeError, ValueError) as e:
+            warnings.warn(INVALID_OBJECT_WARNING.format(self, self.schema_class.__name__, e), RuntimeWarning)
+            return value
+
+    def _map_chunks(self, func, values, executor, chunk_size, **kwargs):
+        if executor is None or len(values) <= chunk_size:
+            return func(values, **kwargs)
+
+        chunks = [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+        futures = [executor.submit(func, chunk, **kwargs) for chunk in chunks]
+        return [result for future in futures for result in future.result()]
 
     def value_to_string(self, obj):
         value = self.value_from_object(obj)
-        return json.dumps(value, **self.dump_kwargs)
+        return self._encode(self.to_primitive(value))
 
     def formfield(self, **kwargs):
         kwargs.setdefault('form_class', self.form_class)
         if issubclass(kwargs['form_class'], forms.JSONField):
-            kwargs.setdefault('dump_kwargs', self.dump_kwargs)
+            # Note: The schema is not passed, as it's validated by the model.
+            # Canonical text is compact, and not intended for display.
+            kwargs.setdefault('dump_kwargs', DEFAULT_DUMP_KWARGS if self.canonical else self.dump_kwargs)
             kwargs.setdefault('load_kwargs', self.load_kwargs)
+            kwargs.setdefault('backend', self.backend)
 
         return super().formfield(**kwargs)
 
@@ -86,15 +520,42 @@ class JSONFieldMixin(models.Field):
         without calling force_unicode on it. Note that if you set a
         callable as a default, the field will still call it. It will
         *not* try to pickle and encode it.
+
+        Frozen fields return an immutable default, which is shared instead of copied.
         """
         if self.has_default():
             if callable(self.default):
-                return self.default()
+                return freeze(self.default()) if self.frozen else self.default()
+            if self.frozen:
+                return self._frozen_default
             return copy.deepcopy(self.default)
         # If the field doesn't have a default, then we punt to models.Field.
         return super().get_default()
 
 
+def save_changed_json(instance, **kwargs):
+    """
+    Save a model instance, omitting unchanged JSON fields from the update.
+
+    Deferred fields are also omitted, unless they're the key fields of saved
+    JSON fields. New instances are saved normally.
+    """
+    if instance._state.adding:
+        return instance.save(**kwargs)
+
+    update_fields = [
+        field.name for field in instance._meta.concrete_fields
+        if not field.primary_key and field.attname in instance.__dict__
+        if not isinstance(field, JSONFieldMixin) or field.value_changed(instance)
+    ]
+    # The key fields of saved JSON fields are saved with them.
+    update_fields += [
+        field.name for field in instance._meta.concrete_fields
+        if isinstance(field, JSONKeyMixin) and field.source in update_fields and field.name not in update_fields
+    ]
+    instance.save(update_fields=update_fields, **kwargs)
+
+
 class JSONField(JSONFieldMixin, models.TextField):
     """JSONField is a generic textfield that serializes/deserializes JSON objects"""
 
@@ -109,3 +570,72 @@ class JSONField(JSONFieldMixin, models.TextField):
 
 class JSONCharField(JSONFieldMixin, models.CharField):
     """JSONCharField is a generic textfield that serializes/deserializes JSON objects"""
+
+
+class JSONBinaryField(models.BinaryField):
+    """
+    JSONBinaryField serializes/deserializes JSON objects to a compact binary format.
+
+    Values follow the type rules of ``JSONEncoder``, but are stored in a binary
+    column (e.g., MessagePack), which is faster to decode than JSON text.
+    """
+
+    def __init__(self, *args, format='msgpack', **kwargs):
+        self.format_name = format
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.format_name != 'msgpack':
+            kwargs['format'] = self.format_name
+        return name, path, args, kwargs
+
+    @cached_property
+    def format(self):
+        # Resolved on first use, so that models can be imported without the format's library.
+        return get_format(self.format_name)
+
+    def _check_str_default_value(self):
+        # Unlike binary data, string defaults are valid JSON values.
+        return []
+
+    def load_value(self, value):
+        value = self.format.loads(bytes(value))
+        return JSONString(value) if isinstance(value, str) else value
+
+    def to_python(self, value):
+        try:
+            if isinstance(value, (bytes, bytearray, memoryview)):
+                return self.load_value(value)
+            # Serialized values are JSON text (see ``value_to_string``).
+            return checked_loads(value)
+        except ValueError:
+            raise ValidationError(_("Enter valid JSON."))
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        try:
+            return self.load_value(value)
+        except ValueError:
+            warn_invalid_json(self, value)
+            return bytes(value)
+
+    def get_prep_value(self, value):
+        """Convert JSON object to bytes"""
+        value = super().get_prep_value(value)
+        if self.null and value is None:
+            return None
+        return self.format.dumps(value)
+
+    def value_to_string(self, obj):
+        return json.dumps(self.value_from_object(obj), cls=JSONEncoder)
+
+    def formfield(self, **kwargs):
+        kwargs.setdefault('form_class', forms.JSONField)
+        return super().formfield(**kwargs)
+
+    def get_default(self):
+        if self.has_default() and not callable(self.default):
+            return copy.deepcopy(self.default)
+        return super().get_default()
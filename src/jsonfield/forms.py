@@ -1,41 +1,126 @@
 import json
 
 from django.forms import ValidationError, fields
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
-from .json import checked_loads
+from .backends import get_backend
+from .json import checked_loads, equal
+from .schema import compile_schema, validate_schema
 
 
 class InvalidJSONInput(str):
     pass
 
 
+class ValidJSONInput(str):
+    """Submitted JSON text, along with its decoded ``value`` (and ``encoded`` text, once prepared)."""
+
+    def __new__(cls, text, value):
+        self = super().__new__(cls, text)
+        self.value = value
+        self.encoded = None
+        return self
+
+
 class JSONField(fields.CharField):
     default_error_messages = {
         'invalid': _('"%(value)s" value must be valid JSON.'),
     }
 
-    def __init__(self, *args, dump_kwargs=None, load_kwargs=None, **kwargs):
-        self.dump_kwargs = dump_kwargs if dump_kwargs else {}
-        self.load_kwargs = load_kwargs if load_kwargs else {}
+    def __init__(self, *args, dump_kwargs=None, load_kwargs=None, backend=None, schema=None, **kwargs):
+        self.dump_kwargs = dict(dump_kwargs) if dump_kwargs else {}
+        self.load_kwargs = dict(load_kwargs) if load_kwargs else {}
+        self.backend = get_backend(backend)
+        self.schema_validator = compile_schema(schema) if schema is not None else None
+        self._input = None
 
         super().__init__(*args, **kwargs)
 
+    @cached_property
+    def _encode(self):
+        return self.backend.get_encoder(**self.dump_kwargs)
+
+    @cached_property
+    def _decode(self):
+        return self.backend.get_decoder(**self.load_kwargs)
+
+    def parse(self, data):
+        """
+        Decode submitted text, as a ``ValidJSONInput`` or ``InvalidJSONInput``.
+
+        The last input is retained, so that the same text isn't decoded again by
+        ``bound_data``, ``to_python``, and ``has_changed``, until its value is
+        handed out by ``to_python``.
+        """
+        if self._input is not None and str.__eq__(self._input, data) is True:
+            return self._input
+        try:
+            self._input = ValidJSONInput(data, checked_loads(data, self._decode))
+        except json.JSONDecodeError:
+            self._input = InvalidJSONInput(data)
+        return self._input
+
     def to_python(self, value):
         if self.disabled:
             return value
 
+        value = self._decode_input(value)
+        if isinstance(value, ValidJSONInput):
+            # The value may be modified once handed out (e.g., as cleaned data),
+            # so it's no longer retained for rendering or `has_changed`.
+            if value is self._input:
+                self._input = None
+            return value.value
+        return value
+
+    def _decode_input(self, value):
+        # Return the decoded value, or the `ValidJSONInput` of submitted text.
         if value in self.empty_values:
             return None
 
+        if type(value) is str:
+            value = self.parse(value)
+        if isinstance(value, ValidJSONInput):
+            return value
+        if not isinstance(value, InvalidJSONInput):
+            return checked_loads(value, self._decode)
+        raise ValidationError(
+            self.error_messages['invalid'],
+            code='invalid',
+            params={'value': value},
+        )
+
+    def validate(self, value):
+        super().validate(value)
+        if self.schema_validator is not None and value is not None:
+            validate_schema(self.schema_validator, value)
+
+    def has_changed(self, initial, data):
+        """
+        Return whether the submitted data differs from the initial value.
+
+        Values are compared structurally (see ``json.equal``), so formatting and
+        key order are ignored, and comparison stops at the first difference. An
+        initial value with non-JSON types (e.g., dates) is only normalized by
+        encoding it, if it doesn't already compare equal.
+        """
+        if self.disabled:
+            return False
         try:
-            return checked_loads(value, **self.load_kwargs)
-        except json.JSONDecodeError:
-            raise ValidationError(
-                self.error_messages['invalid'],
-                code='invalid',
-                params={'value': value},
-            )
+            data = self._decode_input(data)
+        except ValidationError:
+            return True
+        if isinstance(data, ValidJSONInput):
+            data = data.value
+
+        if data is None and initial in (None, ''):
+            return False
+        if equal(initial, data):
+            return False
+        if initial is None or isinstance(initial, (str, int, float)):
+            return True
+        return not equal(self._decode(self._encode(initial)), data)
 
     def bound_data(self, data, initial):
         # Note: This is a bit confusing, as there are multiple things occurring.
@@ -49,16 +134,17 @@ class JSONField(fields.CharField):
         #   form is bound. If unbound, the `initial` value is provided directly
         #   to `prepare_value`, and the value would still need to be encoded.
         #
-        #   Lastly, we don't want to run `checked_loads` here, since we *know*
-        #   that the input `data` isn't a decoded value (e.g., via `to_python`).
+        #   Lastly, the decoded value is carried with the input text, so that it's
+        #   decoded once for `to_python`, and encoded once for `prepare_value`.
         if self.disabled:
             return initial
-        try:
-            return json.loads(data, **self.load_kwargs)
-        except json.JSONDecodeError:
-            return InvalidJSONInput(data)
+        return self.parse(data)
 
     def prepare_value(self, value):
         if isinstance(value, InvalidJSONInput):
             return value
-        return json.dumps(value, **self.dump_kwargs)
+        if isinstance(value, ValidJSONInput):
+            if value.encoded is None:
+                value.encoded = self._encode(value.value)
+            return value.encoded
+        return self._encode(value)
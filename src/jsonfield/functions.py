@@ -0,0 +1,156 @@
+from django.db import NotSupportedError
+from django.db.models import Func, TextField, Value
+
+from .json import split_path
+
+
+# The SQL of a value's JSON type, its type for arrays, and string concatenation.
+PATH_SQL = {
+    'sqlite': ('json_type({document}, {path})', 'array', '({} || {})'),
+    'mysql': ('JSON_TYPE(JSON_EXTRACT({document}, {path}))', 'ARRAY', 'CONCAT({}, {})'),
+}
+
+
+def is_index(key):
+    return isinstance(key, int) or key.isdigit()
+
+
+def json_path(path):
+    """Return a SQLite/MySQL JSON path (e.g., ``$."a"[0]``) from a path of keys."""
+    parts = ['$']
+    for key in path:
+        key = str(key)
+        if is_index(key):
+            parts.append(f'[{key}]')
+        elif '"' in key or '\\' in key:
+            raise ValueError(f'Unsupported key in JSON path: {key!r}')
+        else:
+            parts.append(f'."{key}"')
+    return ''.join(parts)
+
+
+def compile_path(connection, document, path):
+    """
+    Return the ``(sql, params)`` of a SQLite/MySQL JSON path of a document's compiled ``(sql, params)``.
+
+    As per ``json.extract``, numeric string keys are indexes of arrays, and keys
+    of objects, so these are chosen for each document. ``int`` keys are always
+    array indexes.
+    """
+    type_sql, array_type, concat = PATH_SQL[connection.vendor]
+    document_sql, document_params = document
+    sql, params, literal = None, [], '$'
+    for key in path:
+        if not isinstance(key, str) or not key.isdigit():
+            literal += json_path([key])[1:]
+            continue
+        parent, parent_params = ('%s', [literal]) if sql is None else (concat.format(sql, '%s'), [*params, literal])
+        key_sql = f"CASE {type_sql.format(document=document_sql, path=parent)} WHEN %s THEN %s ELSE %s END"
+        sql = concat.format(parent, key_sql)
+        params = [*parent_params, *document_params, *parent_params, array_type, f'[{key}]', f'."{key}"']
+        literal = ''
+
+    if sql is None:
+        return '%s', [literal]
+    if literal:
+        return concat.format(sql, '%s'), [*params, literal]
+    return sql, params
+
+
+class JSONFunc(Func):
+    """
+    Base class for functions on the JSON text of a field.
+
+    Supported on PostgreSQL, MySQL/MariaDB, and SQLite 3.38+. Numeric keys of
+    paths are indexes of arrays, and keys of objects. Every row must contain
+    valid, uncompressed JSON text.
+    """
+    output_field = TextField()
+
+    @classmethod
+    def supports(cls, connection):
+        if connection.vendor == 'sqlite':
+            return connection.Database.sqlite_version_info >= (3, 38)
+        return connection.vendor in ('postgresql', 'mysql')
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(f'{self.__class__.__name__} is not supported on {connection.display_name}.')
+
+    def compile_args(self, compiler):
+        """Return the compiled ``(sql, params)`` of each argument."""
+        return [compiler.compile(expression) for expression in self.source_expressions]
+
+
+class JSONExtract(JSONFunc):
+    """Returns the JSON text of the value at a path of a JSON field, or null if missing."""
+
+    def __init__(self, expression, path, **extra):
+        self.path = split_path(path)
+        super().__init__(expression, **extra)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        if not self.supports(connection):
+            return self.as_sql(compiler, connection)
+        (sql, params), = self.compile_args(compiler)
+        path, path_params = compile_path(connection, (sql, params), self.path)
+        return f'({sql} -> {path})', [*params, *path_params]
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        (sql, params), = self.compile_args(compiler)
+        path, path_params = compile_path(connection, (sql, params), self.path)
+        return f'JSON_EXTRACT({sql}, {path})', [*params, *path_params]
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        (sql, params), = self.compile_args(compiler)
+        return f'(({sql})::jsonb #> %s::text[])::text', [*params, [str(key) for key in self.path]]
+
+
+class JSONSet(JSONFunc):
+    """
+    Returns the JSON text of a JSON field, with the value at a path replaced by the given JSON text.
+
+    Object keys are added if missing. The document is unchanged if the parent of
+    the path is missing, or if it isn't valid JSON text. Indexes past the end of
+    an array are ignored by SQLite and MySQL, and append to the array on
+    PostgreSQL. Requires PostgreSQL 16+, for its ``IS JSON`` predicate.
+    """
+
+    def __init__(self, expression, path, value, **extra):
+        self.path = split_path(path)
+        super().__init__(expression, Value(value), **extra)
+
+    @classmethod
+    def supports(cls, connection):
+        if connection.vendor == 'postgresql':
+            return connection.pg_version >= 160000
+        return super().supports(connection)
+
+    def as_sqlite(self, compiler, connection, **extra_context):
+        if not self.supports(connection):
+            return self.as_sql(compiler, connection)
+        (sql, params), (value, value_params) = self.compile_args(compiler)
+        parent, parent_params = compile_path(connection, (sql, params), self.path[:-1])
+        path, path_params = compile_path(connection, (sql, params), self.path)
+        # Unlike other databases, SQLite would create missing parents. CASE is
+        # evaluated lazily, so invalid text isn't passed to the JSON functions.
+        return (
+            f"CASE WHEN json_valid({sql}) THEN CASE WHEN json_type({sql}, {parent}) IN ('object', 'array') "
+            f"THEN json_set({sql}, {path}, json({value})) ELSE {sql} END ELSE {sql} END"
+        ), [*params, *params, *parent_params, *params, *path_params, *value_params, *params, *params]
+
+    def as_mysql(self, compiler, connection, **extra_context):
+        (sql, params), (value, value_params) = self.compile_args(compiler)
+        path, path_params = compile_path(connection, (sql, params), self.path)
+        return (
+            f'CASE WHEN JSON_VALID({sql}) THEN JSON_SET({sql}, {path}, CAST({value} AS JSON)) ELSE {sql} END'
+        ), [*params, *params, *path_params, *value_params, *params]
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        if not self.supports(connection):
+            return self.as_sql(compiler, connection)
+        (sql, params), (value, value_params) = self.compile_args(compiler)
+        path = [str(key) for key in self.path]
+        return (
+            f'CASE WHEN ({sql}) IS JSON THEN jsonb_set(({sql})::jsonb, %s::text[], ({value})::jsonb)::text '
+            f'ELSE {sql} END'
+        ), [*params, *params, path, *value_params, *params]
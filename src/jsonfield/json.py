@@ -1,22 +1,458 @@
+import copy
 import json
+from json.decoder import WHITESPACE, scanstring
 
 
 class JSONString(str):
     pass
 
 
-def checked_loads(value, **kwargs):
+class RawJSON(str):
+    """
+    Undecoded JSON text, as loaded from the database by a lazy field.
+
+    Unlike JSONString, this is the *encoded* document and is decoded by
+    checked_loads. It is passed through as-is when saved.
+    """
+
+
+class PartialJSON(dict):
+    """
+    The values at selected paths of a JSON document, keyed by path.
+
+    As the rest of the document wasn't loaded, partial values can't be saved.
+    """
+
+
+class FrozenDict(dict):
+    """
+    An immutable ``dict``, whose values are also frozen.
+
+    As frozen values cannot be modified, they are shared instead of copied.
+    Use ``thaw()`` to get a mutable copy.
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
+    def thaw(self):
+        return {key: thaw(value) for key, value in self.items()}
+
+
+class FrozenList(list):
+    """
+    An immutable ``list``, whose items are also frozen.
+
+    As frozen values cannot be modified, they are shared instead of copied.
+    Use ``thaw()`` to get a mutable copy.
+    """
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError(f"'{type(self).__name__}' object is immutable")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = clear = extend = insert = pop = remove = reverse = sort = _immutable
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+    def thaw(self):
+        return [thaw(item) for item in self]
+
+
+def freeze(value):
+    """Return an immutable version of a decoded JSON value."""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """Return a mutable copy of a frozen JSON value."""
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value.thaw()
+    return value
+
+
+def exceeds_size(value, size):
+    """
+    Return whether the encoded size of a value is estimated to be at least ``size``.
+
+    The value is only traversed until the estimate exceeds ``size``, so the cost
+    is bounded regardless of the size of the value.
+    """
+    total, stack = 0, [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            total += len(value) + 2
+        elif isinstance(value, dict):
+            total += 2
+            for key, item in value.items():
+                total += len(key) + 4 if isinstance(key, str) else 8
+                stack.append(item)
+        elif isinstance(value, (list, tuple)):
+            total += 2 + len(value)
+            stack.extend(value)
+        else:
+            total += 4
+        if total >= size:
+            return True
+    return False
+
+
+def checked_loads(value, loads=json.loads, **kwargs):
     """
     Ensure that values aren't loaded twice, resulting in an encoding error.
 
     Loaded strings are wrapped in JSONString, as it is otherwise not possible
-    to differentiate between a loaded and unloaded string.
+    to differentiate between a loaded and unloaded string. An alternative
+    ``loads`` function may be provided (e.g., from a JSON backend).
     """
     if isinstance(value, (list, dict, int, float, JSONString, type(None))):
         return value
 
-    value = json.loads(value, **kwargs)
+    value = loads(value, **kwargs)
     if isinstance(value, str):
         value = JSONString(value)
 
     return value
+
+
+def split_path(path):
+    """Return a path of keys, from a dotted string or a sequence of keys."""
+    if isinstance(path, str):
+        return tuple(path.split('.')) if path else ()
+    return tuple(path)
+
+
+def extract(value, path, default=None):
+    """Return the value at a path of keys (or array indexes), or ``default`` if missing."""
+    for key in path:
+        try:
+            value = value[int(key) if isinstance(value, list) else key]
+        except (KeyError, IndexError, TypeError, ValueError):
+            return default
+    return value
+
+
+# `load_paths` decodes up to this number of members one at a time (or this
+# fraction of the text), before decoding the remaining members at once. Text
+# shorter than the minimum length is decoded at once.
+EARLY_MEMBERS = 8
+PARTIAL_MIN_LENGTH = 4096
+
+
+def load_paths(value, paths, cls=json.JSONDecoder, **kwargs):
+    """
+    Decode the values at the given paths of a JSON document, omitting missing paths.
+
+    The first few members of a top-level object are decoded one at a time, and
+    decoding stops once the members of every path have been found. Remaining
+    members are decoded at once, as decoding many members one at a time is
+    slower than decoding the entire document.
+    """
+    paths = {path: split_path(path) for path in paths}
+    keys = {keys[0] for keys in paths.values() if keys}
+    partial = all(paths.values()) and isinstance(value, str) and not isinstance(value, JSONString)
+    if partial and len(value) >= PARTIAL_MIN_LENGTH and value.lstrip().startswith('{'):
+        document = _load_members(value, keys, cls(**kwargs))
+    else:
+        document = checked_loads(value, cls(**kwargs).decode)
+
+    missing = object()
+    results = ((path, extract(document, keys, missing)) for path, keys in paths.items())
+    return PartialJSON((path, item) for path, item in results if item is not missing)
+
+
+def _load_members(value, keys, decoder):
+    # Return the members of the JSON object text with the given keys.
+    document, limit = {}, len(value) // EARLY_MEMBERS
+    members = _iterdecode(value, decoder, offsets=True)
+    for count, ((key, item), idx) in enumerate(members, 1):
+        if key in keys:
+            document[key] = item
+            keys.discard(key)
+            if not keys:
+                break
+        if count == EARLY_MEMBERS or idx > limit:
+            rest = _load_rest(value, idx, decoder)
+            if rest is None:
+                continue
+            if not isinstance(rest, dict):
+                # Decoding hooks may return other types.
+                return checked_loads(value, decoder.decode)
+            for key in keys & rest.keys():
+                document[key] = JSONString(rest[key]) if isinstance(rest[key], str) else rest[key]
+            break
+    return document
+
+
+def _load_rest(value, idx, decoder):
+    # Decode the members following `idx` as an object, or return None if there are none.
+    idx = WHITESPACE.match(value, idx).end()
+    if value[idx:idx + 1] != ',':
+        return None
+    start = WHITESPACE.match(value, idx + 1).end()
+    if value[start:start + 1] != '"':
+        raise json.JSONDecodeError('Expecting property name enclosed in double quotes', value, start)
+    return decoder.decode('{' + value[start:])
+
+
+def set_path(document, path, value):
+    """
+    Set the value at a path of keys (or array indexes), returning the document.
+
+    Object keys are added if missing, but array indexes must exist. The document
+    is unchanged if the parent of the path is missing.
+    """
+    if not path:
+        return value
+
+    *parents, key = path
+    parent = extract(document, parents, default=None)
+    if isinstance(parent, dict):
+        parent[key] = value
+    elif isinstance(parent, list) and str(key).isdigit() and int(key) < len(parent):
+        parent[int(key)] = value
+    return document
+
+
+class JSONPatchError(ValueError):
+    pass
+
+
+def apply_patch(document, operations):
+    """
+    Apply a JSON Patch (RFC 6902), returning the patched document.
+
+    The document may be modified in place. A ``JSONPatchError`` is raised if an
+    operation fails, including a failed ``test`` operation.
+    """
+    for operation in operations:
+        try:
+            apply = PATCH_OPERATIONS[operation['op']]
+        except KeyError:
+            raise JSONPatchError(f'Invalid operation: {operation!r}')
+        document = apply(document, operation)
+    return document
+
+
+def parse_pointer(pointer):
+    """Return the path of keys of a JSON Pointer (RFC 6901), e.g. ``'/a/0'``."""
+    if pointer == '':
+        return ()
+    if not pointer.startswith('/'):
+        raise JSONPatchError(f'Invalid JSON pointer: {pointer!r}')
+    return tuple(key.replace('~1', '/').replace('~0', '~') for key in pointer[1:].split('/'))
+
+
+def _patch_args(operation, *names):
+    try:
+        return [operation[name] for name in names]
+    except KeyError as e:
+        raise JSONPatchError(f'Missing {e} in operation: {operation!r}')
+
+
+def _index(key, array, append=False):
+    if append and key == '-':
+        return len(array)
+    if key.isdigit() and (key == '0' or not key.startswith('0')):
+        if int(key) < len(array) + append:
+            return int(key)
+    raise JSONPatchError(f'Invalid array index: {key!r}')
+
+
+def _parent(document, path):
+    parent = _get(document, path[:-1])
+    if not isinstance(parent, (dict, list)):
+        raise JSONPatchError(f"Path '/{'/'.join(path)}' does not exist.")
+    return parent, path[-1]
+
+
+def _get(document, path):
+    for key in path:
+        if isinstance(document, dict) and key in document:
+            document = document[key]
+        elif isinstance(document, list):
+            document = document[_index(key, document)]
+        else:
+            raise JSONPatchError(f"Path '/{'/'.join(path)}' does not exist.")
+    return document
+
+
+def _add(document, path, value):
+    if not path:
+        return value
+    parent, key = _parent(document, path)
+    if isinstance(parent, dict):
+        parent[key] = value
+    else:
+        parent.insert(_index(key, parent, append=True), value)
+    return document
+
+
+def _remove(document, path):
+    if not path:
+        raise JSONPatchError('The document root cannot be removed.')
+    parent, key = _parent(document, path)
+    if isinstance(parent, dict):
+        if key not in parent:
+            raise JSONPatchError(f"Path '/{'/'.join(path)}' does not exist.")
+        return parent.pop(key)
+    return parent.pop(_index(key, parent))
+
+
+def equal(a, b):
+    """Compare decoded JSON values."""
+    # Unlike Python, JSON booleans aren't equal to numbers.
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a is b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(equal(a[key], b[key]) for key in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(map(equal, a, b))
+    return a == b
+
+
+def _patch_add(document, operation):
+    path, value = _patch_args(operation, 'path', 'value')
+    return _add(document, parse_pointer(path), copy.deepcopy(value))
+
+
+def _patch_remove(document, operation):
+    path, = _patch_args(operation, 'path')
+    _remove(document, parse_pointer(path))
+    return document
+
+
+def _patch_replace(document, operation):
+    path, value = _patch_args(operation, 'path', 'value')
+    path = parse_pointer(path)
+    _get(document, path)
+    if not path:
+        return copy.deepcopy(value)
+    parent, key = _parent(document, path)
+    parent[key if isinstance(parent, dict) else _index(key, parent)] = copy.deepcopy(value)
+    return document
+
+
+def _patch_move(document, operation):
+    source, path = map(parse_pointer, _patch_args(operation, 'from', 'path'))
+    if path[:len(source)] == source and path != source:
+        raise JSONPatchError('A value cannot be moved into one of its children.')
+    return _add(document, path, _remove(document, source))
+
+
+def _patch_copy(document, operation):
+    source, path = map(parse_pointer, _patch_args(operation, 'from', 'path'))
+    return _add(document, path, copy.deepcopy(_get(document, source)))
+
+
+def _patch_test(document, operation):
+    path, value = _patch_args(operation, 'path', 'value')
+    if not equal(_get(document, parse_pointer(path)), value):
+        raise JSONPatchError(f"Test failed for path '{path}'.")
+    return document
+
+
+PATCH_OPERATIONS = {
+    'add': _patch_add,
+    'remove': _patch_remove,
+    'replace': _patch_replace,
+    'move': _patch_move,
+    'copy': _patch_copy,
+    'test': _patch_test,
+}
+
+
+def iterload(value, cls=json.JSONDecoder, **kwargs):
+    """
+    Incrementally decode the items of a JSON array, or key/value pairs of an object.
+
+    Only one top-level item is decoded at a time, so large documents can be
+    iterated with bounded memory, and iteration can be stopped early. As per
+    checked_loads, already decoded values are iterated as-is, and strings are
+    wrapped in JSONString. Note that decoding hooks (e.g., ``object_hook``) are
+    not applied to the top-level object.
+    """
+    if isinstance(value, dict):
+        return iter(value.items())
+    if isinstance(value, list):
+        return iter(value)
+    if not isinstance(value, str) or isinstance(value, JSONString):
+        raise TypeError(f'Expected a JSON array or object, not {type(value).__name__}.')
+
+    return _iterdecode(value, cls(**kwargs))
+
+
+def _iterdecode(value, decoder, offsets=False):
+    def decode_item(idx):
+        item, idx = decoder.raw_decode(value, idx)
+        return JSONString(item) if isinstance(item, str) else item, idx
+
+    def decode_pair(idx):
+        if value[idx:idx + 1] != '"':
+            raise json.JSONDecodeError('Expecting property name enclosed in double quotes', value, idx)
+        key, idx = scanstring(value, idx + 1, decoder.strict)
+        idx = WHITESPACE.match(value, idx).end()
+        if value[idx:idx + 1] != ':':
+            raise json.JSONDecodeError("Expecting ':' delimiter", value, idx)
+        item, idx = decode_item(WHITESPACE.match(value, idx + 1).end())
+        return (key, item), idx
+
+    idx = WHITESPACE.match(value).end()
+    char = value[idx:idx + 1]
+    if char == '[':
+        idx = yield from _iter_items(value, idx, ']', decode_item, offsets)
+    elif char == '{':
+        idx = yield from _iter_items(value, idx, '}', decode_pair, offsets)
+    else:
+        raise json.JSONDecodeError("Expecting '[' or '{'", value, idx)
+
+    idx = WHITESPACE.match(value, idx).end()
+    if idx != len(value):
+        raise json.JSONDecodeError('Extra data', value, idx)
+
+
+def _iter_items(value, idx, end, decode, offsets):
+    # Yield the delimited items of the array/object starting at `idx`, and
+    # return the index following its closing character. With `offsets`, the
+    # index following each item is yielded along with it.
+    idx = WHITESPACE.match(value, idx + 1).end()
+    if value[idx:idx + 1] == end:
+        return idx + 1
+
+    while True:
+        item, idx = decode(idx)
+        yield (item, idx) if offsets else item
+
+        idx = WHITESPACE.match(value, idx).end()
+        char = value[idx:idx + 1]
+        if char == end:
+            return idx + 1
+        if char != ',':
+            raise json.JSONDecodeError("Expecting ',' delimiter", value, idx)
+        idx = WHITESPACE.match(value, idx + 1).end()
@@ -0,0 +1,112 @@
+from django.core import checks, exceptions
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import signals
+from django.db.models.expressions import Col
+
+from .json import RawJSON, extract, split_path
+
+
+class JSONKeyMixin(models.Field):
+    """
+    Stores the value at a ``path`` of a JSON ``source`` field in its own column.
+
+    The value is extracted when the model instance is saved, so the column may
+    be indexed and queried via the source field (e.g., ``json__<name>``).
+    """
+
+    def __init__(self, source, path, *args, **kwargs):
+        self.source = source
+        self.path = path
+        kwargs.setdefault('editable', False)
+        super().__init__(*args, **kwargs)
+
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super().contribute_to_class(cls, name, *args, **kwargs)
+        signals.pre_save.connect(check_update_fields, sender=cls, dispatch_uid='jsonfield.keys.check_update_fields')
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['source'] = self.source
+        kwargs['path'] = self.path
+        if kwargs.get('editable') is False:
+            del kwargs['editable']
+        return name, path, args, kwargs
+
+    def check(self, **kwargs):
+        return [*super().check(**kwargs), *self._check_source()]
+
+    def _check_source(self):
+        from .fields import JSONFieldMixin
+
+        try:
+            source = self.model._meta.get_field(self.source)
+        except FieldDoesNotExist:
+            source = None
+        if isinstance(source, JSONFieldMixin):
+            return []
+        return [
+            checks.Error(
+                f"'{self.source}' is not a JSON field of '{self.model._meta.object_name}'.",
+                obj=self,
+                id='jsonfield.E001',
+            )
+        ]
+
+    def pre_save(self, model_instance, add):
+        source = self.model._meta.get_field(self.source)
+        value = model_instance.__dict__.get(source.attname)
+        if isinstance(value, RawJSON):
+            if not add and self.attname in model_instance.__dict__:
+                # The source value is unchanged since it was loaded.
+                return getattr(model_instance, self.attname)
+            # e.g., encoded values of bulk operations.
+            value = source.load_db_value(value)
+        else:
+            value = getattr(model_instance, source.attname)
+
+        try:
+            value = self.to_python(extract(source.to_primitive(value), split_path(self.path)))
+        except exceptions.ValidationError:
+            # As with missing values, values of other types are stored as null.
+            value = None
+        setattr(model_instance, self.attname, value)
+        return value
+
+
+def check_update_fields(sender, instance, update_fields=None, **kwargs):
+    """Reject saves whose ``update_fields`` include the source of a key field, but not the key field itself."""
+    if not update_fields:
+        return
+    for field in sender._meta.concrete_fields:
+        if isinstance(field, JSONKeyMixin) and field.source in update_fields and field.name not in update_fields:
+            raise ValueError(
+                f"{field} would be left stale, as '{field.source}' is saved without it. "
+                f"Include it in update_fields, or use save_changed_json()."
+            )
+
+
+class KeyColumn:
+    """Resolves a lookup on a JSON field (e.g., ``json__<name>``) to the column of a key field."""
+
+    def __init__(self, key_field):
+        self.key_field = key_field
+
+    def __call__(self, lhs):
+        return Col(lhs.alias, self.key_field)
+
+
+class CharKeyField(JSONKeyMixin, models.CharField):
+    pass
+
+
+class IntegerKeyField(JSONKeyMixin, models.IntegerField):
+    pass
+
+
+class FloatKeyField(JSONKeyMixin, models.FloatField):
+    pass
+
+
+class BooleanKeyField(JSONKeyMixin, models.BooleanField):
+    pass
@@ -0,0 +1,195 @@
+import collections
+import concurrent.futures
+import json
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, router, transaction
+
+from jsonfield.compression import decompress
+from jsonfield.fields import CANONICAL_DUMP_KWARGS, JSONFieldMixin
+from jsonfield.json import JSONString
+
+
+INVALID, OVERSIZED, NON_CANONICAL = 'invalid', 'oversized', 'non-canonical'
+
+
+def audit_rows(rows, load_kwargs, max_size=None, canonical=False):
+    """
+    Return the ``(pk, problem, detail)`` of each problem found in a chunk of ``(pk, text)`` rows.
+
+    This is run in worker processes, so it only depends on its arguments.
+    """
+    problems = []
+    for pk, text in rows:
+        if max_size is not None and len(text) > max_size:
+            problems.append((pk, OVERSIZED, f'{len(text)} characters'))
+        try:
+            decoded = decompress(text)
+            value = json.loads(decoded, **load_kwargs)
+        except Exception as e:
+            problems.append((pk, INVALID, str(e)))
+            continue
+        if canonical and canonical_text(decoded, value if not load_kwargs else None) != decoded:
+            problems.append((pk, NON_CANONICAL, ''))
+    return problems
+
+
+def canonical_text(text, value=None):
+    """
+    Return the canonical encoding of JSON text, or of its decoded ``value``.
+
+    Text is decoded as plain JSON, as decoding hooks (``load_kwargs``) may
+    return types that the canonical encoding doesn't support.
+    """
+    return json.dumps(json.loads(text) if value is None else value, **CANONICAL_DUMP_KWARGS)
+
+
+class Command(BaseCommand):
+    help = (
+        'Scans the columns of JSON fields for invalid, oversized, or non-canonical values. '
+        'Rows are read in chunks with a raw cursor, and may be checked in parallel worker processes.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'labels', nargs='*', metavar='app_label[.ModelName[.field]]',
+            help='Restricts the scan to the given apps, models, or fields.',
+        )
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS, help='The database to scan.')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='The number of rows read at once.')
+        parser.add_argument(
+            '--workers', type=int, default=0,
+            help='The number of worker processes that check chunks. By default, chunks are checked in-process.',
+        )
+        parser.add_argument('--max-size', type=int, help='Reports values longer than this number of characters.')
+        parser.add_argument(
+            '--canonical', action='store_true',
+            help='Reports values that differ from their canonical encoding (always checked for canonical fields).',
+        )
+        parser.add_argument(
+            '--repair', action='store_true',
+            help='Stores invalid values as JSON strings (as they are read), and rewrites non-canonical values '
+                 'with their canonical encoding.',
+        )
+
+    def handle(self, *args, labels, database, chunk_size, workers, **options):
+        fields = self.get_fields(labels, database)
+        executor = concurrent.futures.ProcessPoolExecutor(workers) if workers else None
+        try:
+            for field in fields:
+                self.audit_field(field, database, chunk_size, executor, workers, options)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    def get_fields(self, labels, database):
+        fields = [
+            field
+            for model in apps.get_models()
+            if model._meta.managed and not model._meta.proxy and router.allow_migrate_model(database, model)
+            for field in model._meta.concrete_fields if isinstance(field, JSONFieldMixin)
+        ]
+        for label in labels:
+            if not any(self.matches(field, label) for field in fields):
+                raise CommandError(f"No JSON fields match '{label}'.")
+        return [field for field in fields if not labels or any(self.matches(field, label) for label in labels)]
+
+    def matches(self, field, label):
+        parts = label.split('.')
+        names = [field.model._meta.app_label, field.model._meta.model_name, field.name]
+        return [part.lower() for part in parts] == names[:len(parts)]
+
+    def audit_field(self, field, database, chunk_size, executor, workers, options):
+        start, counts = time.perf_counter(), collections.Counter()
+        canonical = options['canonical'] or field.canonical
+        args = (field.load_kwargs, options['max_size'], canonical)
+
+        results = self.map_chunks(self.read_chunks(field, database, chunk_size, counts), args, executor, workers)
+        for problems in results:
+            for pk, problem, detail in problems:
+                counts[problem] += 1
+                self.stdout.write(f'{field.model._meta.label}.{field.name} pk={pk}: {problem} {detail}'.rstrip())
+            if options['repair']:
+                counts['repaired'] += self.repair(field, database, problems, canonical)
+
+        duration = time.perf_counter() - start
+        summary = ', '.join(f'{counts[name]} {name}' for name in (INVALID, OVERSIZED, NON_CANONICAL, 'repaired'))
+        self.stdout.write(
+            f"{field.model._meta.label}.{field.name}: {counts['rows']} rows, {summary} "
+            f"({counts['rows'] / duration if duration else 0:.0f} rows/s, "
+            f"{counts['size'] / duration / 2 ** 20 if duration else 0:.1f} MiB/s)"
+        )
+
+    def read_chunks(self, field, database, chunk_size, counts):
+        # Rows are read with a raw cursor, so that values aren't decoded by the field.
+        connection = connections[database]
+        qn = connection.ops.quote_name
+        pk, column, table = qn(field.model._meta.pk.column), qn(field.column), qn(field.model._meta.db_table)
+
+        sql = f'SELECT {pk}, {column} FROM {table} WHERE {column} IS NOT NULL{{}} ORDER BY {pk} LIMIT {int(chunk_size)}'
+
+        rows, last = None, None
+        while rows is None or len(rows) == chunk_size:
+            with connection.cursor() as cursor:
+                if last is None:
+                    cursor.execute(sql.format(''))
+                else:
+                    cursor.execute(sql.format(f' AND {pk} > %s'), [last])
+                rows = cursor.fetchall()
+            if rows:
+                counts['rows'] += len(rows)
+                counts['size'] += sum(len(text) for _, text in rows)
+                last = rows[-1][0]
+                yield rows
+
+    def map_chunks(self, chunks, args, executor, workers):
+        if executor is None:
+            for rows in chunks:
+                yield audit_rows(rows, *args)
+            return
+
+        # Bound the chunks in flight, so that the table isn't read into memory.
+        pending = collections.deque()
+        for rows in chunks:
+            pending.append(executor.submit(audit_rows, rows, *args))
+            if len(pending) > workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+    def repair(self, field, database, problems, canonical):
+        invalid = {pk for pk, problem, _ in problems if problem == INVALID}
+        pks = {pk for pk, problem, _ in problems if problem == NON_CANONICAL} | invalid
+        if not pks:
+            return 0
+
+        model, connection = field.model, connections[database]
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT {qn(model._meta.pk.column)}, {qn(field.column)} FROM {qn(model._meta.db_table)} '
+                f"WHERE {qn(model._meta.pk.column)} IN ({', '.join(['%s'] * len(pks))})",
+                list(pks),
+            )
+            rows = cursor.fetchall()
+
+        updates = [(self.repaired_text(field, text, pk in invalid, canonical), pk) for pk, text in rows]
+        with transaction.atomic(using=database), connection.cursor() as cursor:
+            cursor.executemany(
+                f'UPDATE {qn(model._meta.db_table)} SET {qn(field.column)} = %s '
+                f'WHERE {qn(model._meta.pk.column)} = %s',
+                updates,
+            )
+        return len(updates)
+
+    def repaired_text(self, field, text, invalid, canonical):
+        # Invalid text is read as a string, which is now stored as such.
+        if not canonical:
+            value = JSONString(text) if invalid else json.loads(decompress(text), **field.load_kwargs)
+            return field.get_prep_value(value)
+
+        # Written as-is, as the field's own encoding may not be canonical.
+        text = canonical_text(text, JSONString(text)) if invalid else canonical_text(decompress(text))
+        return field.compressor.compress(text) if field.compressor is not None else text
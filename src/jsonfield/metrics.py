@@ -0,0 +1,99 @@
+import functools
+import threading
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import Signal, receiver
+
+
+# Sent after a field encodes a value, with the `field`, encoded `size`, and
+# `duration` in seconds. `default_calls` and `default_duration` measure the
+# calls to `JSONEncoder.default` for types that JSON doesn't support.
+json_encoded = Signal()
+
+# Sent after a field decodes a database value, with the `field`, `size` of
+# the database text, and `duration` in seconds.
+json_decoded = Signal()
+
+# Sent when a field fails to decode a database value, with the `field` and
+# the invalid `value`.
+invalid_json = Signal()
+
+_local = threading.local()
+
+
+def enabled():
+    return getattr(settings, 'JSONFIELD_METRICS', False)
+
+
+def measure_encode(field, encode):
+    """Wrap a field's encode function to send ``json_encoded``."""
+    sender = getattr(field, 'model', None)
+
+    @functools.wraps(encode)
+    def wrapper(value):
+        _local.default_calls, _local.default_duration = 0, 0.0
+        start = time.perf_counter()
+        result = encode(value)
+        duration = time.perf_counter() - start
+        json_encoded.send(
+            sender=sender, field=field, size=len(result), duration=duration,
+            default_calls=_local.default_calls, default_duration=_local.default_duration,
+        )
+        return result
+    return wrapper
+
+
+def measure_decode(field, decode):
+    """Wrap a field's database decode function to send ``json_decoded``."""
+    sender = getattr(field, 'model', None)
+
+    @functools.wraps(decode)
+    def wrapper(value):
+        start = time.perf_counter()
+        result = decode(value)
+        duration = time.perf_counter() - start
+        json_decoded.send(sender=sender, field=field, size=len(value), duration=duration)
+        return result
+    return wrapper
+
+
+def measure_default(encoder):
+    """Wrap a ``JSONEncoder.default`` type encoder, if metrics are enabled."""
+    if not enabled():
+        return encoder
+
+    @functools.wraps(encoder)
+    def wrapper(obj):
+        start = time.perf_counter()
+        try:
+            return encoder(obj)
+        finally:
+            _local.default_calls = getattr(_local, 'default_calls', 0) + 1
+            _local.default_duration = getattr(_local, 'default_duration', 0.0) + time.perf_counter() - start
+    return wrapper
+
+
+def report_invalid(field, value):
+    if enabled():
+        invalid_json.send(sender=getattr(field, 'model', None), field=field, value=value)
+
+
+@receiver(setting_changed)
+def metrics_setting_changed(*, setting, **kwargs):
+    # Instrumentation is only added when functions are first resolved.
+    if setting != 'JSONFIELD_METRICS':
+        return
+
+    from .encoder import _handlers
+    from .fields import JSONFieldMixin
+
+    _handlers.clear()
+    for model in apps.get_models():
+        for field in model._meta.get_fields():
+            if isinstance(field, JSONFieldMixin):
+                field.__dict__.pop('_encode', None)
+                field.__dict__.pop('_decode_db', None)
+                field.__dict__.pop('_decode_fragment', None)
@@ -0,0 +1,130 @@
+import json
+import logging
+
+from django.db import models, router, transaction
+from django.db.migrations.operations.base import Operation
+from django.db.models.functions import Cast
+
+from .fields import JSONFieldMixin
+
+
+logger = logging.getLogger('jsonfield.operations')
+
+
+class CopyJSONData(Operation):
+    """
+    Migration operation that copies the data of one JSON field to another (e.g., to ``models.JSONField``).
+
+    Rows are copied in chunks of primary keys, each in its own transaction. Where
+    the database can validate JSON (SQLite, MySQL, and PostgreSQL 16+), valid text
+    is copied with a single ``UPDATE`` per chunk, without being decoded. The rest
+    (e.g., compressed values) are decoded in Python, and written via ``bulk_update()``.
+
+    Rows whose target is already non-null are skipped, so a migration that is
+    interrupted may be resumed. The migration should set ``atomic = False``, so
+    that completed chunks are committed. Progress is logged to the
+    ``jsonfield.operations`` logger, and may be reported to a ``progress``
+    callable, which is called with the number of rows copied so far.
+
+    Reversing the operation copies the data back, decoding it in Python.
+    """
+    reduces_to_sql = False
+    reversible = True
+
+    def __init__(self, model_name, from_field, to_field, chunk_size=1000, progress=None):
+        self.model_name = model_name
+        self.from_field = from_field
+        self.to_field = to_field
+        self.chunk_size = chunk_size
+        self.progress = progress
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        self.copy(model, self.from_field, self.to_field, schema_editor.connection.alias)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        self.copy(model, self.to_field, self.from_field, schema_editor.connection.alias, sql=False)
+
+    def describe(self):
+        return f'Copy JSON data from {self.model_name}.{self.from_field} to {self.model_name}.{self.to_field}'
+
+    @property
+    def migration_name_fragment(self):
+        return f'copy_{self.model_name.lower()}_{self.from_field.lower()}'
+
+    def copy(self, model, source, target, using, sql=True):
+        """Copy the data of a ``source`` field to a ``target`` field, returning the number of copied rows."""
+        if not router.allow_migrate_model(using, model):
+            return 0
+
+        source, target = model._meta.get_field(source), model._meta.get_field(target)
+        queryset = model._base_manager.using(using).exclude(**{f'{source.name}__isnull': True})
+        if target.null:
+            queryset = queryset.filter(**{f'{target.name}__isnull': True})
+        queryset = queryset.order_by('pk')
+
+        copy_sql = copy_json_sql(source, target, transaction.get_connection(using)) if sql and target.null else None
+        copied, last = 0, None
+        while True:
+            chunk = queryset if last is None else queryset.filter(pk__gt=last)
+            pks = list(chunk.values_list('pk', flat=True)[:self.chunk_size])
+            if not pks:
+                return copied
+
+            with transaction.atomic(using=using):
+                rows = queryset.filter(pk__gte=pks[0], pk__lte=pks[-1])
+                if copy_sql is not None:
+                    copied += self.execute(copy_sql, [pks[0], pks[-1]], using)
+                copied += self.copy_rows(rows, source, target, using)
+
+            last = pks[-1]
+            logger.info('Copied %d rows of %s to %s.', copied, source, target.name)
+            if self.progress is not None:
+                self.progress(copied)
+
+    def execute(self, sql, params, using):
+        with transaction.get_connection(using).cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.rowcount
+
+    def copy_rows(self, rows, source, target, using):
+        # Text is read as-is, so that the source field doesn't decode it.
+        rows = rows.annotate(_json_text=Cast(source.name, models.TextField())).values_list('pk', '_json_text')
+        decode = source.load_db_value if isinstance(source, JSONFieldMixin) else json.loads
+
+        objs = [source.model(**{'pk': pk, target.attname: decode(text)}) for pk, text in rows]
+        source.model._base_manager.using(using).bulk_update(objs, [target.name])
+        return len(objs)
+
+
+def copy_json_sql(source, target, connection):
+    """
+    Return the SQL that copies the valid JSON text of a ``source`` field to a null ``target`` field.
+
+    The SQL takes the first and last primary keys of a chunk of rows. ``None`` is
+    returned if the database can't validate JSON, or the target isn't ``models.JSONField``.
+    """
+    if not isinstance(target, models.JSONField) or not connection.features.supports_json_field:
+        return None
+
+    qn = connection.ops.quote_name
+    table, pk = qn(source.model._meta.db_table), qn(source.model._meta.pk.column)
+    column, target_column = qn(source.column), qn(target.column)
+
+    if connection.vendor == 'sqlite':
+        value, valid = column, f'json_valid({column})'
+    elif connection.vendor == 'mysql':
+        value, valid = f'CAST({column} AS JSON)', f'JSON_VALID({column})'
+    elif connection.vendor == 'postgresql' and connection.pg_version >= 160000:
+        value, valid = f'({column})::jsonb', f'({column}) IS JSON'
+    else:
+        return None
+
+    return (
+        f'UPDATE {table} SET {target_column} = {value} '
+        f'WHERE {pk} >= %s AND {pk} <= %s AND {target_column} IS NULL AND {column} IS NOT NULL AND {valid}'
+    )
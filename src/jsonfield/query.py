@@ -0,0 +1,221 @@
+from contextlib import contextmanager
+
+from django.db import connections, models, transaction
+from django.db.models import ExpressionWrapper, F, TextField
+from django.db.models.query import ModelIterable
+
+from .fields import LOADED_JSON_ATTR, JSONFieldMixin
+from .functions import JSONExtract, JSONSet
+from .json import PartialJSON, RawJSON, apply_patch, set_path, split_path, thaw
+from .keys import JSONKeyMixin
+
+
+class JSONQuerySet(models.QuerySet):
+    """
+    QuerySet with batched encoding of JSON fields for bulk operations.
+
+    ``bulk_create`` and ``bulk_update`` encode the values of each JSON field
+    in a single batch, and ``update`` and ``bulk_update`` also update the key
+    fields of updated JSON fields. A ``concurrent.futures`` executor may be
+    provided via ``json_executor`` to encode large batches in parallel.
+
+    ``json_only`` loads selected paths of a JSON field, instead of the entire
+    document. ``json_set`` and ``json_patch`` update JSON fields in place.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._json_only = {}
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._json_only = self._json_only
+        return clone
+
+    def json_only(self, field, paths):
+        """
+        Load only the values at the given paths (e.g., ``'a.b'``) of a JSON field.
+
+        The field's value is a ``PartialJSON`` of each path to its value, which
+        omits missing paths, and can't be saved. Values are extracted by the
+        database where supported (see ``JSONExtract``), and otherwise by
+        partially decoding the field's text.
+        """
+        field = self.model._meta.get_field(field)
+        paths = list(paths)
+        extracted = field.compress is None and JSONExtract.supports(connections[self.db])
+        if extracted:
+            annotations = {
+                f'_json_only_{field.attname}_{i}': JSONExtract(field.name, path)
+                for i, path in enumerate(paths)
+            }
+        else:
+            annotations = {f'_json_only_{field.attname}': ExpressionWrapper(F(field.name), output_field=TextField())}
+
+        clone = self.defer(field.name).annotate(**annotations)
+        clone._json_only = {**self._json_only, field: (paths, list(annotations), extracted)}
+        clone._iterable_class = PartialJSONIterable
+        return clone
+
+    def bulk_create(self, objs, *args, json_executor=None, **kwargs):
+        objs = list(objs)
+        fields = [field for field in self.model._meta.concrete_fields if isinstance(field, JSONFieldMixin)]
+
+        with prepared_json(objs, fields, json_executor):
+            return super().bulk_create(objs, *args, **kwargs)
+
+    def bulk_update(self, objs, fields, *args, json_executor=None, **kwargs):
+        objs = list(objs)
+        fields = list(fields)
+
+        # Update the key fields of updated JSON fields.
+        key_fields = [
+            field for field in self.model._meta.concrete_fields
+            if isinstance(field, JSONKeyMixin) and field.source in fields and field.name not in fields
+        ]
+        for obj in objs:
+            for field in key_fields:
+                field.pre_save(obj, False)
+        fields += [field.name for field in key_fields]
+
+        json_fields = [
+            field for field in map(self.model._meta.get_field, fields)
+            if isinstance(field, JSONFieldMixin)
+        ]
+
+        with prepared_json(objs, json_fields, json_executor):
+            return super().bulk_update(objs, fields, *args, **kwargs)
+
+    def update(self, **kwargs):
+        # Update the key fields of updated JSON fields.
+        for field in self.model._meta.concrete_fields:
+            if isinstance(field, JSONKeyMixin) and field.source in kwargs and field.name not in kwargs:
+                value = kwargs[field.source]
+                if hasattr(value, 'resolve_expression'):
+                    raise ValueError(f"{field} can't be updated from an expression of '{field.source}'.")
+                kwargs[field.name] = field.pre_save(self.model(**{field.source: value}), True)
+        return super().update(**kwargs)
+
+    def json_set(self, field, path, value, batch_size=1000):
+        """
+        Set the value at a path (e.g., ``'a.b'``) of a JSON field, returning the number of rows matched.
+
+        Object keys are added if missing, while the document is unchanged if the
+        parent of the path is missing. The update is performed by the database
+        where supported (see ``JSONSet``), and otherwise by ``json_apply``.
+        """
+        field = self.model._meta.get_field(field)
+        path = split_path(path)
+        if not path:
+            return self.update(**{field.name: value})
+
+        if self._json_updatable(field):
+            return self.update(**{field.name: JSONSet(field.name, path, field._encode(value))})
+        return self.json_apply(field.name, lambda document: set_path(document, path, value), batch_size)
+
+    def json_patch(self, field, operations, batch_size=1000):
+        """
+        Apply a JSON Patch (RFC 6902) to a JSON field, returning the number of rows updated.
+
+        If an operation fails for any row, a ``JSONPatchError`` is raised and the
+        current batch is rolled back. See ``json_apply``.
+        """
+        return self.json_apply(field, lambda document: apply_patch(document, operations), batch_size)
+
+    def json_apply(self, field, func, batch_size=1000):
+        """
+        Update the value of a JSON field with ``func(value)``, returning the number of rows updated.
+
+        Rows are locked and updated in batches of ``batch_size``, each in its
+        own transaction, so that locks are only held briefly. The value passed
+        to ``func`` is a mutable copy, which may be modified in place.
+
+        The values of ``schema_class`` fields are passed as JSON objects, and
+        the results are cleaned by the field, so a ``ValidationError`` rolls
+        back the current batch.
+        """
+        if self.query.is_sliced:
+            raise TypeError('Cannot update a query once a slice has been taken.')
+        field = self.model._meta.get_field(field)
+        pks = list(self.values_list('pk', flat=True))
+        queryset = JSONQuerySet(self.model, using=self.db)
+
+        updated = 0
+        for i in range(0, len(pks), batch_size):
+            with transaction.atomic(using=self.db):
+                objs = list(queryset.filter(pk__in=pks[i:i + batch_size]).select_for_update().only(field.name))
+                for obj in objs:
+                    value = func(thaw(field.to_primitive(getattr(obj, field.attname))))
+                    if field.converter is not None:
+                        value = field.clean(value, obj)
+                    setattr(obj, field.attname, value)
+                updated += queryset.bulk_update(objs, [field.name])
+        return updated
+
+    def _json_updatable(self, field):
+        # Values must be valid, uncompressed JSON text, whose key fields
+        # don't need to be updated. Databases may reorder object keys (e.g.,
+        # `jsonb_set`), or reformat numbers, which fields with `load_kwargs`
+        # (e.g., an `object_pairs_hook`) may be sensitive to. The values of
+        # `schema_class` fields are checked by converting them.
+        return (
+            field.compress is None and not field.canonical and not field.load_kwargs
+            and field.schema_class is None
+            and not any(isinstance(f, JSONKeyMixin) and f.source == field.name for f in self.model._meta.fields)
+            and JSONSet.supports(connections[self.db])
+        )
+
+
+class PartialJSONIterable(ModelIterable):
+    """Yields model instances, with the extracted paths of ``json_only()`` fields."""
+
+    def __iter__(self):
+        fields = self.queryset._json_only.items()
+        for obj in super().__iter__():
+            for field, (paths, names, extracted) in fields:
+                values = [obj.__dict__.pop(name) for name in names]
+                if extracted:
+                    value = PartialJSON(
+                        (path, field.load_fragment(value))
+                        for path, value in zip(paths, values) if value is not None
+                    )
+                else:
+                    value = field.load_paths(values[0], paths)
+                obj.__dict__[field.attname] = value
+            yield obj
+
+
+def get_raw_value(obj, field):
+    # Avoid decoding unaccessed values of lazy fields.
+    value = obj.__dict__.get(field.attname)
+    if isinstance(value, RawJSON):
+        return value
+    return getattr(obj, field.attname)
+
+
+@contextmanager
+def prepared_json(objs, fields, executor=None):
+    """
+    Temporarily replace the JSON field values of objects with their encoded text.
+
+    The encoded text is passed through by ``get_prep_value`` as-is. Values are
+    set directly in the instance ``__dict__``, so that the saved text of lazy
+    fields is only recorded once the objects have been successfully written.
+    """
+    originals, prepared = {}, {}
+    for field in fields:
+        originals[field] = [get_raw_value(obj, field) for obj in objs]
+        prepared[field] = field.prep_many(originals[field], executor=executor)
+        for obj, text in zip(objs, prepared[field]):
+            obj.__dict__[field.attname] = None if text is None else RawJSON(text)
+
+    saved = False
+    try:
+        yield
+        saved = True
+    finally:
+        for field, values in originals.items():
+            for obj, value, text in zip(objs, values, prepared[field]):
+                obj.__dict__[field.attname] = value
+                if saved and field.lazy and text is not None:
+                    obj.__dict__.setdefault(LOADED_JSON_ATTR, {})[field.attname] = text
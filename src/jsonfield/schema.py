@@ -0,0 +1,284 @@
+import copy
+import functools
+import json
+import re
+
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+
+from .json import FrozenDict, equal
+
+
+class SchemaError(ValueError):
+    """A value that doesn't match a schema, at the ``path`` of keys (or array indexes) within the value."""
+
+    def __init__(self, message, path=()):
+        super().__init__(message)
+        self.message = message
+        self.path = path
+
+    @property
+    def pointer(self):
+        """The path as a JSON Pointer (RFC 6901), e.g. ``'/a/0'``."""
+        return ''.join('/' + str(key).replace('~', '~0').replace('/', '~1') for key in self.path)
+
+
+def is_integer(value):
+    return isinstance(value, int) and not isinstance(value, bool) or isinstance(value, float) and value.is_integer()
+
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+TYPES = {
+    'string': lambda value: isinstance(value, str),
+    'integer': is_integer,
+    'number': is_number,
+    'boolean': lambda value: isinstance(value, bool),
+    'null': lambda value: value is None,
+    'object': lambda value: isinstance(value, dict),
+    'array': lambda value: isinstance(value, list),
+}
+
+# Keywords that don't affect validation.
+ANNOTATIONS = {'$schema', '$id', '$comment', 'title', 'description', 'examples', 'default'}
+
+
+def compile_schema(schema):
+    """
+    Compile a JSON Schema into a function that validates a decoded value.
+
+    The function raises a ``SchemaError`` for the first mismatch. Once the
+    entire schema matches, the ``default`` of missing object properties is
+    filled in (unless frozen), so invalid values are left unchanged. Defaults
+    don't satisfy ``required``. Compiled schemas are cached.
+
+    A subset of JSON Schema is supported: ``type``, ``enum``, ``const``,
+    ``properties``, ``required``, ``additionalProperties``, ``items``,
+    ``minItems``, ``maxItems``, ``minLength``, ``maxLength``, ``pattern``,
+    ``minimum``, ``maximum``, ``exclusiveMinimum``, ``exclusiveMaximum``,
+    ``anyOf``, and ``allOf``. Other keywords raise a ``ValueError``.
+    """
+    return _compile_cached(json.dumps(schema, sort_keys=True))
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_cached(schema):
+    check = _compile(json.loads(schema))
+
+    def validate(value):
+        # Checks collect the `(object, key, default)` of missing properties.
+        defaults = []
+        check(value, defaults)
+        for obj, key, default in defaults:
+            obj.setdefault(key, default)
+    return validate
+
+
+def _compile(schema):
+    if schema is True or schema == {}:
+        return _accept
+    if schema is False:
+        return _reject
+    if not isinstance(schema, dict):
+        raise ValueError(f'Invalid schema: {schema!r}')
+
+    unsupported = set(schema) - set(KEYWORDS) - ANNOTATIONS
+    if unsupported:
+        raise ValueError(f"Unsupported schema keywords: {', '.join(sorted(unsupported))}.")
+
+    checks = [
+        compile_keyword(schema[keyword], schema)
+        for keyword, compile_keyword in KEYWORDS.items() if keyword in schema
+    ]
+
+    def validate(value, defaults):
+        for check in checks:
+            check(value, defaults)
+    return checks[0] if len(checks) == 1 else validate
+
+
+def validate_schema(validator, value):
+    """Validate a value with a compiled schema, raising a ``ValidationError``."""
+    try:
+        validator(value)
+    except SchemaError as e:
+        raise ValidationError(
+            _("Value does not match the schema at '%(path)s': %(message)s"),
+            code='schema',
+            params={'path': e.pointer, 'message': e.message},
+        )
+
+
+def validate_at(validate, value, key, defaults):
+    # Paths are only built on failure, as errors propagate.
+    try:
+        validate(value, defaults)
+    except SchemaError as e:
+        e.path = (key, *e.path)
+        raise
+
+
+def _accept(value, defaults):
+    pass
+
+
+def _reject(value, defaults):
+    raise SchemaError('No values are allowed.')
+
+
+def _type(types, schema):
+    types = [types] if isinstance(types, str) else types
+    try:
+        tests = [TYPES[name] for name in types]
+    except KeyError as e:
+        raise ValueError(f'Unknown schema type: {e}')
+
+    expected = ', '.join(types)
+    if len(tests) == 1:
+        test, = tests
+    else:
+        def test(value):
+            return any(is_type(value) for is_type in tests)
+
+    def check(value, defaults):
+        if not test(value):
+            raise SchemaError(f'{value!r} is not of type {expected}.')
+    return check
+
+
+def _enum(choices, schema):
+    def check(value, defaults):
+        if not any(equal(value, choice) for choice in choices):
+            raise SchemaError(f'{value!r} is not one of {choices!r}.')
+    return check
+
+
+def _const(const, schema):
+    def check(value, defaults):
+        if not equal(value, const):
+            raise SchemaError(f'{value!r} is not {const!r}.')
+    return check
+
+
+def _properties(properties, schema):
+    validators = {key: _compile(subschema) for key, subschema in properties.items()}
+    initial = {
+        key: subschema['default'] for key, subschema in properties.items()
+        if isinstance(subschema, dict) and 'default' in subschema
+    }
+
+    def check(value, defaults):
+        if not isinstance(value, dict):
+            return
+        for key, validate in validators.items():
+            if key in value:
+                validate_at(validate, value[key], key, defaults)
+            elif key in initial and not isinstance(value, FrozenDict):
+                # The default is validated (and its own defaults filled) as a copy.
+                default = copy.deepcopy(initial[key])
+                validate_at(validate, default, key, defaults)
+                defaults.append((value, key, default))
+    return check
+
+
+def _required(required, schema):
+    def check(value, defaults):
+        if isinstance(value, dict):
+            for key in required:
+                if key not in value:
+                    raise SchemaError(f'{key!r} is a required property.')
+    return check
+
+
+def _additional_properties(additional, schema):
+    known = set(schema.get('properties', ()))
+    validate = _compile(additional)
+
+    def check(value, defaults):
+        if isinstance(value, dict):
+            for key in value.keys() - known:
+                validate_at(validate, value[key], key, defaults)
+    return check
+
+
+def _items(items, schema):
+    validate = _compile(items)
+
+    def check(value, defaults):
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                validate_at(validate, item, index, defaults)
+    return check
+
+
+def _limit(test, message, types):
+    # Compile a keyword that compares a value (or its length) to a limit.
+    def compile_keyword(limit, schema):
+        def check(value, defaults):
+            if isinstance(value, types) and not isinstance(value, bool) and not test(value, limit):
+                raise SchemaError(message.format(value=value, limit=limit))
+        return check
+    return compile_keyword
+
+
+def _pattern(pattern, schema):
+    search = re.compile(pattern).search
+
+    def check(value, defaults):
+        if isinstance(value, str) and not search(value):
+            raise SchemaError(f'{value!r} does not match {pattern!r}.')
+    return check
+
+
+def _any_of(schemas, schema):
+    validators = [_compile(subschema) for subschema in schemas]
+
+    def check(value, defaults):
+        for validate in validators:
+            # Only the defaults of the matching schema are filled in.
+            matched = []
+            try:
+                validate(value, matched)
+            except SchemaError:
+                continue
+            defaults.extend(matched)
+            return
+        raise SchemaError(f'{value!r} does not match any of the allowed schemas.')
+    return check
+
+
+def _all_of(schemas, schema):
+    validators = [_compile(subschema) for subschema in schemas]
+
+    def check(value, defaults):
+        for validate in validators:
+            validate(value, defaults)
+    return check
+
+
+KEYWORDS = {
+    'type': _type,
+    'enum': _enum,
+    'const': _const,
+    'properties': _properties,
+    'required': _required,
+    'additionalProperties': _additional_properties,
+    'items': _items,
+    'minItems': _limit(lambda value, limit: len(value) >= limit, 'Expected at least {limit} items.', list),
+    'maxItems': _limit(lambda value, limit: len(value) <= limit, 'Expected at most {limit} items.', list),
+    'minLength': _limit(lambda value, limit: len(value) >= limit, '{value!r} is shorter than {limit}.', str),
+    'maxLength': _limit(lambda value, limit: len(value) <= limit, '{value!r} is longer than {limit}.', str),
+    'pattern': _pattern,
+    'minimum': _limit(lambda value, limit: value >= limit, '{value!r} is less than {limit}.', (int, float)),
+    'maximum': _limit(lambda value, limit: value <= limit, '{value!r} is greater than {limit}.', (int, float)),
+    'exclusiveMinimum': _limit(
+        lambda value, limit: value > limit, '{value!r} is less than or equal to {limit}.', (int, float),
+    ),
+    'exclusiveMaximum': _limit(
+        lambda value, limit: value < limit, '{value!r} is greater than or equal to {limit}.', (int, float),
+    ),
+    'anyOf': _any_of,
+    'allOf': _all_of,
+}
@@ -0,0 +1,102 @@
+"""
+Django serializer that embeds the values of JSON fields as nested JSON.
+
+The standard ``json`` serializer embeds the encoded text of JSON fields as
+strings, so each value is encoded (and decoded) twice. Enable this serializer
+in place of it with::
+
+    SERIALIZATION_MODULES = {'json': 'jsonfield.serializers'}
+
+Strings are still embedded as encoded text, as this is how JSON field values
+are read from serialized data (e.g., by fixtures of the standard serializer).
+"""
+import io
+import json
+import uuid
+
+from django.core.serializers import json as json_serializer
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.python import Deserializer as PythonDeserializer
+
+from .compression import decompress
+from .encoder import JSONEncoder
+from .fields import JSONBinaryField, JSONFieldMixin
+from .json import RawJSON, iterload
+
+
+class Serializer(json_serializer.Serializer):
+    """Convert a queryset to JSON, with the values of JSON fields embedded as nested JSON."""
+
+    def start_serialization(self):
+        super().start_serialization()
+        # The encoded text of values is spliced over these placeholders.
+        self._placeholder = f'jsonfield:{uuid.uuid4().hex}:{{}}'
+        self._embedded = {}
+
+    def handle_field(self, obj, field):
+        text = embedded_text(obj, field)
+        if text is None:
+            return super().handle_field(obj, field)
+
+        placeholder = self._placeholder.format(len(self._embedded))
+        self._embedded[json.dumps(placeholder)] = text
+        self._current[field.name] = placeholder
+
+    def end_object(self, obj):
+        if not self._embedded:
+            return super().end_object(obj)
+
+        stream, self.stream = self.stream, io.StringIO()
+        try:
+            super().end_object(obj)
+        finally:
+            text, self.stream = self.stream.getvalue(), stream
+        for placeholder, embedded in self._embedded.items():
+            text = text.replace(placeholder, embedded, 1)
+        self.stream.write(text)
+        self._embedded.clear()
+
+
+def embedded_text(obj, field):
+    """Return the JSON text of a field's value to embed, or ``None`` if it should be serialized normally."""
+    if isinstance(field, JSONFieldMixin):
+        value = obj.__dict__.get(field.attname)
+        if isinstance(value, RawJSON):
+            # Unaccessed lazy values are embedded as-is, once checked to be valid.
+            # Invalid text is serialized normally, as the string it's read as.
+            try:
+                text = decompress(value)
+                json.loads(text)
+            except json.JSONDecodeError:
+                return None
+        else:
+            value = field.value_from_object(obj)
+            text = None if isinstance(value, str) else field._encode(field.to_primitive(value))
+    elif isinstance(field, JSONBinaryField):
+        value = field.value_from_object(obj)
+        text = None if isinstance(value, (str, bytes)) else json.dumps(value, cls=JSONEncoder)
+    else:
+        return None
+
+    if text is None or text.lstrip().startswith('"'):
+        return None
+    return text
+
+
+def Deserializer(stream_or_string, **options):
+    """
+    Deserialize a stream or string of JSON data.
+
+    Objects are decoded one at a time (see ``json.iterload``), and the nested
+    values of JSON fields aren't decoded again.
+    """
+    if not isinstance(stream_or_string, (bytes, str)):
+        stream_or_string = stream_or_string.read()
+    if isinstance(stream_or_string, bytes):
+        stream_or_string = stream_or_string.decode()
+    try:
+        yield from PythonDeserializer(iterload(stream_or_string), **options)
+    except (GeneratorExit, DeserializationError):
+        raise
+    except Exception as exc:
+        raise DeserializationError(f'Error deserializing object: {exc}') from exc
@@ -0,0 +1,162 @@
+import dataclasses
+import datetime
+import decimal
+import functools
+import types
+import typing
+import uuid
+
+from .encoder import encode_datetime, encode_time, encode_timedelta, register_encoder, resolve_encoder, unsupported
+
+
+def identity(value):
+    return value
+
+
+def load_datetime(value):
+    # Python 3.10 doesn't parse the 'Z' suffix.
+    return datetime.datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+
+
+# Converters of types with a JSON string (or number) representation, as per
+# `JSONEncoder`, as (load, dump) pairs.
+SCALARS = {
+    datetime.datetime: (load_datetime, encode_datetime),
+    datetime.date: (datetime.date.fromisoformat, datetime.date.isoformat),
+    datetime.time: (datetime.time.fromisoformat, encode_time),
+    datetime.timedelta: (lambda value: datetime.timedelta(seconds=float(value)), encode_timedelta),
+    decimal.Decimal: (lambda value: decimal.Decimal(str(value)), float),
+    uuid.UUID: (uuid.UUID, str),
+}
+
+
+class Converter:
+    """
+    Converts between decoded JSON objects and instances of a dataclass or attrs class.
+
+    Conversion functions are generated once per class, from the class's fields
+    and their type hints. Nested classes, ``list``, ``dict``, ``Optional``, and
+    the date/time, ``Decimal``, and ``UUID`` types are converted, while other
+    types are passed through as-is. Missing keys use the field's default.
+    """
+
+    def __init__(self, cls):
+        self.cls = cls
+        fields = get_fields(cls)
+        hints = typing.get_type_hints(cls)
+
+        namespace = {'cls': cls}
+        load_args, dump_items = [], []
+        for i, (name, arg, default) in enumerate(fields):
+            load, dump = type_converters(hints.get(name, typing.Any))
+            namespace.update({f'load_{i}': load, f'dump_{i}': dump, f'default_{i}': default})
+            value = f'data[{name!r}]' if load is identity else f'load_{i}(data[{name!r}])'
+            if default is not None:
+                value = f'({value} if {name!r} in data else default_{i}())'
+            load_args.append(f'{arg}={value}')
+            dump_items.append(f'{name!r}: obj.{name}' if dump is identity else f'{name!r}: dump_{i}(obj.{name})')
+
+        source = (
+            f"def load(data):\n    return cls({', '.join(load_args)})\n"
+            f"def dump(obj):\n    return {{{', '.join(dump_items)}}}\n"
+        )
+        exec(source, namespace)
+        self.load, self.dump = namespace['load'], namespace['dump']
+
+
+def get_fields(cls):
+    """Return the ``(name, init argument, default factory or None)`` of each of a class's init fields."""
+    if dataclasses.is_dataclass(cls):
+        return [
+            (field.name, field.name, dataclass_default(field))
+            for field in dataclasses.fields(cls) if field.init
+        ]
+    if hasattr(cls, '__attrs_attrs__'):
+        import attr
+
+        return [
+            (field.name, getattr(field, 'alias', field.name.lstrip('_')), attrs_default(field))
+            for field in attr.fields(cls) if field.init
+        ]
+    raise TypeError(f'{cls.__name__} is not a dataclass or attrs class.')
+
+
+def dataclass_default(field):
+    if field.default is not dataclasses.MISSING:
+        return functools.partial(identity, field.default)
+    if field.default_factory is not dataclasses.MISSING:
+        return field.default_factory
+    return None
+
+
+def attrs_default(field):
+    import attr
+
+    if field.default is attr.NOTHING:
+        return None
+    if isinstance(field.default, attr.Factory):
+        if field.default.takes_self:
+            raise TypeError(f"Defaults of '{field.name}' that take self are not supported.")
+        return field.default.factory
+    return functools.partial(identity, field.default)
+
+
+def type_converters(hint):
+    """Return the ``(load, dump)`` functions for a type hint."""
+    origin, args = typing.get_origin(hint), typing.get_args(hint)
+
+    if origin in (typing.Union, getattr(types, 'UnionType', None)):
+        args = [arg for arg in args if arg is not type(None)]
+        return nested(args[0], optional) if len(args) == 1 else (identity, identity)
+    if origin is list and args:
+        return nested(args[0], each_item)
+    if origin is dict and len(args) == 2:
+        return nested(args[1], each_value)
+
+    if isinstance(hint, type):
+        if hint in SCALARS:
+            return SCALARS[hint]
+        if dataclasses.is_dataclass(hint) or hasattr(hint, '__attrs_attrs__'):
+            converter = get_converter(hint)
+            return converter.load, converter.dump
+    return identity, identity
+
+
+def nested(hint, wrap):
+    # Wrap the converters of a nested type, unless they're no-ops.
+    load, dump = type_converters(hint)
+    if load is identity and dump is identity:
+        return identity, identity
+    return wrap(load), wrap(dump)
+
+
+def optional(convert):
+    def wrapper(value):
+        return None if value is None else convert(value)
+    return wrapper
+
+
+def each_item(convert):
+    def wrapper(value):
+        return [convert(item) for item in value]
+    return wrapper
+
+
+def each_value(convert):
+    def wrapper(value):
+        return {key: convert(item) for key, item in value.items()}
+    return wrapper
+
+
+@functools.lru_cache(maxsize=None)
+def get_converter(cls):
+    """
+    Return the ``Converter`` for a dataclass or attrs class.
+
+    The class is also registered with ``JSONEncoder``, unless it already has an
+    encoder, so that instances may be encoded elsewhere (e.g., in forms).
+    """
+    converter = Converter(cls)
+    if resolve_encoder(cls) is unsupported:
+        register_encoder(cls, converter.dump)
+    return converter
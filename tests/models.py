@@ -1,3 +1,5 @@
+import dataclasses
+import datetime
 import json
 from collections import OrderedDict
 
@@ -5,7 +7,9 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
-from jsonfield import JSONCharField, JSONField
+from jsonfield import JSONBinaryField, JSONCharField, JSONField
+from jsonfield.keys import CharKeyField, IntegerKeyField
+from jsonfield.query import JSONQuerySet
 
 
 class ComplexEncoder(json.JSONEncoder):
@@ -36,6 +40,66 @@ class JSONModel(models.Model):
     complex_default_json = JSONField(default=[{"checkcheck": 1212}])
     empty_default = JSONField(default={}, blank=True)
 
+    objects = JSONQuerySet.as_manager()
+
+
+class LazyJSONModel(models.Model):
+    json = JSONField(lazy=True)
+    default_json = JSONField(default={"check": 12}, lazy=True)
+    complex_default_json = JSONField(default=[{"checkcheck": 1212}], lazy=True)
+    empty_default = JSONField(default={}, blank=True, lazy=True)
+
+    objects = JSONQuerySet.as_manager()
+
+
+class FrozenJSONModel(models.Model):
+    json = JSONField(frozen=True, cache_size=10)
+    default_json = JSONField(default={"check": [12]}, frozen=True)
+
+    objects = JSONQuerySet.as_manager()
+
+
+class CompressedJSONModel(models.Model):
+    json = JSONField(compress='zlib', compress_threshold=100)
+
+
+class BinaryJSONModel(models.Model):
+    json = JSONBinaryField(null=True)
+    default_json = JSONBinaryField(default={"check": 12})
+
+
+class KeyedJSONModel(models.Model):
+    json = JSONField(lazy=True)
+    customer_id = IntegerKeyField('json', 'customer.id', null=True, db_index=True)
+    first_tag = CharKeyField('json', 'tags.0', max_length=20, null=True)
+
+    objects = JSONQuerySet.as_manager()
+
+
+@dataclasses.dataclass
+class Item:
+    sku: str
+    quantity: int = 1
+
+
+@dataclasses.dataclass(slots=True)
+class Order:
+    id: int
+    placed: datetime.datetime
+    items: list[Item] = dataclasses.field(default_factory=list)
+    note: str | None = None
+
+
+class TypedJSONModel(models.Model):
+    json = JSONField(schema_class=Order, null=True, cache_size=10)
+
+    objects = JSONQuerySet.as_manager()
+
+
+class LegacyJSONModel(models.Model):
+    old_data = JSONField(null=True, compress='zlib', compress_threshold=100)
+    data = models.JSONField(null=True)
+
 
 class JSONModelCustomEncoders(models.Model):
     # A JSON field that can store complex numbers
@@ -63,6 +127,8 @@ class JSONNotRequiredModel(models.Model):
 class OrderedJSONModel(models.Model):
     json = JSONField(load_kwargs={'object_pairs_hook': OrderedDict})
 
+    objects = JSONQuerySet.as_manager()
+
 
 class RemoteJSONModel(models.Model):
     foreign = models.ForeignKey(JSONModel, blank=True, null=True, on_delete=models.CASCADE)
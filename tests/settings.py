@@ -10,6 +10,7 @@ DEBUG = True
 
 INSTALLED_APPS = [
     'django.contrib.contenttypes',
+    'jsonfield',
     'tests',
 ]
 
@@ -0,0 +1,151 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+from unittest import skipUnless
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import gettext_lazy
+
+from jsonfield import JSONField
+from jsonfield.backends import JSONBackend, ORJSONBackend, get_backend
+from jsonfield.encoder import JSONEncoder
+from jsonfield.forms import JSONField as JSONFormField
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class Array:
+    def __init__(self, *items):
+        self.items = items
+
+    def tolist(self):
+        return list(self.items)
+
+
+class GetBackendTests(SimpleTestCase):
+    def test_default(self):
+        self.assertIsInstance(get_backend(), JSONBackend)
+        self.assertEqual(get_backend().name, 'json')
+
+    def test_instance(self):
+        backend = JSONBackend()
+        self.assertIs(get_backend(backend), backend)
+
+    def test_dotted_path(self):
+        self.assertIsInstance(get_backend('jsonfield.backends.JSONBackend'), JSONBackend)
+
+    def test_invalid(self):
+        with self.assertRaises(ImproperlyConfigured):
+            get_backend('invalid.Backend')
+
+    @override_settings(JSONFIELD_BACKEND='jsonfield.backends.JSONBackend')
+    def test_setting(self):
+        field = JSONField()
+        self.assertIsInstance(field.backend, JSONBackend)
+        self.assertNotIn('backend', field.deconstruct()[3])
+
+    def test_field_kwarg(self):
+        field = JSONField(backend='json')
+        self.assertEqual(field.deconstruct()[3]['backend'], 'json')
+        self.assertIs(field.formfield().backend, field.backend)
+
+
+@skipUnless(orjson, 'orjson is not installed')
+class ORJSONBackendTests(SimpleTestCase):
+    def setUp(self):
+        self.backend = get_backend('orjson')
+
+    def assertEncodesLike(self, value, **kwargs):
+        encoded = self.backend.dumps(value, cls=JSONEncoder, **kwargs)
+        self.assertEqual(json.loads(encoded), json.loads(json.dumps(value, cls=JSONEncoder, **kwargs)))
+
+    def test_get_backend(self):
+        self.assertIsInstance(self.backend, ORJSONBackend)
+
+    def test_type_rules(self):
+        values = [
+            datetime.datetime(2020, 1, 2, 3, 4, 5, 6, tzinfo=datetime.timezone.utc),
+            datetime.datetime(2020, 1, 2, 3, 4, 5),
+            datetime.date(2020, 1, 2),
+            datetime.time(3, 4, 5),
+            datetime.timedelta(days=1, seconds=2),
+            Decimal('1.5'),
+            uuid.UUID(int=1),
+            gettext_lazy('text'),
+            Array(1, 2),
+            b'bytes',
+            {1: 'key'},
+        ]
+
+        for value in values:
+            with self.subTest(value=value):
+                self.assertEncodesLike({'value': value})
+
+    def test_datetime_z_suffix(self):
+        value = datetime.datetime(2020, 1, 2, tzinfo=datetime.timezone.utc)
+        self.assertEqual(self.backend.dumps(value), '"2020-01-02T00:00:00Z"')
+
+    def test_fallback(self):
+        # Unsupported kwargs and values fall back to the standard library.
+        self.assertEqual(self.backend.dumps({'a': 1}, cls=JSONEncoder, indent=4), '{\n    "a": 1\n}')
+        self.assertEqual(self.backend.dumps(2 ** 70), str(2 ** 70))
+        self.assertEqual(self.backend.loads('{"a": 1}', object_pairs_hook=list), [('a', 1)])
+
+        with self.assertRaises(TypeError):
+            self.backend.dumps(object())
+        with self.assertRaises(json.JSONDecodeError):
+            self.backend.loads('{]')
+
+    def test_faithful(self):
+        # Values that orjson would change are handled by the standard library.
+        wide = {'a': 123456789012345678901234567890, 'b': -9999999999999999999}
+        self.assertEqual(self.backend.loads(json.dumps(wide)), wide)
+        self.assertEqual(self.backend.loads('18446744073709551615'), 18446744073709551615)
+
+        value = {'a': [1.5, float('nan'), None], 'b': float('inf')}
+        self.assertEqual(self.backend.dumps(value), json.dumps(value))
+        self.assertEqual(self.backend.dumps({'a': Decimal('NaN')}, cls=JSONEncoder), '{"a": NaN}')
+        with self.assertRaises(ValueError):
+            self.backend.dumps(value, allow_nan=False)
+
+        self.assertEqual(self.backend.dumps(['✨']), '["\\u2728"]')
+        self.assertEqual(self.backend.dumps(['✨'], ensure_ascii=False), '["✨"]')
+        self.assertEqual(self.backend.dumps([None]), '[null]')
+
+    def test_field(self):
+        field = JSONField(backend='orjson')
+        self.assertEqual(field.get_prep_value({'a': [1, 2]}), '{"a":[1,2]}')
+        self.assertEqual(field.from_db_value('{"a": [1, 2]}', None, None), {'a': [1, 2]})
+
+    def test_form_field(self):
+        field = JSONFormField(backend='orjson')
+        self.assertEqual(field.clean('{"a": 1}'), {'a': 1})
+        self.assertEqual(field.prepare_value({'a': 1}), '{"a":1}')
+
+
+class EncoderCacheTests(SimpleTestCase):
+    def test_shared(self):
+        first = JSONField(dump_kwargs={'indent': 2}, load_kwargs={'parse_float': Decimal})
+        second = JSONField(dump_kwargs={'indent': 2}, load_kwargs={'parse_float': Decimal})
+
+        self.assertIs(first._encode, second._encode)
+        self.assertIs(first._decode, second._decode)
+        self.assertIsNot(first._encode, JSONField()._encode)
+
+    def test_unhashable_kwargs(self):
+        field = JSONField(dump_kwargs={'cls': JSONEncoder, 'separators': [',', ':']})
+
+        self.assertEqual(field.get_prep_value({'a': 1}), '{"a":1}')
+
+    def test_form_field(self):
+        field = JSONField(load_kwargs={'parse_float': Decimal})
+        form_field = field.formfield()
+
+        self.assertIs(form_field._decode, field._decode)
+        self.assertEqual(form_field.prepare_value({'a': 1}), '{\n    "a": 1\n}')
@@ -0,0 +1,132 @@
+import datetime
+import decimal
+import json
+import uuid
+from unittest import skipUnless
+
+from django.core import serializers
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.forms import ValidationError
+from django.test import TestCase
+
+from jsonfield import JSONBinaryField
+from jsonfield.binary import get_format
+from jsonfield.json import JSONString
+
+from .models import BinaryJSONModel
+
+
+try:
+    get_format('msgpack')
+except ImproperlyConfigured:
+    msgpack = False
+else:
+    msgpack = True
+
+
+class GetFormatTests(TestCase):
+    def test_unknown_format(self):
+        with self.assertRaisesMessage(ImproperlyConfigured, "Unknown binary format 'xml'"):
+            get_format('xml')
+
+    def test_deconstruct(self):
+        name, path, args, kwargs = JSONBinaryField(null=True).deconstruct()
+
+        self.assertEqual(path, 'jsonfield.fields.JSONBinaryField')
+        self.assertEqual(kwargs, {'null': True})
+
+    def test_check_str_default(self):
+        field = BinaryJSONModel._meta.get_field('json')
+        field.default = 'value'
+        try:
+            self.assertEqual(field._check_str_default_value(), [])
+        finally:
+            field.default = None
+
+
+@skipUnless(msgpack, 'msgpack is not installed')
+class BinaryJSONFieldTests(TestCase):
+    def test_round_trip(self):
+        value = {'a': [1, 2.5, None, True], 'b': {'c': 'd'}}
+        BinaryJSONModel.objects.create(json=value)
+
+        self.assertEqual(BinaryJSONModel.objects.get().json, value)
+
+    def test_binary_storage(self):
+        obj = BinaryJSONModel.objects.create(json={'a': 'b'})
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT json FROM tests_binaryjsonmodel WHERE id = %s', [obj.pk])
+            value = bytes(cursor.fetchone()[0])
+
+        self.assertEqual(value, b'\x81\xa1a\xa1b')
+
+    def test_encoder_types(self):
+        value = {
+            'datetime': datetime.datetime(2020, 1, 1, 12, tzinfo=datetime.timezone.utc),
+            'decimal': decimal.Decimal('1.5'),
+            'uuid': uuid.UUID('12345678123456781234567812345678'),
+            'bytes': b'data',
+            'tuple': (1, 2),
+        }
+        BinaryJSONModel.objects.create(json=value)
+
+        self.assertEqual(BinaryJSONModel.objects.get().json, {
+            'datetime': '2020-01-01T12:00:00Z',
+            'decimal': 1.5,
+            'uuid': '12345678-1234-5678-1234-567812345678',
+            'bytes': 'data',
+            'tuple': [1, 2],
+        })
+
+    def test_string(self):
+        BinaryJSONModel.objects.create(json='{"a": "b"}')
+        value = BinaryJSONModel.objects.get().json
+
+        self.assertIsInstance(value, JSONString)
+        self.assertEqual(value, '{"a": "b"}')
+        self.assertEqual(BinaryJSONModel._meta.get_field('json').to_python(value), '{"a": "b"}')
+
+    def test_null(self):
+        BinaryJSONModel.objects.create(json=None)
+
+        self.assertTrue(BinaryJSONModel.objects.filter(json__isnull=True).exists())
+        self.assertIsNone(BinaryJSONModel.objects.get().json)
+
+    def test_exact(self):
+        BinaryJSONModel.objects.create(json={'a': 'b'})
+
+        self.assertTrue(BinaryJSONModel.objects.filter(json={'a': 'b'}).exists())
+        self.assertFalse(BinaryJSONModel.objects.filter(json={'a': 'c'}).exists())
+
+    def test_default(self):
+        obj = BinaryJSONModel()
+        obj.default_json['check'] = 13
+
+        self.assertEqual(BinaryJSONModel().default_json, {'check': 12})
+
+    def test_to_python(self):
+        field = BinaryJSONModel._meta.get_field('json')
+
+        self.assertEqual(field.to_python(field.get_prep_value({'a': 'b'})), {'a': 'b'})
+        self.assertEqual(field.to_python('{"a": "b"}'), {'a': 'b'})
+        self.assertEqual(field.to_python({'a': 'b'}), {'a': 'b'})
+        with self.assertRaisesMessage(ValidationError, 'Enter valid JSON.'):
+            field.to_python(b'\xc1')
+
+    def test_invalid_db_value(self):
+        field = BinaryJSONModel._meta.get_field('json')
+
+        with self.assertWarns(RuntimeWarning):
+            self.assertEqual(field.from_db_value(b'\xc1', None, connection), b'\xc1')
+
+    def test_serialization(self):
+        BinaryJSONModel.objects.create(json={'a': [1, 2]})
+        data = serializers.serialize('json', BinaryJSONModel.objects.all())
+
+        self.assertEqual(json.loads(data)[0]['fields']['json'], '{"a": [1, 2]}')
+
+        BinaryJSONModel.objects.all().delete()
+        for obj in serializers.deserialize('json', data):
+            obj.save()
+        self.assertEqual(BinaryJSONModel.objects.get().json, {'a': [1, 2]})
@@ -0,0 +1,93 @@
+import io
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import TestCase
+
+from .models import CompressedJSONModel, JSONModel, JSONModelCustomEncoders
+
+
+class AuditJSONTests(TestCase):
+    def set_text(self, obj, text, field='json'):
+        with connection.cursor() as cursor:
+            cursor.execute(f'UPDATE {obj._meta.db_table} SET {field} = %s WHERE id = %s', [text, obj.pk])
+
+    def audit(self, *args, **kwargs):
+        out = io.StringIO()
+        call_command('auditjson', *args, stdout=out, **kwargs)
+        return out.getvalue().splitlines()
+
+    def setUp(self):
+        self.objs = [JSONModel.objects.create(json={'a': i}) for i in range(5)]
+        self.set_text(self.objs[1], '{"a": ')
+        self.set_text(self.objs[3], '{"b":1,  "a":2}')
+
+    def test_audit(self):
+        lines = self.audit('tests.JSONModel.json', chunk_size=2, max_size=12)
+
+        self.assertEqual(lines[:2], [
+            f'tests.JSONModel.json pk={self.objs[1].pk}: invalid Expecting value: line 1 column 7 (char 6)',
+            f'tests.JSONModel.json pk={self.objs[3].pk}: oversized 15 characters',
+        ])
+        self.assertTrue(lines[2].startswith(
+            'tests.JSONModel.json: 5 rows, 1 invalid, 1 oversized, 0 non-canonical, 0 repaired'
+        ))
+        self.assertEqual(len(lines), 3)
+
+    def test_canonical(self):
+        self.set_text(self.objs[0], '{"a":0}')
+        lines = self.audit('tests.JSONModel.json', canonical=True)
+
+        # Values encoded by the field (with spaces) aren't canonical.
+        self.assertEqual(lines[1:4], [
+            f'tests.JSONModel.json pk={obj.pk}: non-canonical' for obj in self.objs[2:]
+        ])
+        self.assertTrue(lines[4].startswith('tests.JSONModel.json: 5 rows, 1 invalid, 0 oversized, 3 non-canonical'))
+
+    def test_canonical_custom_types(self):
+        # Values are checked as plain JSON, as decoding hooks may return other types.
+        obj = JSONModelCustomEncoders.objects.create(json=[1 + 2j])
+        lines = self.audit('tests.JSONModelCustomEncoders', canonical=True, repair=True)
+
+        self.assertEqual(lines[0], f'tests.JSONModelCustomEncoders.json pk={obj.pk}: non-canonical')
+        self.assertIn('1 non-canonical, 1 repaired', lines[1])
+        self.assertEqual(JSONModelCustomEncoders.objects.get().json, [1 + 2j])
+
+    def test_workers(self):
+        lines = self.audit('tests.JSONModel.json', chunk_size=1, workers=2)
+        self.assertTrue(lines[-1].startswith('tests.JSONModel.json: 5 rows, 1 invalid'))
+
+    def test_repair(self):
+        lines = self.audit('tests.JSONModel.json', repair=True, canonical=True)
+        self.assertIn('5 repaired', lines[-1])
+
+        self.assertEqual(
+            [obj.json for obj in JSONModel.objects.order_by('pk')],
+            [{'a': 0}, '{"a": ', {'a': 2}, {'b': 1, 'a': 2}, {'a': 4}],
+        )
+        lines = self.audit('tests.JSONModel.json', canonical=True)
+        self.assertEqual(len(lines), 1)
+        self.assertIn('0 invalid, 0 oversized, 0 non-canonical', lines[0])
+
+    def test_repair_compressed(self):
+        CompressedJSONModel.objects.create(json={'b': 'x' * 200, 'a': 1})
+        self.audit('tests.CompressedJSONModel', repair=True, canonical=True)
+
+        self.assertIn('0 non-canonical', self.audit('tests.CompressedJSONModel', canonical=True)[0])
+        self.assertEqual(CompressedJSONModel.objects.get().json, {'a': 1, 'b': 'x' * 200})
+
+    def test_compressed(self):
+        obj = CompressedJSONModel.objects.create(json={'a': 'x' * 200})
+        self.assertTrue(self.audit('tests.CompressedJSONModel', canonical=True)[-1].startswith(
+            'tests.CompressedJSONModel.json: 1 rows, 0 invalid, 0 oversized, 1 non-canonical'
+        ))
+
+        self.set_text(obj, 'zlib:invalid')
+        self.assertIn('1 invalid', self.audit('tests.CompressedJSONModel')[-1])
+
+    def test_labels(self):
+        lines = self.audit('tests.jsonmodel')
+        self.assertEqual(len([line for line in lines if ' rows, ' in line]), 4)
+
+        with self.assertRaisesMessage(CommandError, "No JSON fields match 'tests.Missing'."):
+            self.audit('tests.Missing')
@@ -0,0 +1,120 @@
+import base64
+import os
+from unittest import skipUnless
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.test import TestCase
+
+from jsonfield import JSONField
+from jsonfield.compression import get_codec, is_compressed
+
+from .models import CompressedJSONModel
+
+
+try:
+    get_codec('zstd')
+except ImproperlyConfigured:
+    zstd = False
+else:
+    zstd = True
+
+
+LARGE = {'items': [{'id': i, 'name': 'item'} for i in range(100)]}
+
+
+def db_value(pk):
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT json FROM tests_compressedjsonmodel WHERE id = %s', [pk])
+        return cursor.fetchone()[0]
+
+
+class CompressionTests(TestCase):
+    def test_small_value(self):
+        obj = CompressedJSONModel.objects.create(json={'a': 'b'})
+
+        self.assertEqual(db_value(obj.pk), '{"a": "b"}')
+        self.assertEqual(CompressedJSONModel.objects.get().json, {'a': 'b'})
+
+    def test_large_value(self):
+        obj = CompressedJSONModel.objects.create(json=LARGE)
+
+        self.assertTrue(db_value(obj.pk).startswith('zlib:'))
+        self.assertEqual(CompressedJSONModel.objects.get().json, LARGE)
+
+    def test_incompressible_value(self):
+        field = JSONField(compress='zlib', compress_threshold=100)
+        value = base64.b64encode(os.urandom(150)).decode()
+
+        self.assertFalse(is_compressed(field.get_prep_value(value)))
+        self.assertEqual(field.compressor.stats().incompressible, 1)
+
+    def test_legacy_value(self):
+        value = JSONField().get_prep_value(LARGE)
+        with connection.cursor() as cursor:
+            cursor.execute('INSERT INTO tests_compressedjsonmodel (json) VALUES (%s)', [value])
+
+        self.assertEqual(CompressedJSONModel.objects.get().json, LARGE)
+
+    def test_compression_disabled(self):
+        value = CompressedJSONModel._meta.get_field('json').get_prep_value(LARGE)
+
+        self.assertEqual(JSONField().from_db_value(value, None, connection), LARGE)
+
+    def test_exact_lookup(self):
+        CompressedJSONModel.objects.create(json=LARGE)
+
+        self.assertTrue(CompressedJSONModel.objects.filter(json=LARGE).exists())
+
+    def test_stats(self):
+        field = JSONField(compress='zlib', compress_threshold=10)
+        field.get_prep_value(LARGE)
+        field.get_prep_value({'a': 1})
+
+        stats = field.compressor.stats()
+        self.assertEqual(stats.compressed, 1)
+        self.assertEqual(stats.bytes_in, len(JSONField().get_prep_value(LARGE)))
+        self.assertLess(field.compressor.ratio, 0.5)
+
+    def test_batch(self):
+        field = CompressedJSONModel._meta.get_field('json')
+        prepared = field.prep_many([LARGE, {}])
+
+        self.assertTrue(is_compressed(prepared[0]))
+        self.assertEqual(field.load_many(prepared), [LARGE, {}])
+
+    def test_corrupt_value(self):
+        field = CompressedJSONModel._meta.get_field('json')
+        value = field.get_prep_value(LARGE)
+        corrupt = [value[:-6], value[:-4] + 'AAAA', 'zlib:not compressed']
+
+        for text in corrupt:
+            with self.subTest(text=text[-10:]), self.assertWarns(RuntimeWarning):
+                self.assertEqual(field.from_db_value(text, None, connection), text)
+        with self.assertWarns(RuntimeWarning):
+            self.assertEqual(field.load_paths(corrupt[0], ['items.0']), {})
+        with self.assertWarns(RuntimeWarning):
+            self.assertEqual(field.load_many([corrupt[0], value]), [corrupt[0], LARGE])
+
+    def test_serialization(self):
+        obj = CompressedJSONModel(json=LARGE)
+
+        self.assertFalse(is_compressed(obj._meta.get_field('json').value_to_string(obj)))
+
+    def test_deconstruct(self):
+        _, _, _, kwargs = CompressedJSONModel._meta.get_field('json').deconstruct()
+
+        self.assertEqual(kwargs['compress'], 'zlib')
+        self.assertEqual(kwargs['compress_threshold'], 100)
+
+    def test_unknown_codec(self):
+        with self.assertRaises(ImproperlyConfigured):
+            JSONField(compress='unknown')
+
+    @skipUnless(zstd, 'zstd is not available')
+    def test_zstd(self):
+        field = JSONField(compress='zstd', compress_threshold=10)
+        value = field.get_prep_value(LARGE)
+
+        self.assertTrue(value.startswith('zstd:'))
+        self.assertEqual(field.from_db_value(value, None, connection), LARGE)
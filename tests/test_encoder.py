@@ -0,0 +1,98 @@
+import datetime
+import json
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from jsonfield import encoder
+from jsonfield.encoder import CanonicalJSONEncoder, JSONEncoder, canonicalize, register_encoder
+
+
+class Point:
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+
+class Point3D(Point):
+    pass
+
+
+class Mapping:
+    def __getitem__(self, key):
+        raise KeyError(key)
+
+
+class EncoderTests(SimpleTestCase):
+    def setUp(self):
+        patcher = mock.patch.dict(encoder._encoders)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(encoder._handlers.clear)
+
+    def dumps(self, value):
+        return json.dumps(value, cls=JSONEncoder)
+
+    def test_types(self):
+        values = [
+            # (value, encoded)
+            (datetime.datetime(2020, 1, 2, tzinfo=datetime.timezone.utc), '"2020-01-02T00:00:00Z"'),
+            (datetime.date(2020, 1, 2), '"2020-01-02"'),
+            (datetime.time(1, 2), '"01:02:00"'),
+            (datetime.timedelta(minutes=1), '"60.0"'),
+            (Decimal('1.5'), '1.5'),
+            (b'bytes', '"bytes"'),
+            ({'a'}, '["a"]'),
+        ]
+
+        for value, encoded in values:
+            with self.subTest(value=value):
+                self.assertEqual(self.dumps(value), encoded)
+                # Resolved encoders are cached
+                self.assertEqual(self.dumps(value), encoded)
+
+    def test_aware_time(self):
+        with self.assertRaisesMessage(ValueError, "JSON can't represent timezone-aware times."):
+            self.dumps(datetime.time(1, 2, tzinfo=datetime.timezone.utc))
+
+    def test_unsupported(self):
+        for value in [object(), Mapping()]:
+            with self.subTest(value=value):
+                with self.assertRaisesMessage(TypeError, 'is not JSON serializable'):
+                    self.dumps(value)
+
+    def test_register_encoder(self):
+        with self.assertRaises(TypeError):
+            self.dumps(Point(1, 2))
+
+        register_encoder(Point, lambda obj: [obj.x, obj.y])
+        self.assertEqual(self.dumps(Point(1, 2)), '[1, 2]')
+        self.assertEqual(self.dumps(Point3D(1, 2)), '[1, 2]')
+
+    def test_register_encoder_subclass(self):
+        register_encoder(Point, lambda obj: [obj.x, obj.y])
+        self.assertEqual(self.dumps(Point3D(1, 2)), '[1, 2]')
+
+        register_encoder(Point3D, lambda obj: {'x': obj.x, 'y': obj.y})
+        self.assertEqual(self.dumps(Point3D(1, 2)), '{"x": 1, "y": 2}')
+        self.assertEqual(self.dumps(Point(1, 2)), '[1, 2]')
+
+
+class CanonicalEncoderTests(SimpleTestCase):
+    def test_canonicalize(self):
+        values = [
+            (1.0, 1),
+            (-0.0, 0),
+            (1.5, 1.5),
+            (1e20, 1e20),
+            ((1.0, [2.0]), [1, [2]]),
+            ({2.0: 'a', None: 'b', True: 'c'}, {'2': 'a', 'null': 'b', 'true': 'c'}),
+        ]
+        for value, expected in values:
+            with self.subTest(value=value):
+                result = canonicalize(value)
+                self.assertEqual(result, expected)
+                self.assertIs(type(result), type(expected))
+
+    def test_default(self):
+        self.assertEqual(json.dumps([Decimal('2.0'), Decimal('2.5')], cls=CanonicalJSONEncoder), '[2, 2.5]')
@@ -1,9 +1,15 @@
 import json
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
+from jsonfield.concurrency import get_executor, run_in_executor
 from jsonfield.fields import JSONField
-from jsonfield.json import JSONString
+from jsonfield.json import JSONString, RawJSON
+
+from .models import LazyJSONModel
 
 
 class TestFieldAPIMethods(TestCase):
@@ -53,6 +59,17 @@ class TestFieldAPIMethods(TestCase):
         self.assertEqual(kwargs['dump_kwargs'], {'separators': (',', ':')})
         self.assertEqual(kwargs['load_kwargs'], {'object_pairs_hook': dict})
 
+    def test_deconstruct_lazy(self):
+        _, _, _, kwargs = JSONField(lazy=True).deconstruct()
+
+        self.assertIs(kwargs['lazy'], True)
+
+    def test_from_db_value_lazy(self):
+        value = JSONField(lazy=True).from_db_value('{"a": "b"}', None, None)
+
+        self.assertIsInstance(value, RawJSON)
+        self.assertEqual(value, '{"a": "b"}')
+
     def test_from_db_value_loaded_types(self):
         values = [
             # (label, db value, loaded type)
@@ -70,3 +87,201 @@ class TestFieldAPIMethods(TestCase):
                 value = JSONField().from_db_value(db_value, None, None)
 
                 self.assertIsInstance(value, inst_type)
+
+
+class TestBatchMethods(TestCase):
+
+    def test_prep_many(self):
+        field = JSONField(null=True)
+        values = [{'a': 1}, None, RawJSON('[1, 2]'), 'text']
+
+        self.assertEqual(field.prep_many(values), [field.get_prep_value(value) for value in values])
+
+    def test_prep_many_executor(self):
+        field = JSONField()
+        values = [{'a': i} for i in range(10)]
+
+        with ThreadPoolExecutor(2) as executor:
+            prepared = field.prep_many(values, executor=executor, chunk_size=3)
+
+        self.assertEqual(prepared, [json.dumps(value) for value in values])
+
+    def test_load_many(self):
+        field = JSONField()
+        values = ['{"a": "b"}', '"test"', None]
+
+        loaded = field.load_many(values)
+        self.assertEqual(loaded, [{'a': 'b'}, 'test', None])
+        self.assertIsInstance(loaded[1], JSONString)
+
+    def test_load_many_executor(self):
+        field = JSONField()
+        values = [json.dumps({'a': i}) for i in range(10)]
+
+        with ThreadPoolExecutor(2) as executor:
+            loaded = field.load_many(values, executor=executor, chunk_size=3)
+
+        self.assertEqual(loaded, [{'a': i} for i in range(10)])
+
+    def test_load_many_invalid(self):
+        field = JSONField()
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            loaded = field.load_many(['{]', '1'])
+
+        self.assertEqual(len(w), 1)
+        self.assertEqual(loaded, ['{]', 1])
+        self.assertIsInstance(loaded[0], JSONString)
+
+
+class TestLoadCache(TestCase):
+
+    def test_cache(self):
+        field = JSONField(cache_size=2)
+
+        first = field.from_db_value('{"a": [1]}', None, None)
+        second = field.from_db_value('{"a": [1]}', None, None)
+        self.assertEqual(first, second)
+        self.assertEqual(field.load_cache.cache_info(), (1, 1, 0, 2, 1))
+
+        # Callers receive independent copies
+        second['a'].append(2)
+        self.assertEqual(field.from_db_value('{"a": [1]}', None, None), {'a': [1]})
+
+    def test_cache_string(self):
+        field = JSONField(cache_size=2)
+        field.from_db_value('"test"', None, None)
+
+        self.assertIsInstance(field.from_db_value('"test"', None, None), JSONString)
+        self.assertEqual(field.load_cache.hits, 1)
+
+    def test_cache_eviction(self):
+        field = JSONField(cache_size=2)
+        for value in ['1', '2', '1', '3', '1', '2']:
+            field.from_db_value(value, None, None)
+
+        self.assertEqual(field.load_cache.cache_info(), (2, 4, 0, 2, 2))
+
+    def test_cache_max_length(self):
+        field = JSONField(cache_size=2, cache_max_length=4)
+        field.from_db_value('[1, 2]', None, None)
+
+        self.assertEqual(field.load_cache.cache_info(), (0, 0, 1, 2, 0))
+
+    def test_cache_mutable_max_length(self):
+        # Mutable values are copied, which is only faster than decoding for tiny texts.
+        field = JSONField(cache_size=2)
+        field.from_db_value('[' + '1, ' * 20 + '1]', None, None)
+        self.assertEqual(field.load_cache.cache_info(), (0, 0, 1, 2, 0))
+
+        field = JSONField(cache_size=2, frozen=True)
+        field.from_db_value('[' + '1, ' * 20 + '1]', None, None)
+        self.assertEqual(field.load_cache.cache_info(), (0, 1, 0, 2, 1))
+
+    def test_cache_invalid(self):
+        field = JSONField(cache_size=2)
+
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter("always")
+            self.assertEqual(field.from_db_value('{]', None, None), '{]')
+
+        self.assertEqual(field.load_cache.cache_info().currsize, 0)
+
+    def test_deconstruct(self):
+        _, _, _, kwargs = JSONField(cache_size=2, cache_max_length=10).deconstruct()
+
+        self.assertEqual(kwargs['cache_size'], 2)
+        self.assertEqual(kwargs['cache_max_length'], 10)
+
+
+class TestCanonical(TestCase):
+
+    def test_get_prep_value(self):
+        field = JSONField(canonical=True)
+
+        self.assertEqual(field.get_prep_value({'b': 1.0, 'a': [-0.0, 1.5, 'é']}), '{"a":[0,1.5,"é"],"b":1}')
+        self.assertEqual(field.get_prep_value({1: 2, 'a': 3}), '{"1":2,"a":3}')
+
+    def test_deterministic(self):
+        field = JSONField(canonical=True)
+
+        self.assertEqual(
+            field.get_prep_value({'a': 1, 'b': {'c': 2.0, 'd': 3}}),
+            field.get_prep_value({'b': {'d': 3, 'c': 2}, 'a': 1.0}),
+        )
+
+    def test_content_hash(self):
+        field = JSONField()
+        value_hash = field.content_hash({'a': 1, 'b': [1.0, 2]})
+
+        self.assertEqual(len(value_hash), 64)
+        self.assertEqual(field.content_hash({'b': [1, 2.0], 'a': 1}), value_hash)
+        self.assertEqual(JSONField(canonical=True).content_hash({'b': [1, 2], 'a': 1}), value_hash)
+        self.assertEqual(field.content_hash(RawJSON('{"b": [1, 2], "a": 1.0}')), value_hash)
+        self.assertNotEqual(field.content_hash({'a': 1, 'b': [2, 1]}), value_hash)
+
+    def test_dump_kwargs(self):
+        with self.assertRaisesMessage(ValueError, "'canonical' and 'dump_kwargs' are mutually exclusive."):
+            JSONField(canonical=True, dump_kwargs={'indent': 4})
+
+    def test_deconstruct(self):
+        _, _, _, kwargs = JSONField(canonical=True).deconstruct()
+
+        self.assertEqual(kwargs, {'canonical': True})
+        JSONField(**kwargs)
+
+
+class TestAsync(TestCase):
+
+    async def test_aload(self):
+        field = JSONField(async_threshold=10)
+
+        with mock.patch('jsonfield.fields.run_in_executor', wraps=run_in_executor) as run:
+            self.assertEqual(await field.aload('[1, 2]'), [1, 2])
+            self.assertEqual(run.call_count, 0)
+            self.assertEqual(await field.aload('[1, 2, 3, 4]'), [1, 2, 3, 4])
+            self.assertEqual(run.call_count, 1)
+
+        self.assertIsNone(await field.aload(None))
+        self.assertIsInstance(await field.aload('"test"'), JSONString)
+
+    async def test_adump(self):
+        field = JSONField(async_threshold=20)
+
+        with mock.patch('jsonfield.fields.run_in_executor', wraps=run_in_executor) as run:
+            self.assertEqual(await field.adump([1, 2]), '[1, 2]')
+            self.assertEqual(run.call_count, 0)
+            self.assertEqual(await field.adump(['abcdefghijklmnop']), '["abcdefghijklmnop"]')
+            self.assertEqual(run.call_count, 1)
+
+    async def test_disabled(self):
+        field = JSONField(async_threshold=None)
+
+        with mock.patch('jsonfield.fields.run_in_executor') as run:
+            self.assertEqual(await field.aload('[1, 2, 3, 4]'), [1, 2, 3, 4])
+            self.assertEqual(await field.adump(['abcdefghijklmnop']), '["abcdefghijklmnop"]')
+        self.assertEqual(run.call_count, 0)
+
+    async def test_aget(self):
+        obj = await LazyJSONModel.objects.acreate(json={'a': 'b'})
+        obj = await LazyJSONModel.objects.aget(pk=obj.pk)
+        field = LazyJSONModel._meta.get_field('json')
+
+        self.assertIsInstance(obj.__dict__['json'], RawJSON)
+        self.assertEqual(await field.aget(obj), {'a': 'b'})
+        self.assertEqual(obj.__dict__['json'], {'a': 'b'})
+        self.assertFalse(obj.json_changed)
+
+    @override_settings(JSONFIELD_EXECUTOR='concurrent.futures.ThreadPoolExecutor')
+    def test_executor_setting(self):
+        executor = get_executor()
+
+        self.assertIs(get_executor(), executor)
+        with override_settings(JSONFIELD_EXECUTOR=None):
+            self.assertIsNot(get_executor(), executor)
+
+    def test_deconstruct_async_threshold(self):
+        _, _, _, kwargs = JSONField(async_threshold=None).deconstruct()
+
+        self.assertIsNone(kwargs['async_threshold'])
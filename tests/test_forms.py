@@ -1,6 +1,12 @@
+import datetime
+from unittest import mock
+
 from django import forms
 from django.test import TestCase
 
+from jsonfield.encoder import JSONEncoder
+from jsonfield.forms import InvalidJSONInput, JSONField
+
 from .models import JSONNotRequiredModel
 
 
@@ -119,6 +125,68 @@ class JSONModelFormTest(TestCase):
         form = self.form_class(data={'json': '[3, 4]'}, instance=instance)
         self.assertTrue(form.has_changed())
 
+    def test_has_changed(self):
+        field = JSONField(dump_kwargs={'cls': JSONEncoder})
+        values = [
+            # (initial, data, changed)
+            ({'a': 1, 'b': [1, 2]}, '{"b": [1,2],\n "a": 1}', False),
+            ({'a': 1}, '{"a": 1.0}', False),
+            ({'a': 1}, '{"a": true}', True),
+            ({'a': [1, 2]}, '{"a": [1, 2, 3]}', True),
+            ({'a': (1, 2)}, '{"a": [1, 2]}', False),
+            (datetime.date(2020, 1, 2), '"2020-01-02"', False),
+            (None, '', False),
+            ('', '', False),
+            ({}, '', True),
+            ({}, '{', True),
+        ]
+        for initial, data, changed in values:
+            with self.subTest(initial=initial, data=data):
+                self.assertIs(field.has_changed(initial, data), changed)
+
+    def test_decode_once(self):
+        form = self.form_class(data={'json': '{"a": [1, 2]}'})
+        field = form.fields['json']
+
+        with mock.patch.object(field, '_decode', wraps=field._decode) as decode, \
+                mock.patch.object(field, '_encode', wraps=field._encode) as encode:
+            form['json'].value()
+            self.assertTrue(form.is_valid())
+            self.assertTrue(form.has_changed())
+            form['json'].value()
+
+        # The cleaned value is handed out, so it's decoded again for `has_changed` and rendering.
+        self.assertEqual(decode.call_count, 2)
+        self.assertEqual(encode.call_count, 2)
+        self.assertEqual(form.cleaned_data['json'], {'a': [1, 2]})
+
+    def test_modified_cleaned_data(self):
+        class Form(self.form_class):
+            def clean_json(self):
+                value = self.cleaned_data['json']
+                value['added'] = True
+                return value
+
+        instance = JSONNotRequiredModel.objects.create(json={'a': 1})
+        form = Form(data={'json': '{"a": 1}'}, instance=instance)
+        form['json'].value()
+
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data['json'], {'a': 1, 'added': True})
+        self.assertEqual(form['json'].value(), '{\n    "a": 1\n}')
+        self.assertFalse(form.has_changed())
+
+    def test_parse(self):
+        field = JSONField()
+        value = field.parse('[1]')
+        self.assertEqual(value, '[1]')
+        self.assertEqual(value.value, [1])
+        self.assertIs(field.parse('[1]'), value)
+        self.assertIsNot(field.parse('[2]'), value)
+
+        self.assertEqual(field.parse('"a"').value, 'a')
+        self.assertIsInstance(field.parse('['), InvalidJSONInput)
+
 
 class NonJSONFieldModelFormTest(TestCase):
     """Test model form behavior when field class has been overridden."""
@@ -0,0 +1,220 @@
+import json
+from collections import OrderedDict
+from decimal import Decimal
+
+from django.db import connection
+from django.test import SimpleTestCase
+
+from jsonfield.functions import compile_path, json_path
+from jsonfield.json import (
+    JSONPatchError,
+    JSONString,
+    apply_patch,
+    exceeds_size,
+    extract,
+    iterload,
+    load_paths,
+    set_path,
+)
+
+
+class IterloadTests(SimpleTestCase):
+    def test_array(self):
+        items = list(iterload(' [1, "a", {"b": [2.5]}, [], null] '))
+
+        self.assertEqual(items, [1, 'a', {'b': [2.5]}, [], None])
+        self.assertIsInstance(items[1], JSONString)
+
+    def test_object(self):
+        items = list(iterload('{"a": 1, "b" : "c", "d": {}}'))
+
+        self.assertEqual(items, [('a', 1), ('b', 'c'), ('d', {})])
+        self.assertIsInstance(items[1][1], JSONString)
+
+    def test_empty(self):
+        self.assertEqual(list(iterload('[ ]')), [])
+        self.assertEqual(list(iterload('{ }')), [])
+
+    def test_decoded(self):
+        self.assertEqual(list(iterload([1, 2])), [1, 2])
+        self.assertEqual(list(iterload({'a': 1})), [('a', 1)])
+
+    def test_load_kwargs(self):
+        items = list(iterload('[1.5, {"a": 1}]', parse_float=Decimal, object_pairs_hook=OrderedDict))
+
+        self.assertEqual(items, [Decimal('1.5'), OrderedDict(a=1)])
+        self.assertIsInstance(items[1], OrderedDict)
+
+    def test_incremental(self):
+        items = iterload('[1, 2, {]')
+
+        self.assertEqual(next(items), 1)
+        self.assertEqual(next(items), 2)
+        with self.assertRaises(json.JSONDecodeError):
+            next(items)
+
+    def test_invalid(self):
+        values = [
+            # (value, error message)
+            ('1', "Expecting '[' or '{'"),
+            ('[1 2]', "Expecting ',' delimiter"),
+            ('[1,]', 'Expecting value'),
+            ('{1: 2}', 'Expecting property name enclosed in double quotes'),
+            ('{"a" 1}', "Expecting ':' delimiter"),
+            ('[1] 2', 'Extra data'),
+            ('[1', "Expecting ',' delimiter"),
+        ]
+
+        for value, message in values:
+            with self.subTest(value=value):
+                with self.assertRaisesMessage(json.JSONDecodeError, message):
+                    list(iterload(value))
+
+    def test_scalar(self):
+        for value in [1, None, JSONString('a')]:
+            with self.subTest(value=value):
+                with self.assertRaises(TypeError):
+                    iterload(value)
+
+
+class ExtractTests(SimpleTestCase):
+    def test_extract(self):
+        value = {'a': {'b': [1, {'c': 2}]}}
+
+        self.assertEqual(extract(value, ['a', 'b', '1', 'c']), 2)
+        self.assertEqual(extract(value, ['a', 'b', '0']), 1)
+        self.assertIsNone(extract(value, ['a', 'x']))
+        self.assertIsNone(extract(value, ['a', 'b', '5']))
+        self.assertIsNone(extract(value, ['a', 'b', 'x']))
+        self.assertIsNone(extract(value, ['a', 'b', '0', 'c']))
+        self.assertIsNone(extract(None, ['a']))
+
+
+class LoadPathsTests(SimpleTestCase):
+    def test_object(self):
+        value = '{"a": {"b": [1, "x"]}, "c": null, "d": "large"}'
+
+        self.assertEqual(load_paths(value, ['a.b.1', 'c', 'a.z', 'x']), {'a.b.1': 'x', 'c': None})
+        self.assertEqual(load_paths(value, [('a', 'b')]), {('a', 'b'): [1, 'x']})
+
+    def test_stops_early(self):
+        # The invalid trailing member isn't decoded.
+        value = '{"a": 1, "b": "%s", "c": }' % ('x' * 5000)
+        self.assertEqual(load_paths(value, ['a']), {'a': 1})
+
+        with self.assertRaises(json.JSONDecodeError):
+            load_paths(value, ['c'])
+
+    def test_late_members(self):
+        # Members after the first few are decoded at once.
+        document = {f'k{i}': [i, 'x' * 100] for i in range(100)}
+        document['s'] = 'x'
+        value = json.dumps(document)
+
+        self.assertEqual(load_paths(value, ['k0', 'k99.1', 'x']), {'k0': [0, 'x' * 100], 'k99.1': 'x' * 100})
+        self.assertIsInstance(load_paths(value, ['s'])['s'], JSONString)
+        self.assertEqual(load_paths(value, ['k50'], object_pairs_hook=OrderedDict), {'k50': [50, 'x' * 100]})
+
+        with self.assertRaises(json.JSONDecodeError):
+            load_paths(value[:-1] + ', }', ['x'])
+
+    def test_array(self):
+        self.assertEqual(load_paths('[1, {"a": 2}]', ['1.a', '2']), {'1.a': 2})
+
+    def test_loaded(self):
+        self.assertEqual(load_paths({'a': 1}, ['a']), {'a': 1})
+        self.assertEqual(load_paths(JSONString('{"a": 1}'), ['a']), {})
+
+    def test_load_kwargs(self):
+        value = load_paths('{"a": {"b": 1.5}}', ['a'], parse_float=Decimal)
+
+        self.assertEqual(value, {'a': {'b': Decimal('1.5')}})
+
+
+class JSONPathTests(SimpleTestCase):
+    def test_json_path(self):
+        self.assertEqual(json_path(('a', '0', 'b c')), '$."a"[0]."b c"')
+        self.assertEqual(json_path(()), '$')
+
+        with self.assertRaises(ValueError):
+            json_path(('a"',))
+
+    def test_compile_path(self):
+        document = ('"t"."json"', [])
+        self.assertEqual(compile_path(connection, document, ('a', 0, 'b c')), ('%s', ['$."a"[0]."b c"']))
+
+        sql, params = compile_path(connection, document, ('a', '0', 'b'))
+        self.assertEqual(sql.count('CASE'), 1)
+        self.assertEqual(params, ['$."a"', '$."a"', 'array', '[0]', '."0"', '."b"'])
+
+
+class SetPathTests(SimpleTestCase):
+    def test_set_path(self):
+        values = [
+            (('a',), {'a': 'v', 'b': [1, 2]}),
+            (('c',), {'a': 1, 'b': [1, 2], 'c': 'v'}),
+            (('b', '1'), {'a': 1, 'b': [1, 'v']}),
+            (('b', '2'), {'a': 1, 'b': [1, 2]}),
+            (('x', 'y'), {'a': 1, 'b': [1, 2]}),
+            (('a', 'y'), {'a': 1, 'b': [1, 2]}),
+            ((), 'v'),
+        ]
+        for path, expected in values:
+            with self.subTest(path=path):
+                self.assertEqual(set_path({'a': 1, 'b': [1, 2]}, path, 'v'), expected)
+
+
+class ApplyPatchTests(SimpleTestCase):
+    def test_operations(self):
+        values = [
+            ({'op': 'add', 'path': '/baz', 'value': 'qux'}, {'foo': [1, 2], 'a/b': {'~': 0}, 'baz': 'qux'}),
+            ({'op': 'add', 'path': '/foo/1', 'value': 3}, {'foo': [1, 3, 2], 'a/b': {'~': 0}}),
+            ({'op': 'add', 'path': '/foo/-', 'value': 3}, {'foo': [1, 2, 3], 'a/b': {'~': 0}}),
+            ({'op': 'add', 'path': '', 'value': [1]}, [1]),
+            ({'op': 'remove', 'path': '/foo/0'}, {'foo': [2], 'a/b': {'~': 0}}),
+            ({'op': 'remove', 'path': '/a~1b/~0'}, {'foo': [1, 2], 'a/b': {}}),
+            ({'op': 'replace', 'path': '/foo', 'value': 0}, {'foo': 0, 'a/b': {'~': 0}}),
+            ({'op': 'move', 'from': '/foo/0', 'path': '/bar'}, {'foo': [2], 'a/b': {'~': 0}, 'bar': 1}),
+            ({'op': 'copy', 'from': '/a~1b', 'path': '/foo/0'}, {'foo': [{'~': 0}, 1, 2], 'a/b': {'~': 0}}),
+            ({'op': 'test', 'path': '/foo', 'value': [1, 2]}, {'foo': [1, 2], 'a/b': {'~': 0}}),
+        ]
+        for operation, expected in values:
+            with self.subTest(operation=operation):
+                self.assertEqual(apply_patch({'foo': [1, 2], 'a/b': {'~': 0}}, [operation]), expected)
+
+    def test_errors(self):
+        operations = [
+            {'op': 'invalid', 'path': '/foo'},
+            {'op': 'add', 'path': '/foo'},
+            {'op': 'add', 'path': 'foo', 'value': 1},
+            {'op': 'add', 'path': '/x/y', 'value': 1},
+            {'op': 'add', 'path': '/foo/3', 'value': 1},
+            {'op': 'add', 'path': '/foo/01', 'value': 1},
+            {'op': 'remove', 'path': '/x'},
+            {'op': 'remove', 'path': ''},
+            {'op': 'replace', 'path': '/foo/2', 'value': 1},
+            {'op': 'move', 'from': '/foo', 'path': '/foo/0'},
+            {'op': 'copy', 'from': '/x', 'path': '/y'},
+            {'op': 'test', 'path': '/foo/0', 'value': True},
+            {'op': 'test', 'path': '/foo', 'value': [1]},
+        ]
+        for operation in operations:
+            with self.subTest(operation=operation):
+                with self.assertRaises(JSONPatchError):
+                    apply_patch({'foo': [1, 2]}, [operation])
+
+
+class ExceedsSizeTests(SimpleTestCase):
+    def test_exceeds_size(self):
+        value = {'key': ['a' * 10, 1, None, {'b': True}]}
+        size = len(json.dumps(value))
+
+        self.assertTrue(exceeds_size(value, size // 2))
+        self.assertFalse(exceeds_size(value, size * 2))
+        self.assertTrue(exceeds_size('a' * 100, 100))
+        self.assertFalse(exceeds_size(1, 10))
+
+    def test_bounded(self):
+        # Traversal stops once the size is exceeded.
+        value = [['a' * 10]] + [object()] * 1000
+        self.assertTrue(exceeds_size(value, 10))
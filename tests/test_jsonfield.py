@@ -1,14 +1,26 @@
+import copy
+import pickle
 import warnings
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from unittest import mock
 
 from django.core.serializers import deserialize, serialize
 from django.core.serializers.base import DeserializationError
+from django.db import DatabaseError, connection, transaction
 from django.forms import ValidationError
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from jsonfield import save_changed_json
+from jsonfield.backends import JSONBackend
+from jsonfield.functions import JSONExtract, JSONSet
+from jsonfield.json import FrozenDict, FrozenList, JSONPatchError, PartialJSON, RawJSON
 
 from .models import (
     CallableDefaultModel,
+    FrozenJSONModel,
     GenericForeignKeyObj,
     JSONCharModel,
     JSONModel,
@@ -16,6 +28,8 @@ from .models import (
     JSONModelWithForeignKey,
     JSONNotRequiredModel,
     JSONRequiredModel,
+    KeyedJSONModel,
+    LazyJSONModel,
     MTIChildModel,
     MTIParentModel,
     OrderedJSONModel,
@@ -259,6 +273,414 @@ class JSONCharFieldTest(JSONFieldTest):
     json_model = JSONCharModel
 
 
+class LazyJSONFieldTest(JSONFieldTest):
+    json_model = LazyJSONModel
+
+    def test_not_decoded_until_accessed(self):
+        obj = LazyJSONModel.objects.create(json={'a': 'b'})
+        instance = LazyJSONModel.objects.get(pk=obj.pk)
+
+        self.assertIsInstance(instance.__dict__['json'], RawJSON)
+        self.assertEqual(instance.json, {'a': 'b'})
+        self.assertEqual(instance.__dict__['json'], {'a': 'b'})
+
+    def test_save_unaccessed_value(self):
+        obj = LazyJSONModel.objects.create(json={'a': 'b'})
+        instance = LazyJSONModel.objects.get(pk=obj.pk)
+
+        field = LazyJSONModel._meta.get_field('json')
+        encode = mock.Mock(wraps=field._encode)
+
+        with mock.patch.dict(field.__dict__, _encode=encode):
+            instance.save(update_fields=['json'])
+            encode.assert_not_called()
+
+            # The raw value is persisted as-is
+            self.assertIsInstance(instance.__dict__['json'], RawJSON)
+            self.assertEqual(LazyJSONModel.objects.get(pk=obj.pk).json, {'a': 'b'})
+
+            # Decoded values are encoded when saved.
+            instance.json['c'] = 'd'
+            instance.save(update_fields=['json'])
+            encode.assert_called_once_with({'a': 'b', 'c': 'd'})
+
+    def test_iterload(self):
+        obj = LazyJSONModel.objects.create(json={'a': 'b', 'c': [1]})
+        instance = LazyJSONModel.objects.get(pk=obj.pk)
+
+        self.assertEqual(list(LazyJSONModel.json.field.iterload(instance)), [('a', 'b'), ('c', [1])])
+        # The value itself isn't decoded
+        self.assertIsInstance(instance.__dict__['json'], RawJSON)
+
+        instance.json = [1, 2]
+        self.assertEqual(list(LazyJSONModel.json.field.iterload(instance)), [1, 2])
+
+    def test_deferred_value(self):
+        obj = LazyJSONModel.objects.create(json={'a': 'b'})
+        instance = LazyJSONModel.objects.defer('json').get(pk=obj.pk)
+
+        self.assertEqual(instance.json, {'a': 'b'})
+
+    def test_load_invalid_json(self):
+        from django.db import connection
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'INSERT INTO tests_lazyjsonmodel (json, default_json, complex_default_json, empty_default) '
+                'VALUES ("foo", "{}", "[]", "{}")'
+            )
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            instance = LazyJSONModel.objects.get()
+            self.assertEqual(len(w), 0)
+            self.assertEqual(instance.json, 'foo')
+
+        self.assertEqual(len(w), 1)
+        self.assertIs(w[0].category, RuntimeWarning)
+
+
+class BulkTests(TestCase):
+    def test_bulk_create(self):
+        objs = [JSONModel(json={'a': i}) for i in range(5)]
+
+        with mock.patch.object(JSONBackend, 'get_encoder', autospec=True, side_effect=JSONBackend.get_encoder) as m:
+            JSONModel.objects.bulk_create(objs)
+
+        # Once per JSON field
+        self.assertEqual(m.call_count, 4)
+        self.assertEqual(objs[0].json, {'a': 0})
+        self.assertEqual(sorted(obj.json['a'] for obj in JSONModel.objects.all()), list(range(5)))
+
+    def test_bulk_update(self):
+        JSONModel.objects.bulk_create([JSONModel(json={'a': i}) for i in range(5)])
+        objs = list(JSONModel.objects.all())
+        for obj in objs:
+            obj.json['a'] += 10
+
+        with ThreadPoolExecutor(2) as executor:
+            JSONModel.objects.bulk_update(objs, ['json'], json_executor=executor)
+
+        self.assertEqual(sorted(obj.json['a'] for obj in JSONModel.objects.all()), list(range(10, 15)))
+
+    def test_bulk_update_lazy(self):
+        LazyJSONModel.objects.bulk_create([LazyJSONModel(json={'a': i}) for i in range(5)])
+        objs = list(LazyJSONModel.objects.all())
+        objs[0].json['a'] = 10
+
+        LazyJSONModel.objects.bulk_update(objs, ['json', 'default_json'])
+
+        # Unaccessed values aren't decoded
+        self.assertIsInstance(objs[1].__dict__['json'], RawJSON)
+        self.assertEqual(sorted(obj.json['a'] for obj in LazyJSONModel.objects.all()), [1, 2, 3, 4, 10])
+
+    def test_bulk_update_failed(self):
+        obj = LazyJSONModel.objects.create(json={'a': 1})
+        obj = LazyJSONModel.objects.get(pk=obj.pk)
+        obj.json['a'] = 2
+
+        with mock.patch('django.db.models.QuerySet.bulk_update', side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                LazyJSONModel.objects.bulk_update([obj], ['json'])
+
+        self.assertEqual(obj.json, {'a': 2})
+        self.assertTrue(obj.json_changed)
+
+        LazyJSONModel.objects.bulk_update([obj], ['json'])
+        self.assertFalse(obj.json_changed)
+
+
+class JSONOnlyTests(TestCase):
+    def setUp(self):
+        JSONModel.objects.create(json={'a': {'b': [1, 'x']}, 'c': None, 'd': 'large'})
+
+    def test_json_only(self):
+        obj = JSONModel.objects.json_only('json', ['a.b.1', 'c', 'a.z', 'd.e']).get()
+
+        self.assertIsInstance(obj.json, PartialJSON)
+        self.assertEqual(obj.json, {'a.b.1': 'x', 'c': None})
+        self.assertEqual(obj.default_json, {'check': 12})
+
+    def test_extracted(self):
+        with CaptureQueriesContext(connection) as queries:
+            list(JSONModel.objects.json_only('json', ['a.b']))
+        self.assertIn('->', queries[0]['sql'])
+
+    @mock.patch.object(JSONExtract, 'supports', return_value=False)
+    def test_not_extracted(self, supports):
+        obj = JSONModel.objects.json_only('json', ['a.b.1', 'c', 'a.z', 'd.e']).get()
+
+        self.assertEqual(obj.json, {'a.b.1': 'x', 'c': None})
+
+    def test_numeric_keys(self):
+        # Numeric keys are indexes of arrays, and keys of objects.
+        JSONModel.objects.all().delete()
+        JSONModel.objects.create(json={'scores': {'2020': 5}, 'items': [{'id': 1}], '0': 'zero'})
+        paths = ['scores.2020', 'items.0.id', '0', 'items.1']
+
+        self.assertEqual(JSONModel.objects.json_only('json', paths).get().json, {
+            'scores.2020': 5, 'items.0.id': 1, '0': 'zero',
+        })
+        with mock.patch.object(JSONExtract, 'supports', return_value=False):
+            self.assertEqual(JSONModel.objects.json_only('json', paths).get().json, {
+                'scores.2020': 5, 'items.0.id': 1, '0': 'zero',
+            })
+
+    def test_frozen(self):
+        FrozenJSONModel.objects.create(json={'a': {'b': [1]}})
+        obj = FrozenJSONModel.objects.json_only('json', ['a']).get()
+
+        self.assertIsInstance(obj.json['a'], FrozenDict)
+
+    def test_chained(self):
+        qs = JSONModel.objects.json_only('json', ['c']).json_only('default_json', ['check'])
+
+        self.assertEqual(qs.get().default_json, {'check': 12})
+        self.assertEqual(qs.filter(pk__gt=0).get().json, {'c': None})
+
+    def test_save(self):
+        obj = JSONModel.objects.json_only('json', ['c']).get()
+
+        msg = "tests.JSONModel.json is only partially loaded, and can't be saved."
+        with self.assertRaisesMessage(ValueError, msg), transaction.atomic():
+            obj.save()
+
+        obj.save(update_fields=['default_json'])
+        save_changed_json(obj)
+        self.assertEqual(JSONModel.objects.get().json['d'], 'large')
+
+
+class JSONUpdateTests(TestCase):
+    def setUp(self):
+        JSONModel.objects.create(json={'a': {'b': [1, 2]}, 'c': 'd'})
+        JSONModel.objects.create(json={'a': None})
+
+    def values(self):
+        return list(JSONModel.objects.order_by('pk').values_list('json', flat=True))
+
+    def test_json_set(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(JSONModel.objects.json_set('json', 'a.b.1', {'x': Decimal('1.5')}), 2)
+        self.assertEqual(len(queries), 1)
+        self.assertIn('json_set', queries[0]['sql'])
+
+        self.assertEqual(self.values(), [{'a': {'b': [1, {'x': 1.5}]}, 'c': 'd'}, {'a': None}])
+
+    @mock.patch.object(JSONSet, 'supports', return_value=False)
+    def test_json_set_fallback(self, supports):
+        self.assertEqual(JSONModel.objects.json_set('json', 'a.b.1', {'x': Decimal('1.5')}), 2)
+
+        self.assertEqual(self.values(), [{'a': {'b': [1, {'x': 1.5}]}, 'c': 'd'}, {'a': None}])
+
+    def test_json_set_fallback_consistency(self):
+        # The database and fallback behave the same
+        for path in ['c', 'e', 'a.e', 'a.b.0', 'a.b.5', 'x.y', 'c.x', '2020', 'a.2020', 'a.b.2020']:
+            with self.subTest(path=path):
+                with transaction.atomic():
+                    JSONModel.objects.json_set('json', path, 'value')
+                    expected = self.values()
+                    transaction.set_rollback(True)
+                with mock.patch.object(JSONSet, 'supports', return_value=False), transaction.atomic():
+                    JSONModel.objects.json_set('json', path, 'value')
+                    self.assertEqual(self.values(), expected)
+                    transaction.set_rollback(True)
+
+    def test_json_set_invalid(self):
+        # Rows with invalid text are left unchanged, rather than failing the update.
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE tests_jsonmodel SET json = '{\"a\": ' WHERE json LIKE '%%null%%'")
+        self.assertEqual(JSONModel.objects.json_set('json', 'a', 5), 2)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            self.assertEqual(self.values(), [{'a': 5, 'c': 'd'}, '{"a": '])
+
+    def test_json_set_numeric_key(self):
+        JSONModel.objects.json_set('json', 'a.2020', 5)
+
+        self.assertEqual(self.values(), [{'a': {'b': [1, 2], '2020': 5}, 'c': 'd'}, {'a': None}])
+
+    def test_json_set_ordered(self):
+        # Fields with `load_kwargs` are updated in Python, as the database may reorder keys.
+        OrderedJSONModel.objects.create(json=OrderedDict([('b', 1), ('a', {'d': 2, 'c': 3})]))
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(OrderedJSONModel.objects.json_set('json', 'a.e', 4), 1)
+        self.assertNotIn('json_set', queries[-1]['sql'])
+
+        value = OrderedJSONModel.objects.get().json
+        self.assertEqual(list(value), ['b', 'a'])
+        self.assertEqual(list(value['a']), ['d', 'c', 'e'])
+
+    def test_json_set_root(self):
+        JSONModel.objects.filter(json__contains='"c"').json_set('json', '', [1])
+
+        self.assertEqual(self.values(), [[1], {'a': None}])
+
+    def test_json_set_filtered(self):
+        JSONModel.objects.filter(json__contains='"c"').json_set('json', 'c', 'e')
+
+        self.assertEqual(self.values(), [{'a': {'b': [1, 2]}, 'c': 'e'}, {'a': None}])
+
+    def test_json_set_key_fields(self):
+        obj = KeyedJSONModel.objects.create(json={'customer': {'id': 5}})
+        KeyedJSONModel.objects.json_set('json', 'customer.id', 6)
+
+        obj.refresh_from_db()
+        self.assertEqual(obj.json, {'customer': {'id': 6}})
+        self.assertEqual(obj.customer_id, 6)
+
+    def test_json_patch(self):
+        updated = JSONModel.objects.filter(json__contains='"c"').json_patch('json', [
+            {'op': 'add', 'path': '/a/b/-', 'value': 3},
+            {'op': 'move', 'from': '/c', 'path': '/e'},
+        ])
+
+        self.assertEqual(updated, 1)
+        self.assertEqual(self.values(), [{'a': {'b': [1, 2, 3]}, 'e': 'd'}, {'a': None}])
+
+    def test_json_patch_error(self):
+        with self.assertRaises(JSONPatchError):
+            JSONModel.objects.json_patch('json', [
+                {'op': 'replace', 'path': '/a', 'value': 1},
+                {'op': 'test', 'path': '/c', 'value': 'd'},
+            ])
+
+        self.assertEqual(self.values(), [{'a': {'b': [1, 2]}, 'c': 'd'}, {'a': None}])
+
+    def test_json_patch_frozen(self):
+        FrozenJSONModel.objects.create(json={'a': [1]})
+        FrozenJSONModel.objects.json_patch('json', [{'op': 'add', 'path': '/a/0', 'value': 0}])
+
+        self.assertEqual(FrozenJSONModel.objects.get().json, {'a': [0, 1]})
+
+    def test_sliced(self):
+        with self.assertRaisesMessage(TypeError, 'Cannot update a query once a slice has been taken.'):
+            JSONModel.objects.all()[:1].json_patch('json', [])
+
+
+class ChangeTrackingTests(TestCase):
+    def setUp(self):
+        obj = LazyJSONModel.objects.create(json={'a': 'b'})
+        self.instance = LazyJSONModel.objects.get(pk=obj.pk)
+
+    def test_unaccessed(self):
+        self.assertFalse(self.instance.json_changed)
+
+    def test_accessed(self):
+        self.instance.json
+        self.assertFalse(self.instance.json_changed)
+
+    def test_modified(self):
+        self.instance.json['a'] = 'c'
+        self.assertTrue(self.instance.json_changed)
+
+    def test_assigned(self):
+        self.instance.json = {'a': 'b'}
+        self.assertFalse(self.instance.json_changed)
+
+        self.instance.json = {'a': 'c'}
+        self.assertTrue(self.instance.json_changed)
+
+    def test_saved(self):
+        self.instance.json['a'] = 'c'
+        self.instance.save()
+        self.assertFalse(self.instance.json_changed)
+
+    def test_new_instance(self):
+        self.assertTrue(LazyJSONModel(json={}).json_changed)
+
+    def test_refreshed(self):
+        LazyJSONModel.objects.update(json={'a': 'c'})
+        self.instance.refresh_from_db()
+
+        self.assertEqual(self.instance.json, {'a': 'c'})
+        self.assertFalse(self.instance.json_changed)
+        self.instance.json['a'] = 'b'
+        self.assertTrue(self.instance.json_changed)
+
+    def test_deferred(self):
+        instance = LazyJSONModel.objects.defer('json').get()
+        LazyJSONModel.objects.update(json={'a': 'c'})
+
+        self.assertEqual(instance.json, {'a': 'c'})
+        self.assertFalse(instance.json_changed)
+
+    def test_copied(self):
+        # Values of other rows aren't compared with their text.
+        other = LazyJSONModel.objects.create(json={'a': 'c'})
+        other.json = self.instance.json
+        self.assertTrue(other.json_changed)
+
+    def test_save_changed_json(self):
+        self.instance.json['a'] = 'c'
+        self.instance.default_json
+
+        with CaptureQueriesContext(connection) as ctx:
+            save_changed_json(self.instance)
+
+        self.assertEqual(len(ctx.captured_queries), 1)
+        sql = ctx.captured_queries[0]['sql']
+        self.assertIn('"json"', sql)
+        self.assertNotIn('default_json', sql)
+        self.assertNotIn('empty_default', sql)
+        self.assertEqual(LazyJSONModel.objects.get().json, {'a': 'c'})
+
+    def test_save_changed_json_unchanged(self):
+        with CaptureQueriesContext(connection) as ctx:
+            save_changed_json(self.instance)
+
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+
+class FrozenJSONFieldTests(TestCase):
+    def test_default(self):
+        first, second = FrozenJSONModel(), FrozenJSONModel()
+
+        self.assertIsInstance(first.default_json, FrozenDict)
+        self.assertIsInstance(first.default_json['check'], FrozenList)
+        self.assertIs(first.default_json, second.default_json)
+
+    def test_immutable(self):
+        value = FrozenJSONModel().default_json
+
+        with self.assertRaises(TypeError):
+            value['check'] = 1
+        with self.assertRaises(TypeError):
+            value['check'].append(1)
+
+    def test_thaw(self):
+        value = FrozenJSONModel().default_json.thaw()
+        value['check'].append(13)
+
+        self.assertEqual(value, {'check': [12, 13]})
+        self.assertIs(type(value['check']), list)
+        self.assertEqual(FrozenJSONModel().default_json, {'check': [12]})
+
+    def test_loaded(self):
+        FrozenJSONModel.objects.create(json={'a': [1, {'b': 2}]})
+        first, second = FrozenJSONModel.objects.all().union(FrozenJSONModel.objects.all(), all=True)
+
+        self.assertEqual(first.json, {'a': [1, {'b': 2}]})
+        self.assertIsInstance(first.json['a'][1], FrozenDict)
+        # Cached values are shared
+        self.assertIs(first.json, second.json)
+
+    def test_save(self):
+        instance = FrozenJSONModel.objects.create(json={'a': 'b'})
+        instance.refresh_from_db()
+        instance.save()
+
+        self.assertEqual(FrozenJSONModel.objects.get().json, {'a': 'b'})
+
+    def test_copy(self):
+        value = FrozenJSONModel().default_json
+
+        self.assertIs(copy.deepcopy(value), value)
+        self.assertEqual(pickle.loads(pickle.dumps(value)), value)
+        self.assertIsInstance(pickle.loads(pickle.dumps(value)), FrozenDict)
+
+
 class MiscTests(TestCase):
     def test_load_kwargs_hook(self):
         data = OrderedDict([
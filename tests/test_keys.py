@@ -0,0 +1,122 @@
+from django.core import checks
+from django.db import connection, models
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext, isolate_apps
+
+from jsonfield import JSONField, save_changed_json
+from jsonfield.json import RawJSON
+from jsonfield.keys import IntegerKeyField
+
+from .models import KeyedJSONModel
+
+
+class KeyFieldTests(TestCase):
+    def test_save(self):
+        obj = KeyedJSONModel.objects.create(json={'customer': {'id': 5}, 'tags': ['a', 'b']})
+        self.assertEqual(obj.customer_id, 5)
+        self.assertEqual(obj.first_tag, 'a')
+
+        obj.json = {'customer': {'id': '6'}}
+        obj.save()
+        obj = KeyedJSONModel.objects.get()
+        self.assertEqual(obj.customer_id, 6)
+        self.assertIsNone(obj.first_tag)
+
+    def test_invalid_value(self):
+        # Values that can't be converted are stored as null.
+        obj = KeyedJSONModel.objects.create(json={'customer': {'id': 'abc'}})
+        self.assertIsNone(obj.customer_id)
+        self.assertIsNone(KeyedJSONModel.objects.get().customer_id)
+
+    def test_update_fields(self):
+        obj = KeyedJSONModel.objects.create(json={'customer': {'id': 5}})
+        obj.json = {'customer': {'id': 7}}
+
+        msg = "tests.KeyedJSONModel.customer_id would be left stale, as 'json' is saved without it."
+        with self.assertRaisesMessage(ValueError, msg):
+            obj.save(update_fields=['json'])
+
+        obj.save(update_fields=['json', 'customer_id', 'first_tag'])
+        self.assertEqual(KeyedJSONModel.objects.filter(json__customer_id=7).count(), 1)
+
+        obj = KeyedJSONModel.objects.get()
+        obj.json['customer']['id'] = 8
+        save_changed_json(obj)
+        self.assertEqual(KeyedJSONModel.objects.filter(json__customer_id=8).count(), 1)
+
+    def test_queryset_update(self):
+        KeyedJSONModel.objects.create(json={'customer': {'id': 5}})
+        KeyedJSONModel.objects.update(json={'customer': {'id': 7}, 'tags': ['x']})
+
+        obj = KeyedJSONModel.objects.get()
+        self.assertEqual((obj.customer_id, obj.first_tag), (7, 'x'))
+
+        with self.assertRaises(ValueError):
+            KeyedJSONModel.objects.update(json=models.F('json'))
+
+    def test_lookup(self):
+        KeyedJSONModel.objects.create(json={'customer': {'id': 5}})
+        KeyedJSONModel.objects.create(json={'customer': {'id': 6}})
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(KeyedJSONModel.objects.filter(json__customer_id=5).count(), 1)
+        self.assertIn('"customer_id" = 5', queries[0]['sql'])
+
+        self.assertEqual(KeyedJSONModel.objects.filter(json__customer_id__gt=5).get().customer_id, 6)
+        self.assertEqual(KeyedJSONModel.objects.filter(json__customer_id__in=[5, 6]).count(), 2)
+        self.assertEqual(
+            list(KeyedJSONModel.objects.order_by('-json__customer_id').values_list('customer_id', flat=True)),
+            [6, 5],
+        )
+
+    def test_unaccessed_source(self):
+        KeyedJSONModel.objects.create(json={'customer': {'id': 5}})
+        obj = KeyedJSONModel.objects.get()
+        obj.save()
+
+        # The lazy value wasn't decoded to extract the key.
+        self.assertIsInstance(obj.__dict__['json'], RawJSON)
+        self.assertEqual(KeyedJSONModel.objects.get().customer_id, 5)
+
+    def test_bulk_create(self):
+        KeyedJSONModel.objects.bulk_create([KeyedJSONModel(json={'customer': {'id': 5}})])
+
+        self.assertEqual(KeyedJSONModel.objects.get().customer_id, 5)
+
+    def test_encoded_source(self):
+        # Values are encoded before saving by bulk operations.
+        field = KeyedJSONModel._meta.get_field('customer_id')
+        obj = KeyedJSONModel(json=RawJSON('{"customer": {"id": 6}}'))
+
+        self.assertEqual(field.pre_save(obj, True), 6)
+
+    def test_bulk_update(self):
+        obj = KeyedJSONModel.objects.create(json={'customer': {'id': 5}})
+        obj.json = {'customer': {'id': 6}}
+        KeyedJSONModel.objects.bulk_update([obj], ['json'])
+
+        self.assertEqual(KeyedJSONModel.objects.get().customer_id, 6)
+
+    def test_deconstruct(self):
+        name, path, args, kwargs = KeyedJSONModel._meta.get_field('customer_id').deconstruct()
+
+        self.assertEqual(path, 'jsonfield.keys.IntegerKeyField')
+        self.assertEqual(kwargs, {'source': 'json', 'path': 'customer.id', 'null': True, 'db_index': True})
+        self.assertEqual(IntegerKeyField(**kwargs).path, 'customer.id')
+
+    @isolate_apps('tests')
+    def test_check_source(self):
+        class Model(models.Model):
+            json = JSONField()
+            name = models.CharField(max_length=10)
+            key = IntegerKeyField('name', 'id', null=True)
+            other = IntegerKeyField('json', 'id', null=True)
+
+        self.assertEqual(Model._meta.get_field('other').check(), [])
+        self.assertEqual(Model._meta.get_field('key').check(), [
+            checks.Error(
+                "'name' is not a JSON field of 'Model'.",
+                obj=Model._meta.get_field('key'),
+                id='jsonfield.E001',
+            ),
+        ])
@@ -0,0 +1,99 @@
+import datetime
+import warnings
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from jsonfield import metrics
+from jsonfield.fields import JSONField
+
+from .models import JSONModel, JSONNotRequiredModel
+
+
+class Receiver:
+    def __init__(self, signal):
+        self.calls = []
+        signal.connect(self)
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+
+
+class MetricsTests(TestCase):
+    def setUp(self):
+        self.encoded = Receiver(metrics.json_encoded)
+        self.decoded = Receiver(metrics.json_decoded)
+        self.invalid = Receiver(metrics.invalid_json)
+        self.addCleanup(metrics.json_encoded.disconnect, self.encoded)
+        self.addCleanup(metrics.json_decoded.disconnect, self.decoded)
+        self.addCleanup(metrics.invalid_json.disconnect, self.invalid)
+
+    def test_disabled(self):
+        field = JSONModel._meta.get_field('json')
+        JSONModel.objects.create(json={'a': datetime.date(2020, 1, 1)})
+        JSONModel.objects.get()
+
+        self.assertEqual(self.encoded.calls, [])
+        self.assertEqual(self.decoded.calls, [])
+        # The encoder functions are not wrapped.
+        self.assertIs(field._encode, field.backend.get_encoder(**field.dump_kwargs))
+
+    @override_settings(JSONFIELD_METRICS=True)
+    def test_encoded(self):
+        field = JSONModel._meta.get_field('json')
+        field.get_prep_value({'a': datetime.date(2020, 1, 1), 'b': datetime.date(2020, 1, 2)})
+
+        call, = self.encoded.calls
+        self.assertIs(call['sender'], JSONModel)
+        self.assertIs(call['field'], field)
+        self.assertEqual(call['size'], len('{"a": "2020-01-01", "b": "2020-01-02"}'))
+        self.assertGreater(call['duration'], 0)
+        self.assertEqual(call['default_calls'], 2)
+        self.assertGreater(call['default_duration'], 0)
+
+    @override_settings(JSONFIELD_METRICS=True)
+    def test_decoded(self):
+        JSONModel.objects.create(json={'a': 'b'})
+        JSONModel.objects.get()
+
+        calls = [call for call in self.decoded.calls if call['field'].name == 'json']
+        self.assertEqual(len(self.decoded.calls), 4)
+        self.assertIs(calls[0]['sender'], JSONModel)
+        self.assertEqual(calls[0]['size'], len('{"a": "b"}'))
+        self.assertGreater(calls[0]['duration'], 0)
+
+    @override_settings(JSONFIELD_METRICS=True)
+    def test_invalid(self):
+        field = JSONNotRequiredModel._meta.get_field('json')
+
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('always')
+            field.from_db_value('{]', None, None)
+
+        self.assertEqual(self.invalid.calls, [
+            {'signal': metrics.invalid_json, 'sender': JSONNotRequiredModel, 'field': field, 'value': '{]'},
+        ])
+
+    def test_unbound_field(self):
+        with override_settings(JSONFIELD_METRICS=True):
+            JSONField().get_prep_value([1])
+
+        self.assertIsNone(self.encoded.calls[0]['sender'])
+
+    def test_setting_changed(self):
+        field = JSONModel._meta.get_field('json')
+        encode = field._encode
+
+        with override_settings(JSONFIELD_METRICS=True):
+            self.assertIsNot(field._encode, encode)
+        self.assertIs(field._encode, encode)
+
+    @mock.patch.object(metrics, 'enabled', return_value=False)
+    def test_invalid_disabled(self, enabled):
+        field = JSONNotRequiredModel._meta.get_field('json')
+
+        with warnings.catch_warnings(record=True):
+            warnings.simplefilter('always')
+            field.from_db_value('{]', None, None)
+
+        self.assertEqual(self.invalid.calls, [])
@@ -0,0 +1,61 @@
+from django.db import connection
+from django.db.migrations.state import ProjectState
+from django.test import TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+
+from jsonfield.operations import CopyJSONData
+
+from .models import LegacyJSONModel
+
+
+class CopyJSONDataTests(TransactionTestCase):
+    def setUp(self):
+        self.values = [1, 'foobar', {'foo': 'bar'}, None, [1.5, True], {'long': 'x' * 200}]
+        for value in self.values:
+            LegacyJSONModel.objects.create(old_data=value)
+        LegacyJSONModel.objects.create(old_data=None)
+
+    def migrate(self, operation, backwards=False):
+        state = ProjectState.from_apps(LegacyJSONModel._meta.apps)
+        with connection.schema_editor() as editor:
+            if backwards:
+                operation.database_backwards('tests', editor, state, state)
+            else:
+                operation.database_forwards('tests', editor, state, state)
+
+    def test_copy(self):
+        progress = []
+        operation = CopyJSONData('LegacyJSONModel', 'old_data', 'data', chunk_size=2, progress=progress.append)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.migrate(operation)
+
+        objs = LegacyJSONModel.objects.order_by('pk')
+        self.assertEqual([obj.data for obj in objs], [*self.values, None])
+        self.assertEqual(progress, [2, 4, 5])
+
+        # Valid text is copied via SQL, while compressed text is decoded.
+        if connection.features.supports_json_field:
+            updates = [query['sql'] for query in queries if query['sql'].startswith('UPDATE')]
+            self.assertEqual(len(updates), 4)
+
+    def test_resume(self):
+        LegacyJSONModel.objects.filter(old_data=1).update(data={'copied': True})
+        operation = CopyJSONData('LegacyJSONModel', 'old_data', 'data')
+        self.migrate(operation)
+
+        self.assertEqual(LegacyJSONModel.objects.order_by('pk').first().data, {'copied': True})
+
+    def test_backwards(self):
+        self.migrate(CopyJSONData('LegacyJSONModel', 'old_data', 'data'))
+        LegacyJSONModel.objects.update(old_data=None)
+
+        self.migrate(CopyJSONData('LegacyJSONModel', 'old_data', 'data'), backwards=True)
+        self.assertEqual([obj.old_data for obj in LegacyJSONModel.objects.order_by('pk')], [*self.values, None])
+
+    def test_deconstruct(self):
+        operation = CopyJSONData('LegacyJSONModel', 'old_data', 'data', chunk_size=10)
+        self.assertEqual(operation.deconstruct(), (
+            'CopyJSONData', ('LegacyJSONModel', 'old_data', 'data'), {'chunk_size': 10},
+        ))
+        self.assertEqual(operation.describe(), 'Copy JSON data from LegacyJSONModel.old_data to LegacyJSONModel.data')
@@ -0,0 +1,172 @@
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase
+
+from jsonfield import JSONField
+from jsonfield.forms import JSONField as JSONFormField
+from jsonfield.json import FrozenDict
+from jsonfield.schema import SchemaError, compile_schema
+
+
+SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'id': {'type': 'integer', 'minimum': 1},
+        'name': {'type': 'string', 'maxLength': 5},
+        'tags': {'type': 'array', 'items': {'enum': ['a', 'b']}, 'maxItems': 2},
+        'status': {'type': 'string', 'default': 'new'},
+    },
+    'required': ['id'],
+    'additionalProperties': False,
+}
+
+
+class CompileSchemaTests(SimpleTestCase):
+    def assertSchemaError(self, schema, value, path=()):
+        with self.assertRaises(SchemaError) as cm:
+            compile_schema(schema)(value)
+        self.assertEqual(cm.exception.path, path)
+
+    def test_valid(self):
+        validate = compile_schema(SCHEMA)
+        value = {'id': 1, 'name': 'abc', 'tags': ['a']}
+
+        validate(value)
+        self.assertEqual(value, {'id': 1, 'name': 'abc', 'tags': ['a'], 'status': 'new'})
+
+    def test_errors(self):
+        values = [
+            ([], ()),
+            ({}, ()),
+            ({'id': 0}, ('id',)),
+            ({'id': True}, ('id',)),
+            ({'id': 1, 'name': 'abcdef'}, ('name',)),
+            ({'id': 1, 'tags': ['a', 'c']}, ('tags', 1)),
+            ({'id': 1, 'tags': ['a', 'b', 'a']}, ('tags',)),
+            ({'id': 1, 'other': 1}, ('other',)),
+            ({'id': 1, 'status': None}, ('status',)),
+        ]
+        for value, path in values:
+            with self.subTest(value=value):
+                self.assertSchemaError(SCHEMA, value, path)
+
+    def test_keywords(self):
+        valid = [
+            ({'type': ['string', 'null']}, None),
+            ({'type': 'integer'}, 1.0),
+            ({'type': 'number'}, 1),
+            ({'const': [1, {'a': None}]}, [1, {'a': None}]),
+            ({'pattern': '^a'}, 'abc'),
+            ({'pattern': '^a'}, 1),
+            ({'minLength': 2}, 'ab'),
+            ({'minItems': 1}, [1]),
+            ({'maximum': 2, 'exclusiveMinimum': 1}, 2),
+            ({'exclusiveMaximum': 2}, 1.5),
+            ({'anyOf': [{'type': 'string'}, {'type': 'integer'}]}, 1),
+            ({'allOf': [{'type': 'integer'}, {'minimum': 1}]}, 1),
+            ({'additionalProperties': {'type': 'integer'}}, {'a': 1}),
+            (True, {'a': 1}),
+        ]
+        for schema, value in valid:
+            with self.subTest(schema=schema, value=value):
+                compile_schema(schema)(value)
+
+        invalid = [
+            ({'type': 'integer'}, 1.5),
+            ({'type': 'number'}, False),
+            ({'type': 'boolean'}, 0),
+            ({'enum': [1]}, True),
+            ({'const': 1}, 2),
+            ({'pattern': '^a'}, 'b'),
+            ({'minLength': 2}, 'a'),
+            ({'minItems': 1}, []),
+            ({'maximum': 2}, 3),
+            ({'exclusiveMinimum': 1}, 1),
+            ({'exclusiveMaximum': 2}, 2),
+            ({'anyOf': [{'type': 'string'}, {'type': 'integer'}]}, None),
+            ({'allOf': [{'type': 'integer'}, {'minimum': 1}]}, 0),
+            ({'items': {'items': {'type': 'string'}}}, [[], ['a', 1]]),
+            (False, 1),
+        ]
+        for schema, value in invalid:
+            with self.subTest(schema=schema, value=value):
+                with self.assertRaises(SchemaError):
+                    compile_schema(schema)(value)
+
+    def test_pointer(self):
+        self.assertSchemaError({'items': {'items': {'type': 'string'}}}, [[], ['a', 1]], (1, 1))
+        self.assertEqual(SchemaError('', ('a/b', 0, '~')).pointer, '/a~1b/0/~0')
+
+    def test_invalid_defaults(self):
+        # Defaults are only filled in once the entire schema matches.
+        value = {'id': 0}
+        with self.assertRaises(SchemaError):
+            compile_schema(SCHEMA)(value)
+        self.assertEqual(value, {'id': 0})
+
+        schema = {'anyOf': [
+            {'properties': {'a': {'default': 1}}, 'required': ['b']},
+            {'properties': {'c': {'default': 2}}},
+        ]}
+        value = {}
+        compile_schema(schema)(value)
+        self.assertEqual(value, {'c': 2})
+
+    def test_nested_defaults(self):
+        schema = {'properties': {'a': {'default': {}, 'properties': {'b': {'default': 1}}}}}
+        value = {}
+        compile_schema(schema)(value)
+        self.assertEqual(value, {'a': {'b': 1}})
+
+        with self.assertRaises(SchemaError):
+            compile_schema({'properties': {'a': {'type': 'string', 'default': 1}}})({})
+
+    def test_frozen_defaults(self):
+        value = FrozenDict({'id': 1})
+        compile_schema(SCHEMA)(value)
+
+        self.assertEqual(value, {'id': 1})
+
+    def test_unsupported(self):
+        with self.assertRaisesMessage(ValueError, 'Unsupported schema keywords: $ref, oneOf.'):
+            compile_schema({'$ref': '#/a', 'oneOf': [], 'title': 'ignored'})
+
+        with self.assertRaisesMessage(ValueError, "Unknown schema type: 'str'"):
+            compile_schema({'type': 'str'})
+
+    def test_cached(self):
+        validate = compile_schema({'type': 'string', 'title': 'a'})
+        self.assertIs(compile_schema({'title': 'a', 'type': 'string'}), validate)
+
+
+class FieldSchemaTests(TestCase):
+    def test_model_field(self):
+        field = JSONField(schema=SCHEMA)
+
+        field.clean('{"id": 1}', None)
+        with self.assertRaisesMessage(ValidationError, "Value does not match the schema at '/tags/1'"):
+            field.clean('{"id": 1, "tags": ["a", "c"]}', None)
+
+    def test_model_field_null(self):
+        JSONField(schema=SCHEMA, null=True, blank=True).validate(None, None)
+
+        with self.assertRaises(ValidationError):
+            JSONField(schema=SCHEMA).validate(None, None)
+
+    def test_deconstruct(self):
+        _, _, _, kwargs = JSONField(schema={'type': 'object'}).deconstruct()
+
+        self.assertEqual(kwargs['schema'], {'type': 'object'})
+
+    def test_form_field(self):
+        field = JSONFormField(schema=SCHEMA, required=False)
+
+        self.assertEqual(field.clean('{"id": 1}'), {'id': 1, 'status': 'new'})
+        self.assertIsNone(field.clean(''))
+        with self.assertRaises(ValidationError) as cm:
+            field.clean('{"id": "1"}')
+        self.assertEqual(cm.exception.code, 'schema')
+        self.assertEqual(cm.exception.params['path'], '/id')
+
+    def test_model_formfield(self):
+        # The schema is validated by the model, instead of the form field.
+        self.assertIsNone(JSONField(schema=SCHEMA).formfield().schema_validator)
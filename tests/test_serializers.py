@@ -0,0 +1,92 @@
+import json
+
+from django.core import serializers
+from django.core.serializers.base import DeserializationError
+from django.db import connection
+from django.test import TestCase
+
+from jsonfield import serializers as json_serializers
+from jsonfield.json import RawJSON
+
+from .models import BinaryJSONModel, CompressedJSONModel, JSONModel, LazyJSONModel
+
+
+class SerializerTests(TestCase):
+    def serialize(self, queryset, **options):
+        return json_serializers.Serializer().serialize(queryset, **options)
+
+    def deserialize(self, data):
+        return [obj.object for obj in json_serializers.Deserializer(data)]
+
+    def test_nested(self):
+        JSONModel.objects.create(json={'a': [1, 2.5, None, True]}, default_json=[])
+        data = json.loads(self.serialize(JSONModel.objects.all()))
+
+        self.assertEqual(data[0]['fields']['json'], {'a': [1, 2.5, None, True]})
+        self.assertEqual(data[0]['fields']['default_json'], [])
+
+        obj, = self.deserialize(json.dumps(data))
+        self.assertEqual(obj.json, {'a': [1, 2.5, None, True]})
+
+    def test_strings(self):
+        # Strings are embedded as encoded text, as with the standard serializer.
+        JSONModel.objects.create(json='foo', default_json='{"a": 1}')
+        data = self.serialize(JSONModel.objects.all())
+        self.assertEqual(json.loads(data)[0]['fields']['json'], '"foo"')
+
+        obj, = self.deserialize(data)
+        self.assertEqual(obj.json, 'foo')
+        self.assertEqual(obj.default_json, '{"a": 1}')
+
+    def test_compatibility(self):
+        # Output of either serializer may be loaded by the other.
+        JSONModel.objects.create(json={'a': 'b'})
+
+        obj, = self.deserialize(serializers.serialize('json', JSONModel.objects.all()))
+        self.assertEqual(obj.json, {'a': 'b'})
+
+        obj, = serializers.deserialize('json', self.serialize(JSONModel.objects.all()))
+        self.assertEqual(obj.object.json, {'a': 'b'})
+
+    def test_indent(self):
+        JSONModel.objects.create(json={'a': 'b'})
+        data = self.serialize(JSONModel.objects.all(), indent=2)
+        self.assertEqual(self.deserialize(data)[0].json, {'a': 'b'})
+
+    def test_lazy(self):
+        LazyJSONModel.objects.create(json={'a': 1})
+        obj = LazyJSONModel.objects.get()
+        data = self.serialize([obj])
+
+        # The value is embedded without being decoded.
+        self.assertIsInstance(obj.__dict__['json'], RawJSON)
+        self.assertEqual(self.deserialize(data)[0].json, {'a': 1})
+
+    def test_lazy_invalid(self):
+        LazyJSONModel.objects.create(json={'a': 1})
+        with connection.cursor() as cursor:
+            cursor.execute("UPDATE tests_lazyjsonmodel SET json = 'not json'")
+        obj = LazyJSONModel.objects.get()
+
+        # Invalid text is serialized as the string it's read as.
+        with self.assertWarns(RuntimeWarning):
+            data = self.serialize([obj])
+        self.assertEqual(json.loads(data)[0]['fields']['json'], '"not json"')
+        self.assertEqual(self.deserialize(data)[0].json, 'not json')
+
+    def test_compressed(self):
+        CompressedJSONModel.objects.create(json={'a': 'x' * 200})
+        data = self.serialize(CompressedJSONModel.objects.all())
+        self.assertEqual(json.loads(data)[0]['fields']['json'], {'a': 'x' * 200})
+
+    def test_binary(self):
+        BinaryJSONModel.objects.create(json={'a': 1})
+        data = self.serialize(BinaryJSONModel.objects.all())
+        self.assertEqual(json.loads(data)[0]['fields']['json'], {'a': 1})
+        self.assertEqual(self.deserialize(data)[0].json, {'a': 1})
+
+    def test_invalid(self):
+        with self.assertRaises(DeserializationError):
+            self.deserialize('{"model": "tests.jsonmodel"}')
+        with self.assertRaises(DeserializationError):
+            self.deserialize('[{"model": "tests.jsonmodel"')
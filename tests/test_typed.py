@@ -0,0 +1,193 @@
+import dataclasses
+import datetime
+import decimal
+import json
+import uuid
+from typing import Dict, Optional
+from unittest import mock, skipUnless
+
+from django.core import serializers
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from jsonfield import JSONField
+from jsonfield.encoder import JSONEncoder
+from jsonfield.functions import JSONExtract
+from jsonfield.typed import get_converter
+
+from .models import Item, Order, TypedJSONModel
+
+
+try:
+    import attr
+except ImportError:
+    attr = None
+
+
+@dataclasses.dataclass
+class Scalars:
+    when: datetime.date
+    amount: decimal.Decimal
+    key: uuid.UUID
+    extra: Dict[str, Optional[Item]] = dataclasses.field(default_factory=dict)
+    computed: int = dataclasses.field(default=0, init=False)
+
+
+class ConverterTests(SimpleTestCase):
+    def test_roundtrip(self):
+        converter = get_converter(Order)
+        data = {
+            'id': 1,
+            'placed': '2020-01-02T03:04:05Z',
+            'items': [{'sku': 'a', 'quantity': 2}, {'sku': 'b'}],
+        }
+
+        order = converter.load(data)
+        self.assertEqual(order, Order(
+            id=1,
+            placed=datetime.datetime(2020, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+            items=[Item('a', 2), Item('b', 1)],
+        ))
+        self.assertEqual(converter.dump(order), {
+            'id': 1,
+            'placed': '2020-01-02T03:04:05Z',
+            'items': [{'sku': 'a', 'quantity': 2}, {'sku': 'b', 'quantity': 1}],
+            'note': None,
+        })
+
+    def test_defaults(self):
+        converter = get_converter(Order)
+        first, second = (converter.load({'id': 1, 'placed': '2020-01-02'}) for _ in range(2))
+        self.assertEqual(first.items, [])
+        self.assertIsNone(first.note)
+        self.assertIsNot(first.items, second.items)
+
+    def test_scalars(self):
+        converter = get_converter(Scalars)
+        key = uuid.uuid4()
+        value = converter.load({
+            'when': '2020-01-02', 'amount': 1.5, 'key': str(key), 'extra': {'a': {'sku': 'a'}, 'b': None},
+        })
+        self.assertEqual(value, Scalars(datetime.date(2020, 1, 2), decimal.Decimal('1.5'), key, {
+            'a': Item('a'), 'b': None,
+        }))
+
+        # Fields that aren't init arguments are omitted.
+        self.assertNotIn('computed', converter.dump(value))
+        self.assertEqual(converter.load(converter.dump(value)), value)
+
+    def test_missing_key(self):
+        with self.assertRaises(KeyError):
+            get_converter(Order).load({'id': 1})
+
+    def test_unsupported_class(self):
+        with self.assertRaises(TypeError):
+            get_converter(dict)
+
+    def test_registered_encoder(self):
+        # Instances are also supported by `JSONEncoder`, e.g. for forms.
+        self.assertEqual(
+            json.loads(json.dumps([Item('a')], cls=JSONEncoder)),
+            [{'sku': 'a', 'quantity': 1}],
+        )
+
+    @skipUnless(attr, 'attrs is not installed')
+    def test_attrs(self):
+        @attr.s(slots=True, auto_attribs=True)
+        class Point:
+            x: int
+            _label: str = 'origin'
+            tags: list = attr.Factory(list)
+
+        converter = get_converter(Point)
+        point = converter.load({'x': 1, '_label': 'a'})
+        self.assertEqual(point, Point(1, 'a'))
+        self.assertEqual(converter.dump(point), {'x': 1, '_label': 'a', 'tags': []})
+
+
+class TypedFieldTests(TestCase):
+    def order(self):
+        return Order(1, datetime.datetime(2020, 1, 2, tzinfo=datetime.timezone.utc), [Item('a')])
+
+    def test_roundtrip(self):
+        TypedJSONModel.objects.create(json=self.order())
+        obj = TypedJSONModel.objects.get()
+        self.assertEqual(obj.json, self.order())
+
+        # Cached values aren't shared.
+        obj.json.items.append(Item('b'))
+        self.assertEqual(TypedJSONModel.objects.get().json, self.order())
+
+    def test_dict(self):
+        obj = TypedJSONModel.objects.create(json={'id': 1, 'placed': '2020-01-02T00:00:00Z'})
+        obj.full_clean()
+        self.assertEqual(obj.json, Order(1, datetime.datetime(2020, 1, 2, tzinfo=datetime.timezone.utc)))
+
+        obj = TypedJSONModel.objects.get()
+        self.assertEqual(obj.json, Order(1, datetime.datetime(2020, 1, 2, tzinfo=datetime.timezone.utc)))
+
+    def test_null(self):
+        TypedJSONModel.objects.create(json=None)
+        self.assertIsNone(TypedJSONModel.objects.get().json)
+
+    def test_invalid(self):
+        field = TypedJSONModel._meta.get_field('json')
+        with self.assertRaisesMessage(ValidationError, 'Enter a valid Order value.'):
+            field.to_python('{"id": 1}')
+
+    def test_bulk(self):
+        TypedJSONModel.objects.bulk_create([TypedJSONModel(json=self.order()) for _ in range(2)])
+        field = TypedJSONModel._meta.get_field('json')
+        values = field.load_many(field.prep_many([self.order(), None]))
+        self.assertEqual(values, [self.order(), None])
+
+    def test_json_only(self):
+        # Extracted values are plain JSON, as fragments aren't converted.
+        TypedJSONModel.objects.create(json=self.order())
+        paths = ['items.0', 'id', 'note']
+
+        expected = {'items.0': {'sku': 'a', 'quantity': 1}, 'id': 1, 'note': None}
+        self.assertEqual(TypedJSONModel.objects.json_only('json', paths).get().json, expected)
+        with mock.patch.object(JSONExtract, 'supports', return_value=False):
+            self.assertEqual(TypedJSONModel.objects.json_only('json', paths).get().json, expected)
+
+    def test_invalid_db_value(self):
+        # Objects that don't fit the class are loaded as dicts, and fail when cleaned.
+        TypedJSONModel.objects.create(json=self.order())
+        with connection.cursor() as cursor:
+            cursor.execute('UPDATE tests_typedjsonmodel SET json = %s', ['{"a": 1}'])
+
+        with self.assertWarnsRegex(RuntimeWarning, 'failed to load Order'):
+            obj, = TypedJSONModel.objects.all()
+        self.assertEqual(obj.json, {'a': 1})
+        with self.assertRaises(ValidationError):
+            obj.full_clean()
+
+        field = TypedJSONModel._meta.get_field('json')
+        with self.assertWarns(RuntimeWarning):
+            self.assertEqual(field.load_many(['{"a": 1}']), [{'a': 1}])
+
+    def test_json_set(self):
+        TypedJSONModel.objects.create(json=self.order())
+
+        TypedJSONModel.objects.json_set('json', 'note', 'x')
+        self.assertEqual(TypedJSONModel.objects.get().json.note, 'x')
+
+        with self.assertRaises(ValidationError):
+            TypedJSONModel.objects.json_patch('json', [{'op': 'remove', 'path': '/id'}])
+        self.assertEqual(TypedJSONModel.objects.get().json.id, 1)
+
+    def test_serialization(self):
+        TypedJSONModel.objects.create(json=self.order())
+        data = serializers.serialize('json', TypedJSONModel.objects.all())
+        obj, = serializers.deserialize('json', data)
+        self.assertEqual(obj.object.json, self.order())
+
+    def test_frozen(self):
+        with self.assertRaises(ValueError):
+            JSONField(schema_class=Order, frozen=True)
+
+    def test_deconstruct(self):
+        field = TypedJSONModel._meta.get_field('json')
+        self.assertIs(field.deconstruct()[3]['schema_class'], Order)